@@ -38,6 +38,7 @@ def __getattr__(name: str):
     elif name in (
         "BlockAPI",
         "ProviderAPI",
+        "RequestBatch",
         "SubprocessProvider",
         "TestProviderAPI",
         "UpstreamProvider",
@@ -103,6 +104,7 @@ __all__ = [
     "QueryAPI",
     "QueryType",
     "ReceiptAPI",
+    "RequestBatch",
     "SubprocessProvider",
     "TestAccountAPI",
     "TestAccountContainerAPI",
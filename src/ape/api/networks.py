@@ -1,6 +1,7 @@
 import copy
 from abc import abstractmethod
-from collections.abc import Collection, Iterator, Sequence
+from collections.abc import Collection, Iterable, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from functools import cached_property, partial
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, ClassVar
@@ -476,6 +477,26 @@ class EcosystemAPI(ExtraAttributesMixin, BaseInterfaceModel):
             Iterator[:class:`~ape.types.ContractLog`]
         """
 
+    def decode_logs_columnar(self, logs: Sequence[dict], event: "EventABI") -> dict[str, list]:
+        """
+        Decode many logs of a single event into columns, without creating a
+        :class:`~ape.types.ContractLog` per log. Useful for building data-frames
+        of large amounts of events. Logs of other events are skipped.
+
+        Args:
+            logs (Sequence[dict]): A list of raw log data from the chain.
+            event (EventABI): The event to decode.
+
+        Returns:
+            dict[str, list]: The columns ``block_number``, ``block_hash``,
+            ``transaction_hash``, ``transaction_index``, ``log_index``, and
+            ``contract_address``, followed by a column per event argument.
+        """
+        # NOTE: Ecosystems should override with a faster implementation.
+        from ape.types.events import _logs_to_columns
+
+        return _logs_to_columns(self.decode_logs(logs, event), event)
+
     @raises_not_implemented
     def decode_primitive_value(  # type: ignore[empty-body]
         self, value: Any, output_type: str | tuple | list
@@ -640,6 +661,30 @@ class EcosystemAPI(ExtraAttributesMixin, BaseInterfaceModel):
         """
         return None
 
+    def get_proxy_infos(
+        self, addresses: Iterable[AddressType], concurrency: int | None = None
+    ) -> dict[AddressType, ProxyInfoAPI | None]:
+        """
+        Get the proxy information of many contracts concurrently.
+
+        Args:
+            addresses (Iterable[:class:`~ape.types.address.AddressType`]): The addresses
+              of the contracts.
+            concurrency (int | None): The number of threads to use. Defaults to the
+              provider's ``concurrency``.
+
+        Returns:
+            dict[AddressType, ProxyInfoAPI | None]: The proxy info by address, with
+            ``None`` for contracts that do not use any known proxy pattern.
+        """
+        address_list = list(addresses)
+        if not address_list:
+            return {}
+
+        max_workers = concurrency or min(len(address_list), self.provider.concurrency) or 1
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            return dict(zip(address_list, pool.map(self.get_proxy_info, address_list)))
+
     def get_method_selector(self, abi: "MethodABI") -> HexBytes:
         """
         Get a contract method selector, typically via hashing such as ``keccak``.
@@ -268,6 +268,8 @@ class ProviderAPI(BaseInterfaceModel):
     """
     The amount of blocks to fetch in a response, as a default.
     This is particularly useful for querying logs across a block range.
+    Web3 providers start ``eth_getLogs`` paging at this size and adapt
+    it to the node's limits.
     """
 
     concurrency: int = 4
@@ -275,6 +277,18 @@ class ProviderAPI(BaseInterfaceModel):
     How many parallel threads to use when fetching logs.
     """
 
+    max_batch_size: int = 100
+    """
+    The maximum amount of requests to send in a single JSON-RPC batch
+    when using :meth:`~ape.api.providers.ProviderAPI.make_requests`.
+    """
+
+    block_cache_size: int = 1024
+    """
+    The maximum amount of blocks to keep in memory, for providers
+    that cache blocks.
+    """
+
     @property
     def data_folder(self) -> Path:
         """
@@ -441,6 +455,40 @@ class ProviderAPI(BaseInterfaceModel):
             :class:`~ape.types.ContractCode`: The contract bytecode.
         """
 
+    def get_codes(
+        self,
+        addresses: Iterable["AddressType"],
+        block_id: "BlockID | None" = None,
+        raise_on_error: bool = True,
+    ) -> list["ContractCode | Exception"]:
+        """
+        Get the bytes of many contracts. Providers that support batching requests
+        override this to get the code in as few round-trips as possible.
+
+        Args:
+            addresses (Iterable[:class:`~ape.types.address.AddressType`]): The addresses
+              of the contracts.
+            block_id ("BlockID | None"): The block ID
+              for checking previous code.
+            raise_on_error (bool): Set to ``False`` to place errors in the
+              results instead of raising the first one. Defaults to ``True``.
+
+        Returns:
+            list[:class:`~ape.types.ContractCode`]: The bytecode, in the same order
+            as the given addresses.
+        """
+        codes: list[ContractCode | Exception] = []
+        for address in addresses:
+            try:
+                codes.append(self.get_code(address, block_id=block_id))
+            except Exception as err:
+                if raise_on_error:
+                    raise
+
+                codes.append(err)
+
+        return codes
+
     @property
     def network_choice(self) -> str:
         """
@@ -464,6 +512,68 @@ class ProviderAPI(BaseInterfaceModel):
         class-serializations.
         """
 
+    def make_requests(
+        self, requests: Iterable[tuple[str, Iterable | None]], raise_on_error: bool = True
+    ) -> list[Any]:
+        """
+        Make many raw RPC requests. Providers that support JSON-RPC batching
+        send the requests in as few round-trips as possible (see
+        :attr:`~ape.api.providers.ProviderAPI.max_batch_size`). By default,
+        the requests are made one at a time.
+
+        Usage example::
+
+            balance, nonce = provider.make_requests(
+                [
+                    ("eth_getBalance", [address, "latest"]),
+                    ("eth_getTransactionCount", [address, "latest"]),
+                ]
+            )
+
+        Args:
+            requests (Iterable[tuple[str, Iterable | None]]): Pairs of RPC
+              methods and their parameters.
+            raise_on_error (bool): Set to ``False`` to place errors in the
+              results instead of raising the first one. Defaults to ``True``.
+
+        Returns:
+            list: The result of each request, in the same order as requested.
+        """
+        results: list[Any] = []
+        for rpc, parameters in requests:
+            try:
+                results.append(self.make_request(rpc, parameters))
+            except Exception as err:
+                if raise_on_error:
+                    raise
+
+                results.append(err)
+
+        return results
+
+    def batch_requests(self) -> "RequestBatch":
+        """
+        Queue raw RPC requests and send them all together, using
+        :meth:`~ape.api.providers.ProviderAPI.make_requests`, when
+        exiting the context.
+
+        Usage example::
+
+            with provider.batch_requests() as batch:
+                balance = batch.make_request("eth_getBalance", [address, "latest"])
+                nonce = batch.make_request("eth_getTransactionCount", [address, "latest"])
+
+            print(balance.result(), nonce.result())
+
+        **NOTE**: Only requests made using the batch's ``make_request()`` are
+        queued. Other requests made inside the context, including
+        :meth:`~ape.api.providers.ProviderAPI.make_request`, are sent right away.
+
+        Returns:
+            :class:`~ape.api.providers.RequestBatch`
+        """
+        return RequestBatch(self)
+
     @raises_not_implemented
     def stream_request(  # type: ignore[empty-body]
         self, method: str, params: Iterable, iter_path: str = "result.item"
@@ -505,6 +615,24 @@ class ProviderAPI(BaseInterfaceModel):
             HexBytes: The value of the storage slot.
         """
 
+    def get_storages(
+        self, slots: Iterable[tuple["AddressType", int]], block_id: "BlockID | None" = None
+    ) -> list[HexBytes]:
+        """
+        Get the raw values of many storage slots. Providers that support batching
+        requests override this to get the values in as few round-trips as possible.
+
+        Args:
+            slots (Iterable[tuple[AddressType, int]]): Pairs of contract addresses
+              and the storage slots to read.
+            block_id ("BlockID | None"): The block ID
+              for checking previous storage values.
+
+        Returns:
+            list[HexBytes]: The values, in the same order as the given slots.
+        """
+        return [self.get_storage(address, slot, block_id=block_id) for address, slot in slots]
+
     @abstractmethod
     def get_nonce(self, address: "AddressType", block_id: "BlockID | None" = None) -> int:
         """
@@ -609,6 +737,24 @@ class ProviderAPI(BaseInterfaceModel):
             :class:`~ape.types.BlockID`: The block for the given ID.
         """
 
+    def get_blocks(self, block_ids: Iterable["BlockID"]) -> list[BlockAPI]:
+        """
+        Get many blocks. Providers that support batching requests
+        override this to get the blocks in as few round-trips as possible.
+
+        Args:
+            block_ids (Iterable[:class:`~ape.types.BlockID`]): The IDs of the blocks to get.
+
+        Raises:
+            :class:`~ape.exceptions.BlockNotFoundError`: Likely the exception raised when
+              any of the blocks are not found (depends on implementation).
+
+        Returns:
+            list[:class:`~ape.api.providers.BlockAPI`]: The blocks, in the same order
+            as the given IDs.
+        """
+        return [self.get_block(block_id) for block_id in block_ids]
+
     # TODO: In 0.9, change the return value to be `CallResult`
     #    (right now it does only when using raise_on_revert=False and it reverts).
     @abstractmethod
@@ -708,6 +854,25 @@ class ProviderAPI(BaseInterfaceModel):
             Iterator[:class:`~ape.types.ContractLog`]
         """
 
+    def get_contract_log_columns(self, log_filter: "LogFilter") -> dict[str, list]:
+        """
+        Get the logs of a single event in columnar form
+        (see :meth:`~ape.api.networks.EcosystemAPI.decode_logs_columnar`).
+
+        Args:
+            log_filter (:class:`~ape.types.LogFilter`): The filter, with exactly one event.
+
+        Returns:
+            dict[str, list]: The log columns.
+        """
+        if len(log_filter.events) != 1:
+            raise ValueError("Expecting exactly one event.")
+
+        # NOTE: Providers should override to decode the raw logs in columnar form directly.
+        from ape.types.events import _logs_to_columns
+
+        return _logs_to_columns(self.get_contract_logs(log_filter), log_filter.events[0])
+
     def send_private_transaction(self, txn: TransactionAPI, **kwargs) -> ReceiptAPI:
         """
         Send a transaction through a private mempool (if supported by the Provider).
@@ -983,6 +1148,110 @@ class ProviderAPI(BaseInterfaceModel):
         return headers
 
 
+class BatchedRequest:
+    """
+    The pending result of a request queued in a
+    :class:`~ape.api.providers.RequestBatch`.
+    """
+
+    def __init__(self, batch: "RequestBatch", rpc: str, parameters: Iterable | None = None):
+        self.rpc = rpc
+        self.parameters = parameters
+        self._batch = batch
+        self._done = False
+        self._value: Any = None
+        self._error: Exception | None = None
+
+    @log_instead_of_fail(default="<BatchedRequest>")
+    def __repr__(self) -> str:
+        return f"<BatchedRequest {self.rpc} done={self._done}>"
+
+    @property
+    def done(self) -> bool:
+        """
+        ``True`` when the batch containing this request has been sent.
+        """
+        return self._done
+
+    def result(self) -> Any:
+        """
+        Get the result of the request. Sends the batch if it was not sent yet.
+
+        Raises:
+            :class:`~ape.exceptions.ProviderError`: When the request failed.
+
+        Returns:
+            Any: The RPC result.
+        """
+        if not self._done:
+            self._batch.flush()
+
+        if self._error is not None:
+            raise self._error
+
+        return self._value
+
+    def _set_result(self, value: Any):
+        if isinstance(value, Exception):
+            self._error = value
+        else:
+            self._value = value
+
+        self._done = True
+
+
+class RequestBatch:
+    """
+    A queue of raw RPC requests that are sent together, as JSON-RPC batches
+    when the provider supports it. Use
+    :meth:`~ape.api.providers.ProviderAPI.batch_requests` to create one.
+    """
+
+    def __init__(self, provider: ProviderAPI):
+        self.provider = provider
+        self._queue: list[BatchedRequest] = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            self.flush()
+
+    def __len__(self) -> int:
+        return len(self._queue)
+
+    def make_request(self, rpc: str, parameters: Iterable | None = None) -> BatchedRequest:
+        """
+        Queue a raw RPC request.
+
+        Args:
+            rpc (str): The RPC method to call.
+            parameters (Iterable | None): Parameters for the method.
+
+        Returns:
+            :class:`~ape.api.providers.BatchedRequest`: The pending result.
+        """
+        request = BatchedRequest(self, rpc, parameters=parameters)
+        self._queue.append(request)
+        return request
+
+    def flush(self):
+        """
+        Send all the queued requests.
+        """
+        if not self._queue:
+            return
+
+        queue = self._queue
+        self._queue = []
+        results = self.provider.make_requests(
+            [(r.rpc, r.parameters) for r in queue], raise_on_error=False
+        )
+        for request, value in zip(queue, results):
+            request._set_result(value)
+
+
 class TestProviderAPI(ProviderAPI):
     """
     An API for providers that have development functionality, such as snapshotting.
@@ -1,6 +1,7 @@
 from abc import abstractmethod
-from collections.abc import Iterator, Sequence
+from collections.abc import Iterable, Iterator, Sequence
 from functools import cache, cached_property
+from itertools import islice
 from typing import Any, TypeAlias
 
 from ethpm_types.abi import EventABI, MethodABI
@@ -84,6 +85,32 @@ def extract_fields(item: BaseInterfaceModel, columns: Sequence[str]) -> list[Any
     return [getattr(item, col, None) for col in columns]
 
 
+def extract_columns(items: Iterable[BaseInterfaceModel], columns: Sequence[str]) -> dict[str, list]:
+    data: dict[str, list] = {col: [] for col in columns}
+    for item in items:
+        for col in columns:
+            data[col].append(getattr(item, col, None))
+
+    return data
+
+
+def iter_column_batches(
+    items: Iterable[BaseInterfaceModel], columns: Sequence[str], batch_size: int
+) -> Iterator[dict[str, list]]:
+    items = iter(items)
+    while batch := list(islice(items, batch_size)):
+        yield extract_columns(batch, columns)
+
+
+def concat_columns(batches: Iterable[dict[str, list]], columns: Sequence[str]) -> dict[str, list]:
+    data: dict[str, list] = {col: [] for col in columns}
+    for batch in batches:
+        for col in columns:
+            data[col].extend(batch[col])
+
+    return data
+
+
 class _BaseQuery(BaseModel):
     columns: Sequence[str]
 
@@ -234,6 +261,8 @@ class ContractMethodQuery(_BaseBlockQuery):
     """
     A ``QueryType`` that collects return values from calling ``method`` in ``contract``
     over a range of blocks between ``start_block`` and ``stop_block``.
+    The ``method_args`` are keyed by input name, or by the stringified index
+    for inputs without a name.
     """
 
     contract: AddressType
@@ -241,6 +270,23 @@ class ContractMethodQuery(_BaseBlockQuery):
     method_args: dict[str, Any]
 
 
+class ContractMethodResult(BaseInterfaceModel):
+    """
+    The return value of a contract method at a block,
+    the result of a :class:`~ape.api.query.ContractMethodQuery`.
+    """
+
+    block_number: int
+    """
+    The number of the block the method was called at.
+    """
+
+    value: Any
+    """
+    The decoded return value.
+    """
+
+
 QueryType: TypeAlias = (
     BlockQuery
     | BlockTransactionQuery
@@ -252,6 +298,9 @@ QueryType: TypeAlias = (
 
 
 class QueryAPI(BaseInterface):
+    # The max number of results in each batch of columns
+    column_batch_size = 1000
+
     @abstractmethod
     def estimate_query(self, query: QueryType) -> int | None:
         """
@@ -279,6 +328,36 @@ class QueryAPI(BaseInterface):
             Iterator
         """
 
+    def perform_columnar_query(self, query: QueryType) -> Iterator[dict[str, list]]:
+        """
+        Executes the query, returning the results as batches of columns, mapping
+        each of the query's columns to a list of values. Defaults to transposing
+        the results of :meth:`~ape.api.query.QueryAPI.perform_query`. Override to
+        produce columns without creating an object per result, such as when the
+        results come from a database.
+
+        Args:
+            query (``QueryType``): query to execute
+
+        Returns:
+            Iterator[dict[str, list]]
+        """
+        return iter_column_batches(self.perform_query(query), query.columns, self.column_batch_size)
+
+    def can_cache(self, query: QueryType) -> bool:
+        """
+        Whether :meth:`~ape.api.query.QueryAPI.update_cache` would store
+        the results of the query. Defaults to whether ``update_cache``
+        is implemented.
+
+        Args:
+            query (``QueryType``): query that is about to be executed
+
+        Returns:
+            bool
+        """
+        return type(self).update_cache is not QueryAPI.update_cache
+
     def update_cache(self, query: QueryType, result: Iterator[BaseInterfaceModel]):
         """
         Allows a query plugin the chance to update any cache using the results obtained
@@ -1,10 +1,11 @@
 import difflib
 import types
-from collections.abc import Callable, Iterator
-from functools import cached_property, partial, singledispatchmethod
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from contextvars import ContextVar
+from functools import cache, cached_property, singledispatchmethod
 from itertools import islice
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, TypeVar
 
 import click
 from eth_abi.exceptions import EncodingError
@@ -17,7 +18,8 @@ from ape.api.address import Address, BaseAddress
 from ape.api.query import (
     ContractCreation,
     ContractEventQuery,
-    extract_fields,
+    ContractMethodQuery,
+    concat_columns,
     validate_and_expand_columns,
 )
 from ape.exceptions import (
@@ -34,7 +36,7 @@ from ape.exceptions import (
     MissingStructFieldError,
 )
 from ape.logging import get_rich_console, logger
-from ape.types.events import ContractLog, LogFilter, MockContractLog
+from ape.types.events import LOG_COLUMNS, ContractLog, LogFilter, MockContractLog
 from ape.utils.abi import StructParser, _enrich_natspec, encode_topics, is_array
 from ape.utils.basemodel import (
     BaseInterfaceModel,
@@ -45,7 +47,7 @@ from ape.utils.basemodel import (
     get_attribute_with_extras,
     only_raise_attribute_error,
 )
-from ape.utils.misc import log_instead_of_fail
+from ape.utils.misc import LRUCache, log_instead_of_fail
 
 if TYPE_CHECKING:
     from ethpm_types.abi import ConstructorABI, ErrorABI, MethodABI
@@ -57,6 +59,8 @@ if TYPE_CHECKING:
     from ape.api.transactions import ReceiptAPI, TransactionAPI
     from ape.types.address import AddressType
 
+_T = TypeVar("_T")  # _LazyHandlers generic.
+
 
 class ContractConstructor(ManagerAccessMixin):
     def __init__(
@@ -234,29 +238,89 @@ class ContractMethodHandler(ManagerAccessMixin):
         return "\n\n".join(numeric_infos)
 
     def _can_encode(self, abi: "MethodABI", args: tuple | list) -> bool:
+        return self._probe(abi, args) is not None
+
+    def _probe(self, abi: "MethodABI", args: tuple | list) -> tuple[list, HexBytes] | None:
         # Probe whether args encode against this overload's input types. Used only to pick
         # among same-arity overloads; encoding is pure (no network). Only a conversion or
         # encoding failure means the args do not fit this overload. Anything else is a real
         # error and propagates, so a bug in conversion is not silently read as a no-match.
+        # When they fit, the converted args and the calldata are returned for re-use.
+        ecosystem = self.provider.network.ecosystem
         try:
             arguments = self.conversion_manager.convert_method_args(abi, args)
-            self.provider.network.ecosystem.encode_calldata(abi, *arguments)
+            encoded_calldata = ecosystem.encode_calldata(abi, *arguments)
         except (ConversionError, MissingStructFieldError, EncodingError) as err:
             logger.debug(
                 f"Overload '{abi.selector}' does not accept the given arguments "
                 f"({type(err).__name__}: {err})."
             )
-            return False
+            return None
+
+        return arguments, HexBytes(ecosystem.get_method_selector(abi) + encoded_calldata)
+
+    def _resolve(self, args: tuple | list) -> tuple["MethodABI", list, HexBytes | None]:
+        """
+        Pick the overload to call for ``args`` and convert the args for it.
+
+        Selection rules, in order:
+
+        1. Only overloads whose input count matches ``len(args)`` are candidates. No candidate
+           raises :class:`~ape.exceptions.ArgumentsLengthError`.
+        2. With more than one candidate, the first candidate (in ABI declaration order) whose
+           input types the args encode to wins. This is a behavior change: selection used to
+           be by count alone, so an ambiguous overload set resolved to the last declared one
+           regardless of the argument types (#2670). Encoding is pure, so the probe costs no
+           network calls.
+        3. Otherwise (a single candidate, or no candidate the args fit) the last matching
+           overload wins, which is the prior behavior.
 
-        return True
+        When several overloads all accept the same args, e.g. ``1`` against both ``uint256``
+        and ``int256``, rule 2 falls back on ABI declaration order. That is deterministic but
+        arbitrary, since the ABI itself does not say which one the caller meant.
+
+        The winner of rule 2 is remembered per argument key (see ``_get_args_key()``)
+        and probed first next time, so repeated calls usually encode once. Args with the
+        same key fit the same overloads, so this does not change which overload wins.
+
+        Returns:
+            tuple[MethodABI, list, HexBytes | None]: The overload, the converted args,
+            and the calldata when it was encoded while probing.
+        """
+        args = args or []
+        matching_abis = [abi for abi in self.abis if len(abi.inputs or []) == len(args)]
+        if not matching_abis:
+            raise ArgumentsLengthError(len(args), inputs=self.abis)
+
+        if len(matching_abis) > 1:
+            args_key = _get_args_key(args)
+            key = (tuple(abi.selector for abi in matching_abis), args_key)
+            order: list[int] = list(range(len(matching_abis)))
+            if args_key is not None and (cached := _overload_cache.get(key)) is not None:
+                order = [cached, *(idx for idx in order if idx != cached)]
+
+            for idx in order:
+                if (probe := self._probe(matching_abis[idx], args)) is not None:
+                    if args_key is not None:
+                        _overload_cache[key] = idx
+
+                    return matching_abis[idx], *probe
+
+        selected_abi = matching_abis[-1]
+        return selected_abi, self.conversion_manager.convert_method_args(selected_abi, args), None
 
     def encode_input(self, *args) -> HexBytes:
-        selected_abi = _select_method_abi(self.abis, args, encode_check=self._can_encode)
-        arguments = self.conversion_manager.convert_method_args(selected_abi, args)
+        return self._encode_input(args)[1]
+
+    def _encode_input(self, args: tuple | list) -> tuple["MethodABI", HexBytes]:
+        selected_abi, arguments, calldata = self._resolve(args)
+        if calldata is not None:
+            return selected_abi, calldata
+
         ecosystem = self.provider.network.ecosystem
         encoded_calldata = ecosystem.encode_calldata(selected_abi, *arguments)
         method_id = ecosystem.get_method_selector(selected_abi)
-        return HexBytes(method_id + encoded_calldata)
+        return selected_abi, HexBytes(method_id + encoded_calldata)
 
     def decode_input(self, calldata: bytes) -> tuple[str, dict[str, Any]]:
         matching_abis = []
@@ -312,9 +376,13 @@ class ContractMethodHandler(ManagerAccessMixin):
 
 class ContractCallHandler(ContractMethodHandler):
     def __call__(self, *args, **kwargs) -> Any:
+        if not kwargs and (batch := _call_batch.get()) is not None:
+            # NOTE: Sent later along with the other calls in the batch,
+            #   such as when using ``multicall.Batch()``.
+            return batch.add(self, *args)
+
         self._validate_is_contract()
-        selected_abi = _select_method_abi(self.abis, args, encode_check=self._can_encode)
-        arguments = self.conversion_manager.convert_method_args(selected_abi, args)
+        selected_abi, arguments, _ = self._resolve(args)
 
         return ContractCall(
             abi=selected_abi,
@@ -367,46 +435,109 @@ class ContractCallHandler(ContractMethodHandler):
             reported in the fee-currency's smallest unit, e.g. Wei.
         """
 
-        selected_abi = _select_method_abi(self.abis, args, encode_check=self._can_encode)
-        arguments = self.conversion_manager.convert_method_args(selected_abi, args)
+        _, arguments, _ = self._resolve(args)
         return self.transact.estimate_gas_cost(*arguments, **kwargs)
 
+    def query(
+        self,
+        *args,
+        start_block: int = 0,
+        stop_block: int | None = None,
+        step: int = 1,
+        engine_to_use: str | None = None,
+    ) -> "DataFrame":
+        """
+        Call the method at each block in a range, such as to get
+        the history of a value.
+
+        Usage example::
 
-def _select_method_abi(
-    abis: list["MethodABI"],
-    args: tuple | list,
-    encode_check: "Callable[[MethodABI, tuple | list], bool] | None" = None,
-) -> "MethodABI":
-    """
-    Pick the overload to call for ``args``.
-
-    Selection rules, in order:
-
-    1. Only overloads whose input count matches ``len(args)`` are candidates. No candidate
-       raises :class:`~ape.exceptions.ArgumentsLengthError`.
-    2. With more than one candidate and an ``encode_check``, the first candidate (in ABI
-       declaration order) whose input types the args encode to wins. This is a behavior
-       change: selection used to be by count alone, so an ambiguous overload set resolved
-       to the last declared one regardless of the argument types (#2670). Encoding is pure,
-       so the probe costs no network calls.
-    3. Otherwise (a single candidate, no ``encode_check``, or no candidate the args fit) the
-       last matching overload wins, which is the prior behavior.
-
-    When several overloads all accept the same args, e.g. ``1`` against both ``uint256``
-    and ``int256``, rule 2 falls back on ABI declaration order. That is deterministic but
-    arbitrary, since the ABI itself does not say which one the caller meant.
-    """
-    args = args or []
-    matching_abis = [abi for abi in abis if len(abi.inputs or []) == len(args)]
-    if not matching_abis:
-        raise ArgumentsLengthError(len(args), inputs=abis)
+            reserves = pool.getReserves.query(start_block=-1000, step=100)
+
+        Args:
+            *args: The contract method invocation arguments.
+            start_block (int): The first block, by number, to call the method at.
+              Defaults to ``0``.
+            stop_block (int | None): The last block, by number, to call the method at.
+              Defaults to the latest block.
+            step (int): The number of blocks to iterate between block numbers.
+              Defaults to ``1``.
+            engine_to_use (str | None): query engine to use, bypasses query
+              engine selection algorithm.
+
+        Returns:
+            pd.DataFrame: The ``value`` at each block, indexed by ``block_number``.
+        """
+        # perf: pandas import is really slow. Avoid importing at module level.
+        import pandas as pd
+
+        HEAD = self.chain_manager.blocks.height
+        if start_block < 0:
+            start_block = HEAD + start_block
+
+        if stop_block is None:
+            stop_block = HEAD
+
+        elif stop_block < 0:
+            stop_block = HEAD + stop_block
 
-    if len(matching_abis) > 1 and encode_check is not None:
-        for abi in matching_abis:
-            if encode_check(abi, args):
-                return abi
+        elif stop_block > HEAD:
+            raise ChainError(
+                f"'stop={stop_block}' cannot be greater than the chain length ({HEAD})."
+            )
+
+        abi, arguments, _ = self._resolve(args)
+        columns = ["block_number", "value"]
+        query = ContractMethodQuery(
+            columns=columns,
+            contract=self.contract.address,
+            method=abi,
+            method_args={
+                abi_input.name or f"{idx}": arg
+                for idx, (abi_input, arg) in enumerate(zip(abi.inputs, arguments))
+            },
+            start_block=start_block,
+            stop_block=stop_block,
+            step=step,
+        )
+        batches = self.query_manager.query_columns(query, engine_to_use=engine_to_use)
+        data = concat_columns(batches, columns)
+        return pd.DataFrame(
+            {"value": data["value"]}, index=pd.Index(data["block_number"], name="block_number")
+        )
+
+
+# The active batch to add view calls to instead of sending them, if any.
+_call_batch: ContextVar[Any] = ContextVar("call_batch", default=None)
 
-    return matching_abis[-1]
+# (same-arity overloads, args key) -> index of the overload the args last encoded against
+_overload_cache: LRUCache[tuple, int] = LRUCache(maxsize=4096)
+
+
+def _get_args_key(value: Any) -> Any:
+    # NOTE: Args with the same key must fit the same overloads. Integers are keyed by
+    #   sign and size, as those decide which integer types they fit. Anything else is
+    #   keyed by value, e.g. "2 ether" fits ``uint256`` where "abcdefg" does not.
+    #   Returns ``None`` when an arg cannot be keyed (is not hashable).
+    if isinstance(value, (list, tuple)):
+        keys = tuple(_get_args_key(v) for v in value)
+        return None if None in keys else (type(value), keys)
+
+    elif isinstance(value, dict):
+        keys = tuple(_get_args_key(v) for v in value.values())
+        return None if None in keys else (dict, tuple(zip(value, keys)))
+
+    elif type(value) is int:
+        # NOTE: A negative value fits ``intN`` when ``~value`` fits in ``N - 1`` bits,
+        #   e.g. -128 fits ``int8`` where -129 (same ``bit_length()``) does not.
+        return int, value < 0, (~value if value < 0 else value).bit_length()
+
+    try:
+        hash(value)
+    except TypeError:
+        return None
+
+    return type(value), value
 
 
 class ContractTransaction(ManagerAccessMixin):
@@ -497,8 +628,7 @@ class ContractTransactionHandler(ContractMethodHandler):
             int: The estimated cost of gas to execute the transaction
             reported in the fee-currency's smallest unit, e.g. Wei.
         """
-        selected_abi = _select_method_abi(self.abis, args, encode_check=self._can_encode)
-        arguments = self.conversion_manager.convert_method_args(selected_abi, args)
+        _, arguments, _ = self._resolve(args)
         txn = self.as_transaction(*arguments, **kwargs)
         return self.provider.estimate_gas_cost(txn)
 
@@ -522,7 +652,7 @@ class ContractTransactionHandler(ContractMethodHandler):
 
     def _as_transaction(self, *args) -> ContractTransaction:
         self._validate_is_contract()
-        selected_abi = _select_method_abi(self.abis, args, encode_check=self._can_encode)
+        selected_abi, _, _ = self._resolve(args)
         return ContractTransaction(
             abi=selected_abi,
             address=self.contract.address,
@@ -751,6 +881,7 @@ class ContractEvent(BaseInterfaceModel):
         stop_block: int | None = None,
         step: int = 1,
         engine_to_use: str | None = None,
+        as_columns: bool = False,
     ) -> "DataFrame":
         """
         Iterate through blocks for log events
@@ -766,6 +897,11 @@ class ContractEvent(BaseInterfaceModel):
               Defaults to ``1``.
             engine_to_use (str | None): query engine to use, bypasses query
               engine selection algorithm.
+            as_columns (bool): Set to ``True`` to decode the logs in columnar form
+              directly from the provider, which is much faster for large amounts of
+              logs. Each event argument becomes its own column (selected with
+              ``"event_arguments"`` or by name) and query engines are bypassed.
+              Defaults to ``False``.
 
         Returns:
             pd.DataFrame
@@ -787,8 +923,13 @@ class ContractEvent(BaseInterfaceModel):
             raise ChainError(
                 f"'stop={stop_block}' cannot be greater than the chain length ({HEAD})."
             )
+
+        if as_columns:
+            return pd.DataFrame(self._query_columns(columns, start_block, stop_block, step))
+
+        columns_ls = validate_and_expand_columns(columns, ContractLog)
         query: dict = {
-            "columns": (list(ContractLog.__pydantic_fields__) if columns[0] == "*" else columns),
+            "columns": columns_ls,
             "event": self.abi,
             "start_block": start_block,
             "stop_block": stop_block,
@@ -799,12 +940,43 @@ class ContractEvent(BaseInterfaceModel):
             query["contract"] = self.contract.address
 
         contract_event_query = ContractEventQuery(**query)
-        contract_events = self.query_manager.query(
+        # NOTE: Built from columns so engines that can, skip creating a log per row.
+        batches = self.query_manager.query_columns(
             contract_event_query, engine_to_use=engine_to_use
         )
-        columns_ls = validate_and_expand_columns(columns, ContractLog)
-        data = map(partial(extract_fields, columns=columns_ls), contract_events)
-        return pd.DataFrame(columns=columns_ls, data=data)
+        return pd.DataFrame(concat_columns(batches, columns_ls), columns=columns_ls)
+
+    def _query_columns(
+        self, columns: Sequence[str], start_block: int, stop_block: int, step: int
+    ) -> dict[str, list]:
+        argument_names = [i.name or "" for i in self.abi.inputs]
+        columns = [c.strip() for column in columns for c in column.split(",") if c.strip()]
+        if not columns:
+            raise ValueError("No columns selected. Use '*' to select all columns.")
+
+        elif "*" in columns:
+            selected = [*LOG_COLUMNS, *argument_names]
+        else:
+            selected = []
+            for column in columns:
+                if column == "event_arguments":
+                    selected.extend(argument_names)
+                elif column in LOG_COLUMNS or column in argument_names:
+                    selected.append(column)
+                else:
+                    raise ValueError(f"Unknown column '{column}'.")
+
+        addresses = [self.contract.address] if hasattr(self.contract, "address") else []
+        log_filter = LogFilter.from_event(
+            event=self.abi, addresses=addresses, start_block=start_block, stop_block=stop_block
+        )
+        data = self.provider.get_contract_log_columns(log_filter)
+        if step > 1:
+            # Only keep the logs from every `step` block, like the query engines.
+            keep = [(n - start_block) % step == 0 for n in data["block_number"]]
+            data = {k: [v for v, k_ in zip(values, keep) if k_] for k, values in data.items()}
+
+        return {column: data[column] for column in dict.fromkeys(selected)}
 
     def range(
         self,
@@ -1024,6 +1196,93 @@ class ContractEventWrapper:
         raise ValueError(f"Could not make a mock contract log. Errors: {error_str}")
 
 
+class _AttributeTable:
+    """
+    The ABIs of a contract type grouped by name, and the kind of attribute
+    each name resolves to on a :class:`~ape.contracts.base.ContractInstance`:
+    ``"view"``, ``"mutable"``, ``"event"``, ``"error"``, or ``"corrupted"``
+    when the name is used by more than one kind.
+    """
+
+    def __init__(self, contract_type: "ContractType"):
+        self.view_methods = _group_by_name(contract_type.view_methods)
+        self.mutable_methods = _group_by_name(contract_type.mutable_methods)
+        self.events = _group_by_name(contract_type.events)
+        self.errors = _group_by_name(contract_type.errors)
+        self.kinds: dict[str, str] = {}
+        for kind, abis in (
+            ("view", self.view_methods),
+            ("mutable", self.mutable_methods),
+            ("event", self.events),
+            ("error", self.errors),
+        ):
+            for name in abis:
+                self.kinds[name] = "corrupted" if name in self.kinds else kind
+
+
+class _LazyHandlers(Mapping[str, _T]):
+    """
+    Handlers by name, each created from its ABIs on first access.
+    """
+
+    def __init__(self, abis: dict[str, list], create: Callable[[list], _T]):
+        self._abis = abis
+        self._create = create
+        self._handlers: dict[str, _T] = {}
+
+    def __getitem__(self, name: str) -> _T:
+        if name in self._handlers:
+            return self._handlers[name]
+
+        abis = self._abis[name]
+        try:
+            handler = self._create(abis)
+        except Exception as err:
+            # NOTE: Must raise AttributeError for __attr__ method or will seg fault
+            raise ApeAttributeError(str(err), base_err=err) from err
+
+        self._handlers[name] = handler
+        return handler
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._abis
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._abis)
+
+    def __len__(self) -> int:
+        return len(self._abis)
+
+
+# id(contract type) -> (contract type, attribute table), shared by all its instances
+_attribute_tables: LRUCache[int, tuple["ContractType", _AttributeTable]] = LRUCache(maxsize=1024)
+
+
+def _get_attribute_table(contract_type: "ContractType") -> _AttributeTable:
+    # NOTE: Keyed by identity; the entry holds a reference to the contract type,
+    #  so the ID is not re-used while cached.
+    cached = _attribute_tables.get(id(contract_type))
+    if cached is not None and cached[0] is contract_type:
+        return cached[1]
+
+    table = _AttributeTable(contract_type)
+    _attribute_tables[id(contract_type)] = (contract_type, table)
+    return table
+
+
+@cache
+def _get_class_attributes(cls: type) -> frozenset[str]:
+    return frozenset(dir(cls))
+
+
+def _group_by_name(abis: Iterable) -> dict[str, list]:
+    groups: dict[str, list] = {}
+    for abi in abis:
+        groups.setdefault(abi.name, []).append(abi)
+
+    return groups
+
+
 class ContractTypeWrapper(ManagerAccessMixin):
     contract_type: "ContractType"
     base_path: Path | None = None
@@ -1237,42 +1496,26 @@ class ContractInstance(BaseAddress, ContractTypeWrapper):
         return self._address
 
     @cached_property
-    def _view_methods_(self) -> dict[str, ContractCallHandler]:
-        view_methods: dict[str, list[MethodABI]] = {}
-
-        for abi in self.contract_type.view_methods:
-            if abi.name in view_methods:
-                view_methods[abi.name].append(abi)
-            else:
-                view_methods[abi.name] = [abi]
-
+    def _attribute_table_(self) -> "_AttributeTable":
         try:
-            return {
-                abi_name: ContractCallHandler(contract=self, abis=abis)
-                for abi_name, abis in view_methods.items()
-            }
+            return _get_attribute_table(self.contract_type)
         except Exception as err:
             # NOTE: Must raise AttributeError for __attr__ method or will seg fault
             raise ApeAttributeError(str(err), base_err=err) from err
 
     @cached_property
-    def _mutable_methods_(self) -> dict[str, ContractTransactionHandler]:
-        mutable_methods: dict[str, list[MethodABI]] = {}
-
-        for abi in self.contract_type.mutable_methods:
-            if abi.name in mutable_methods:
-                mutable_methods[abi.name].append(abi)
-            else:
-                mutable_methods[abi.name] = [abi]
+    def _view_methods_(self) -> Mapping[str, ContractCallHandler]:
+        return _LazyHandlers(
+            self._attribute_table_.view_methods,
+            lambda abis: ContractCallHandler(contract=self, abis=abis),
+        )
 
-        try:
-            return {
-                abi_name: ContractTransactionHandler(contract=self, abis=abis)
-                for abi_name, abis in mutable_methods.items()
-            }
-        except Exception as err:
-            # NOTE: Must raise AttributeError for __attr__ method or will seg fault
-            raise ApeAttributeError(str(err), base_err=err) from err
+    @cached_property
+    def _mutable_methods_(self) -> Mapping[str, ContractTransactionHandler]:
+        return _LazyHandlers(
+            self._attribute_table_.mutable_methods,
+            lambda abis: ContractTransactionHandler(contract=self, abis=abis),
+        )
 
     def call_view_method(self, method_name: str, *args, **kwargs) -> Any:
         """
@@ -1396,65 +1639,37 @@ class ContractInstance(BaseAddress, ContractTypeWrapper):
         raise err
 
     @cached_property
-    def _events_(self) -> dict[str, list[ContractEvent]]:
-        events: dict[str, list[EventABI]] = {}
-
-        for abi in self.contract_type.events:
-            if abi.name in events:
-                events[abi.name].append(abi)
-            else:
-                events[abi.name] = [abi]
-
-        try:
-            return {
-                abi_name: [ContractEvent(contract=self, abi=abi) for abi in abi_list]
-                for abi_name, abi_list in events.items()
-            }
-        except Exception as err:
-            # NOTE: Must raise AttributeError for __attr__ method or will seg fault
-            raise ApeAttributeError(str(err), base_err=err) from err
+    def _events_(self) -> Mapping[str, list[ContractEvent]]:
+        return _LazyHandlers(
+            self._attribute_table_.events,
+            lambda abis: [ContractEvent(contract=self, abi=abi) for abi in abis],
+        )
 
     @cached_property
-    def _errors_(self) -> dict[str, list[type[CustomError]]]:
-        abis: dict[str, list[ErrorABI]] = {}
-
-        try:
-            for abi in self.contract_type.errors:
-                if abi.name in abis:
-                    abis[abi.name].append(abi)
-                else:
-                    abis[abi.name] = [abi]
-
-            # Check for prior error sub-class definitions for the same contract.
-            prior_errors = self.chain_manager.contracts._get_errors(self.address)
-
-            errors = {}
-            for abi_name, abi_list in abis.items():
-                errors_to_add = []
-                for abi in abi_list:
-                    error_type = None
-                    for existing_cls in prior_errors:
-                        if existing_cls.abi and existing_cls.abi.signature == abi.signature:
-                            # Error class was previously defined by contract at same address.
-                            error_type = existing_cls
-                            break
+    def _errors_(self) -> Mapping[str, list[type[CustomError]]]:
+        return _LazyHandlers(self._attribute_table_.errors, self._get_error_types)
 
-                    if error_type is None:
-                        # Error class is being defined for the first time.
-                        error_type = self._create_custom_error_type(
-                            abi, contract_address=self.address
-                        )
-                        self.chain_manager.contracts._cache_error(self.address, error_type)
+    def _get_error_types(self, abis: list["ErrorABI"]) -> list[type[CustomError]]:
+        # Check for prior error sub-class definitions for the same contract.
+        prior_errors = self.chain_manager.contracts._get_errors(self.address)
 
-                    errors_to_add.append(error_type)
+        error_types = []
+        for abi in abis:
+            error_type = None
+            for existing_cls in prior_errors:
+                if existing_cls.abi and existing_cls.abi.signature == abi.signature:
+                    # Error class was previously defined by contract at same address.
+                    error_type = existing_cls
+                    break
 
-                errors[abi_name] = errors_to_add
+            if error_type is None:
+                # Error class is being defined for the first time.
+                error_type = self._create_custom_error_type(abi, contract_address=self.address)
+                self.chain_manager.contracts._cache_error(self.address, error_type)
 
-            return errors
+            error_types.append(error_type)
 
-        except Exception as err:
-            # NOTE: Must raise AttributeError for __attr__ method or will seg fault
-            raise ApeAttributeError(str(err), base_err=err) from err
+        return error_types
 
     def __dir__(self) -> list[str]:
         """
@@ -1497,46 +1712,30 @@ class ContractInstance(BaseAddress, ContractTypeWrapper):
             Any: The return value from the contract call, or a transaction receipt.
         """
         _assert_not_ipython_check(attr_name)
-        if attr_name in set(super(BaseAddress, self).__dir__()):
-            return super(BaseAddress, self).__getattribute__(attr_name)
-
-        elif attr_name not in {
-            *self._view_methods_,
-            *self._mutable_methods_,
-            *self._events_,
-            *self._errors_,
-        }:
+        kind = self._attribute_table_.kinds.get(attr_name)
+        if kind is None or attr_name in _get_class_attributes(type(self)):
+            if attr_name in set(super(BaseAddress, self).__dir__()):
+                return super(BaseAddress, self).__getattribute__(attr_name)
+
             # Didn't find anything that matches
             # NOTE: `__getattr__` *must* raise `AttributeError`
             name = self.contract_type.name or ContractInstance.__name__
             raise ApeAttributeError(f"'{name}' has no attribute '{attr_name}'.")
 
-        elif (
-            int(attr_name in self._view_methods_)
-            + int(attr_name in self._mutable_methods_)
-            + int(attr_name in self._events_)
-            + int(attr_name in self._errors_)
-            > 1
-        ):
-            # ABI should not contain a mix of events, mutable and view methods that match
-            # NOTE: `__getattr__` *must* raise `AttributeError`
-            cls_name = getattr(type(self), "__name__", ContractInstance.__name__)
-            raise ApeAttributeError(f"{cls_name} has corrupted ABI.")
-
-        if attr_name in self._view_methods_:
+        elif kind == "view":
             return self._view_methods_[attr_name]
 
-        elif attr_name in self._mutable_methods_:
+        elif kind == "mutable":
             return self._mutable_methods_[attr_name]
 
-        elif attr_name in self._events_:
+        elif kind == "event":
             evt_options = self._events_[attr_name]
             if len(evt_options) > 1:
                 return ContractEventWrapper(evt_options)
 
             return evt_options[0]
 
-        elif attr_name in self._errors_:
+        elif kind == "error":
             err_options = self._errors_[attr_name]
             if len(err_options) > 1:
                 raise ApeAttributeError(
@@ -1546,10 +1745,10 @@ class ContractInstance(BaseAddress, ContractTypeWrapper):
 
             return err_options[0]
 
-        else:
-            raise ApeAttributeError(
-                f"No attribute '{attr_name}' found in contract '{self.address}'."
-            )
+        # ABI should not contain a mix of events, mutable and view methods that match
+        # NOTE: `__getattr__` *must* raise `AttributeError`
+        cls_name = getattr(type(self), "__name__", ContractInstance.__name__)
+        raise ApeAttributeError(f"{cls_name} has corrupted ABI.")
 
 
 class ContractContainer(ContractTypeWrapper, ExtraAttributesMixin):
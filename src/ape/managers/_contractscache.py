@@ -1,8 +1,9 @@
 import json
-from collections.abc import Collection
+import time
+from collections.abc import Callable, Collection
 from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
-from functools import cached_property
+from functools import cached_property, partial
 from pathlib import Path
 from typing import TYPE_CHECKING, ClassVar, Generic, TypeVar
 
@@ -16,10 +17,11 @@ from ape.contracts.base import ContractContainer, ContractInstance
 from ape.exceptions import ApeException, ContractNotFoundError, ConversionError, CustomError
 from ape.logging import logger
 from ape.managers._deploymentscache import Deployment, DeploymentDiskCache
+from ape.managers._logdecoder import LogDecoder
 from ape.managers.base import BaseManager
 from ape.types.address import AddressType
-from ape.utils.misc import nonreentrant
-from ape.utils.os import CacheDirectory
+from ape.utils.misc import LRUCache, nonreentrant
+from ape.utils.os import CacheDatabase, CacheDirectory
 
 if TYPE_CHECKING:
     from eth_pydantic_types import HexBytes
@@ -28,12 +30,32 @@ if TYPE_CHECKING:
 
 
 _BASE_MODEL = TypeVar("_BASE_MODEL", bound=BaseModel)
+# NOTE: Not "cache.db", which is the ape-cache query database.
+DATA_CACHE_FILENAME = "contracts.db"
 
 
-class ApeDataCache(CacheDirectory, Generic[_BASE_MODEL]):
+class MissingContractType(BaseModel):
+    """
+    A record of a failed contract-type look-up, so the look-up
+    is not repeated until the record expires.
+    """
+
+    checked_at: float
+    """
+    The time of the look-up, in seconds since the epoch.
+    """
+
+
+class ApeDataCache(Generic[_BASE_MODEL]):
     """
     A wrapper around some cached models in the data directory,
-    such as the cached contract types.
+    such as the cached contract types. On disk, all the caches of a
+    network share a single database file
+    (see :class:`~ape.utils.os.CacheDatabase`).
+
+    When the models are also written to disk, the in-memory layer holds
+    up to ``memory_size`` models, evicting the least-recently used ones
+    (which are then read from disk again when needed).
     """
 
     def __init__(
@@ -43,24 +65,33 @@ class ApeDataCache(CacheDirectory, Generic[_BASE_MODEL]):
         network_key: str,
         key: str,
         model_type: type[_BASE_MODEL],
+        memory_size: int | None = None,
+        on_load: Callable[[_BASE_MODEL], None] | None = None,
     ):
         data_folder = base_data_folder / ecosystem_key
-        base_path = data_folder / network_key
+        self._base_path = data_folder / network_key
+        self._key = key
         self._model_type = model_type
-        self.memory: dict[str, _BASE_MODEL] = {}
+        # Called with each model put in memory.
+        self._on_load = on_load
 
         # Only write if we are not testing!
         self._write_to_disk = not network_key.endswith("-fork") and network_key != "local"
         # Read from disk if using forks or live networks.
         self._read_from_disk = network_key.endswith("-fork") or network_key != "local"
 
-        super().__init__(base_path / key)
+        # NOTE: Only bounded when evicted models can be read back from disk.
+        #   Fork networks are bounded too, as `ContractCache` gives them the
+        #   cache of the network they fork (without the "-fork" suffix).
+        self.memory: LRUCache[str, _BASE_MODEL] = LRUCache(
+            maxsize=memory_size if self._write_to_disk else None
+        )
 
-    def __getitem__(self, key: str) -> _BASE_MODEL | None:  # type: ignore
+    def __getitem__(self, key: str) -> _BASE_MODEL | None:
         return self.get_type(key)
 
-    def __setitem__(self, key: str, value: _BASE_MODEL):  # type: ignore
-        self.memory[key] = value
+    def __setitem__(self, key: str, value: _BASE_MODEL):
+        self._put_in_memory(key, value)
         if self._write_to_disk:
             # Cache to disk.
             self.cache_data(key, value.model_dump(mode="json"))
@@ -68,7 +99,7 @@ class ApeDataCache(CacheDirectory, Generic[_BASE_MODEL]):
     def __delitem__(self, key: str):
         self.memory.pop(key, None)
         if self._write_to_disk:
-            # Delete the cache file.
+            # Delete from the disk cache.
             self.delete_data(key)
 
     def __contains__(self, key: str) -> bool:
@@ -77,6 +108,38 @@ class ApeDataCache(CacheDirectory, Generic[_BASE_MODEL]):
         except KeyError:
             return False
 
+    @cached_property
+    def store(self) -> CacheDatabase:
+        """
+        The disk cache.
+        """
+        store = CacheDatabase(self._base_path / DATA_CACHE_FILENAME, self._key)
+
+        # Migrate the older layout, which had a JSON file per item.
+        legacy_directory = CacheDirectory(self._base_path / self._key)
+        if self._write_to_disk and legacy_directory._path.is_dir():
+            logger.debug(f"Migrating '{legacy_directory._path}' to '{store._path}'.")
+            store.import_directory(legacy_directory)
+
+        return store
+
+    def get_data(self, key: str) -> dict:
+        return self.store.get_data(key)
+
+    def cache_data(self, key: str, data: dict):
+        self.store.cache_data(key, data)
+
+    def delete_data(self, key: str):
+        self.store.delete_data(key)
+
+    def clear(self):
+        """
+        Delete all the cached models, including those on disk.
+        """
+        self.memory.clear()
+        if self._write_to_disk:
+            self.store.clear()
+
     def get_type(self, key: str, fetch_from_disk: bool = True) -> _BASE_MODEL | None:
         if model := self.memory.get(key):
             return model
@@ -85,11 +148,45 @@ class ApeDataCache(CacheDirectory, Generic[_BASE_MODEL]):
             # Found on disk.
             model = self._model_type.model_validate(data)
             # Cache locally for next time.
-            self.memory[key] = model
+            self._put_in_memory(key, model)
             return model
 
         return None
 
+    def get_many(
+        self, keys: Collection[str], fetch_from_disk: bool = True
+    ) -> dict[str, _BASE_MODEL]:
+        """
+        Get the cached models for many keys, reading the disk at most once.
+        Keys that are not cached are not included.
+        """
+        result = {key: model for key in keys if (model := self.memory.get(key))}
+        missing = [key for key in keys if key not in result]
+        if missing and fetch_from_disk and self._read_from_disk:
+            for key, data in self.store.get_many(missing).items():
+                model = self._model_type.model_validate(data)
+                self._put_in_memory(key, model)
+                result[key] = model
+
+        return result
+
+    def put_many(self, models: dict[str, _BASE_MODEL]):
+        """
+        Cache many models, writing them to disk in a single transaction.
+        """
+        for key, model in models.items():
+            self._put_in_memory(key, model)
+
+        if self._write_to_disk and models:
+            self.store.put_many(
+                {key: model.model_dump(mode="json") for key, model in models.items()}
+            )
+
+    def _put_in_memory(self, key: str, model: _BASE_MODEL):
+        self.memory[key] = model
+        if self._on_load is not None:
+            self._on_load(model)
+
 
 class ContractCache(BaseManager):
     """
@@ -107,12 +204,35 @@ class ContractCache(BaseManager):
 
     # chain_id -> address -> custom_err
     # Cached to prevent calling `new_class` multiple times with conflicts.
-    _custom_error_types: ClassVar[dict[int, dict[AddressType, set[type[CustomError]]]]] = {}
+    _custom_error_types: ClassVar[dict[int, LRUCache[AddressType, set[type[CustomError]]]]] = {}
+
+    memory_cache_size: ClassVar[int] = 10_000
+    """
+    The most items to keep in memory per cache (e.g. contract types) and network,
+    evicting the least-recently used. Only applies to live networks, where evicted
+    items are read from the disk cache again when needed. Also bounds the number
+    of addresses with cached custom-error types per chain.
+    """
+
+    missing_contract_type_ttl: ClassVar[float] = 60 * 60
+    """
+    The number of seconds to remember that an address has no contract type
+    (no code and no explorer ABI) before looking it up again.
+    Set to ``0`` to disable remembering failed look-ups.
+    """
 
     @property
     def contract_types(self) -> ApeDataCache[ContractType]:
         return self._get_data_cache("contract_types", ContractType)
 
+    @cached_property
+    def log_decoder(self) -> LogDecoder:
+        """
+        Decodes logs from any contract, using the events
+        of all the cached contract types.
+        """
+        return LogDecoder()
+
     @property
     def proxy_infos(self) -> ApeDataCache[ProxyInfoAPI]:
         return self._get_data_cache("proxy_info", ProxyInfoAPI)
@@ -125,6 +245,10 @@ class ContractCache(BaseManager):
     def contract_creations(self) -> ApeDataCache[ContractCreation]:
         return self._get_data_cache("contract_creation", ContractCreation)
 
+    @property
+    def missing_contract_types(self) -> ApeDataCache[MissingContractType]:
+        return self._get_data_cache("missing_contract_types", MissingContractType)
+
     def _get_data_cache(
         self,
         key: str,
@@ -141,7 +265,14 @@ class ContractCache(BaseManager):
             return cache
 
         self._caches[ecosystem_name][network_name][key] = ApeDataCache(
-            self.config_manager.DATA_FOLDER, ecosystem_name, network_name, key, model_type
+            self.config_manager.DATA_FOLDER,
+            ecosystem_name,
+            network_name,
+            key,
+            model_type,
+            memory_size=self.memory_cache_size,
+            # Index the events of every contract type, for decoding any log.
+            on_load=self.log_decoder.register_contract_type if key == "contract_types" else None,
         )
         return self._caches[ecosystem_name][network_name][key]
 
@@ -156,7 +287,7 @@ class ContractCache(BaseManager):
         """
         Cache the given contract type. Contracts are cached in memory per session.
         In live networks, contracts also get cached to disk at
-        ``.ape/{ecosystem_name}/{network_name}/contract_types/{address}.json``
+        ``.ape/{ecosystem_name}/{network_name}/contracts.db``
         for faster look-up next time.
 
         Args:
@@ -202,6 +333,13 @@ class ContractCache(BaseManager):
             "contract_types", ContractType, ecosystem_key=ecosystem_key, network_key=network_key
         )
         cache[address] = contract_type
+        # NOTE: Also deleted from disk, so it is not found missing after a restart.
+        del self._get_data_cache(
+            "missing_contract_types",
+            MissingContractType,
+            ecosystem_key=ecosystem_key,
+            network_key=network_key,
+        )[address]
 
         # NOTE: The txn_hash is not included when caching this way.
         if name := contract_type.name:
@@ -247,6 +385,7 @@ class ContractCache(BaseManager):
         del self.contract_types[address]
         self._delete_proxy(address)
         del self.contract_creations[address]
+        del self.missing_contract_types[address]
 
     @contextmanager
     def use_temporary_caches(self):
@@ -427,11 +566,7 @@ class ContractCache(BaseManager):
         if chain_id not in self._custom_error_types:
             return set()
 
-        errors = self._custom_error_types[chain_id]
-        if address in errors:
-            return errors[address]
-
-        return set()
+        return self._custom_error_types[chain_id].get(address, set())
 
     def _cache_error(
         self, address: AddressType, error: type[CustomError], chain_id: int | None = None
@@ -442,12 +577,54 @@ class ContractCache(BaseManager):
             return
 
         if chain_id not in self._custom_error_types:
-            self._custom_error_types[chain_id] = {address: set()}
+            self._custom_error_types[chain_id] = LRUCache(maxsize=self.memory_cache_size)
+            self._custom_error_types[chain_id][address] = set()
         elif address not in self._custom_error_types[chain_id]:
             self._custom_error_types[chain_id][address] = set()
 
         self._custom_error_types[chain_id][address].add(error)
 
+    def _is_missing_contract_type(self, address: AddressType) -> bool:
+        if (
+            self.provider.network.is_dev
+            or self.missing_contract_type_ttl <= 0
+            or not (missing := self.missing_contract_types[address])
+        ):
+            return False
+
+        elif time.time() - missing.checked_at < self.missing_contract_type_ttl:
+            return True
+
+        # Expired.
+        del self.missing_contract_types[address]
+        return False
+
+    def _cache_missing_contract_type(self, address: AddressType):
+        if self.provider.network.is_dev or self.missing_contract_type_ttl <= 0:
+            # Contracts may appear at any address in development.
+            return
+
+        self.missing_contract_types[address] = MissingContractType(checked_at=time.time())
+
+    def forget_missing_contract_type(self, address: AddressType | None = None):
+        """
+        Forget failed contract-type look-ups, so the next look-up
+        checks the chain and the explorer again. Failed look-ups
+        are otherwise remembered for
+        :attr:`~ape.managers._contractscache.ContractCache.missing_contract_type_ttl`
+        seconds.
+
+        Args:
+            address (AddressType | None): The address to forget. Defaults to
+              forgetting all the failed look-ups on the connected network.
+        """
+        if address is None:
+            self.missing_contract_types.clear()
+            return
+
+        address_key: AddressType = self.conversion_manager.convert(address, AddressType)
+        del self.missing_contract_types[address_key]
+
     def __getitem__(self, address: AddressType) -> ContractType:
         contract_type = self.get(address)
         if not contract_type:
@@ -464,12 +641,15 @@ class ContractCache(BaseManager):
         self, addresses: Collection[AddressType], concurrency: int | None = None
     ) -> dict[AddressType, ContractType]:
         """
-        Get contract types for all given addresses.
+        Get contract types for all given addresses. Cached contract types are
+        read in one pass, and the code and proxy information of the rest are
+        requested in bulk before fetching the remaining ABIs from the explorer.
 
         Args:
             addresses (list[AddressType): A list of addresses to get contract types for.
-            concurrency (int | None): The number of threads to use. Defaults to
-              ``min(4, len(addresses))``.
+            concurrency (int | None): The number of threads to use for proxy detection
+              and explorer requests. Defaults to ``min(4, len(addresses))`` for the
+              explorer, to respect rate-limits.
 
         Returns:
             dict[AddressType, ContractType]: A mapping of addresses to their respective
@@ -479,38 +659,92 @@ class ContractCache(BaseManager):
             logger.debug("No addresses provided.")
             return {}
 
-        def get_contract_type(addr: AddressType):
-            addr = self.conversion_manager.convert(addr, AddressType)
-            ct = self.get(addr)
+        # Convert once.
+        address_keys = list(
+            dict.fromkeys(self.conversion_manager.convert(a, AddressType) for a in addresses)
+        )
 
-            if not ct:
-                logger.debug(f"Failed to locate contract at '{addr}'.")
-                return addr, None
-            else:
-                return addr, ct
+        # Satisfy what we can from the memory and disk caches, in one pass.
+        contract_types = self.contract_types.get_many(address_keys)
+        missing = [a for a in address_keys if a not in contract_types]
+        if missing and not self.provider.network.is_dev and self.missing_contract_type_ttl > 0:
+            # Skip the addresses recently looked up without finding anything.
+            expires_after = time.time() - self.missing_contract_type_ttl
+            known_missing = self.missing_contract_types.get_many(missing)
+            missing = [
+                a
+                for a in missing
+                if a not in known_missing or known_missing[a].checked_at <= expires_after
+            ]
+
+        if not missing:
+            return contract_types
+
+        # Addresses without code cannot have a contract type.
+        codes = self.chain_manager.get_codes(missing, raise_on_error=False)
+        for address, code in codes.items():
+            if isinstance(code, Exception):
+                # Skip only this address; the error may be temporary.
+                logger.debug(f"Failed to get code at '{address}': {code}")
+
+        missing = [a for a in missing if codes[a] and not isinstance(codes[a], Exception)]
+
+        # Detect proxies for the rest, all at once.
+        proxy_infos: dict[AddressType, ProxyInfoAPI] = self.proxy_infos.get_many(missing)
+        undetected = [a for a in missing if a not in proxy_infos]
+        detected = self.provider.network.ecosystem.get_proxy_infos(undetected, concurrency)
+        new_proxy_infos = {a: info for a, info in detected.items() if info is not None}
+        self.proxy_infos.put_many(new_proxy_infos)
+        proxy_infos.update(new_proxy_infos)
+
+        # Get the remaining ABIs (including proxy targets) from the explorer.
+        targets = [info.target for a, info in proxy_infos.items() if a in missing]
+        needed = list(dict.fromkeys([*missing, *targets]))
+        known = self.contract_types.get_many(needed)
+        to_fetch = [a for a in needed if a not in known]
+        fetched: dict[AddressType, ContractType] = {}
+        if to_fetch and not self.provider.network.explorer:
+            for address in to_fetch:
+                self._cache_missing_contract_type(address)
+
+        elif to_fetch:
+            default_max_threads = 4
+            max_threads = (
+                concurrency
+                if concurrency is not None
+                else min(len(to_fetch), default_max_threads) or default_max_threads
+            )
+            with ThreadPoolExecutor(max_workers=max_threads) as pool:
+                results = pool.map(
+                    partial(self._get_contract_type_from_explorer, cache=False), to_fetch
+                )
+                fetched = {a: ct for a, ct in zip(to_fetch, results) if ct is not None}
+
+        known.update(fetched)
+        to_cache = dict(fetched)
+        for address in missing:
+            if proxy_info := proxy_infos.get(address):
+                proxy_type = known.get(address)
+                implementation_type = known.get(proxy_info.target)
+                if proxy_type and implementation_type:
+                    contract_type = _get_combined_contract_type(
+                        proxy_type, proxy_info, implementation_type
+                    )
+                else:
+                    contract_type = implementation_type or proxy_type
 
-        converted_addresses: list[AddressType] = []
-        for address in converted_addresses:
-            if not self.conversion_manager.is_type(address, AddressType):
-                converted_address = self.conversion_manager.convert(address, AddressType)
-                converted_addresses.append(converted_address)
             else:
-                converted_addresses.append(address)
-
-        contract_types = {}
-        default_max_threads = 4
-        max_threads = (
-            concurrency
-            if concurrency is not None
-            else min(len(addresses), default_max_threads) or default_max_threads
-        )
-        with ThreadPoolExecutor(max_workers=max_threads) as pool:
-            for address, contract_type in pool.map(get_contract_type, addresses):
-                if contract_type is None:
-                    continue
+                contract_type = known.get(address)
+
+            if contract_type is None:
+                logger.debug(f"Failed to locate contract at '{address}'.")
+                continue
 
-                contract_types[address] = contract_type
+            contract_types[address] = contract_type
+            to_cache[address] = contract_type
 
+        # Write back all at once.
+        self.contract_types.put_many(to_cache)
         return contract_types
 
     @nonreentrant(key_fn=lambda *args, **kwargs: args[1])
@@ -529,6 +763,10 @@ class ContractCache(BaseManager):
         If the contract is cached, it will return the contract from the cache.
         Otherwise, if on a live network, it fetches it from the
         :class:`~ape.api.explorers.ExplorerAPI`.
+        On live networks, failed look-ups are remembered for
+        :attr:`~ape.managers._contractscache.ContractCache.missing_contract_type_ttl`
+        seconds (see
+        :meth:`~ape.managers._contractscache.ContractCache.forget_missing_contract_type`).
 
         Args:
             address (AddressType): The address of the contract.
@@ -579,6 +817,10 @@ class ContractCache(BaseManager):
 
                 return contract_type
 
+            if not default and self._is_missing_contract_type(address_key):
+                # Recently looked up without finding anything.
+                return None
+
         # Either no cached entry, or `replace=True` so we ignore the cache.
         # Check broader sources, such as an explorer.
         if not proxy_info and detect_proxy:
@@ -920,13 +1162,19 @@ class ContractCache(BaseManager):
                 self.proxy_infos,
                 self.contract_creations,
                 self.blueprints,
+                self.missing_contract_types,
             ):
-                cache.memory = {}
+                cache.memory.clear()
 
         self.deployments.clear_local()
 
-    def _get_contract_type_from_explorer(self, address: AddressType) -> ContractType | None:
+    def _get_contract_type_from_explorer(
+        self, address: AddressType, cache: bool = True
+    ) -> ContractType | None:
+        # NOTE: `cache=False` only skips caching found contract types (for callers
+        #   caching them in bulk). Failed look-ups are always remembered.
         if not self.provider.network.explorer:
+            self._cache_missing_contract_type(address)
             return None
 
         try:
@@ -962,7 +1210,12 @@ class ContractCache(BaseManager):
                 )
                 return None
 
-            self.contract_types[address] = contract_type
+            if cache:
+                self.contract_types[address] = contract_type
+
+        else:
+            # NOTE: Not remembered when erroring, as the error may be temporary.
+            self._cache_missing_contract_type(address)
 
         return contract_type
 
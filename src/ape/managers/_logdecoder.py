@@ -0,0 +1,263 @@
+import threading
+from collections.abc import Iterable, Sequence
+
+from eth_utils import encode_hex, keccak
+from ethpm_types import ContractType
+from ethpm_types.abi import EventABI
+
+from ape.managers.base import BaseManager
+from ape.types.address import AddressType
+from ape.types.events import ContractLogContainer
+from ape.utils.misc import LRUCache
+
+# Events from well-known standards (ERC-20, ERC-721, ERC-1155, ERC-1967, WETH, Ownable),
+# so their logs decode even when the emitting contract's type is not known.
+_STANDARD_EVENTS: list[dict] = [
+    {
+        "type": "event",
+        "name": "Transfer",
+        "inputs": [
+            {"name": "from", "type": "address", "indexed": True},
+            {"name": "to", "type": "address", "indexed": True},
+            {"name": "value", "type": "uint256", "indexed": False},
+        ],
+    },
+    {
+        "type": "event",
+        "name": "Approval",
+        "inputs": [
+            {"name": "owner", "type": "address", "indexed": True},
+            {"name": "spender", "type": "address", "indexed": True},
+            {"name": "value", "type": "uint256", "indexed": False},
+        ],
+    },
+    {
+        "type": "event",
+        "name": "Transfer",
+        "inputs": [
+            {"name": "from", "type": "address", "indexed": True},
+            {"name": "to", "type": "address", "indexed": True},
+            {"name": "tokenId", "type": "uint256", "indexed": True},
+        ],
+    },
+    {
+        "type": "event",
+        "name": "Approval",
+        "inputs": [
+            {"name": "owner", "type": "address", "indexed": True},
+            {"name": "approved", "type": "address", "indexed": True},
+            {"name": "tokenId", "type": "uint256", "indexed": True},
+        ],
+    },
+    {
+        "type": "event",
+        "name": "ApprovalForAll",
+        "inputs": [
+            {"name": "owner", "type": "address", "indexed": True},
+            {"name": "operator", "type": "address", "indexed": True},
+            {"name": "approved", "type": "bool", "indexed": False},
+        ],
+    },
+    {
+        "type": "event",
+        "name": "TransferSingle",
+        "inputs": [
+            {"name": "operator", "type": "address", "indexed": True},
+            {"name": "from", "type": "address", "indexed": True},
+            {"name": "to", "type": "address", "indexed": True},
+            {"name": "id", "type": "uint256", "indexed": False},
+            {"name": "value", "type": "uint256", "indexed": False},
+        ],
+    },
+    {
+        "type": "event",
+        "name": "TransferBatch",
+        "inputs": [
+            {"name": "operator", "type": "address", "indexed": True},
+            {"name": "from", "type": "address", "indexed": True},
+            {"name": "to", "type": "address", "indexed": True},
+            {"name": "ids", "type": "uint256[]", "indexed": False},
+            {"name": "values", "type": "uint256[]", "indexed": False},
+        ],
+    },
+    {
+        "type": "event",
+        "name": "URI",
+        "inputs": [
+            {"name": "value", "type": "string", "indexed": False},
+            {"name": "id", "type": "uint256", "indexed": True},
+        ],
+    },
+    {
+        "type": "event",
+        "name": "OwnershipTransferred",
+        "inputs": [
+            {"name": "previousOwner", "type": "address", "indexed": True},
+            {"name": "newOwner", "type": "address", "indexed": True},
+        ],
+    },
+    {
+        "type": "event",
+        "name": "Upgraded",
+        "inputs": [{"name": "implementation", "type": "address", "indexed": True}],
+    },
+    {
+        "type": "event",
+        "name": "AdminChanged",
+        "inputs": [
+            {"name": "previousAdmin", "type": "address", "indexed": False},
+            {"name": "newAdmin", "type": "address", "indexed": False},
+        ],
+    },
+    {
+        "type": "event",
+        "name": "BeaconUpgraded",
+        "inputs": [{"name": "beacon", "type": "address", "indexed": True}],
+    },
+    {
+        "type": "event",
+        "name": "Deposit",
+        "inputs": [
+            {"name": "dst", "type": "address", "indexed": True},
+            {"name": "wad", "type": "uint256", "indexed": False},
+        ],
+    },
+    {
+        "type": "event",
+        "name": "Withdrawal",
+        "inputs": [
+            {"name": "src", "type": "address", "indexed": True},
+            {"name": "wad", "type": "uint256", "indexed": False},
+        ],
+    },
+]
+
+
+class LogDecoder(BaseManager):
+    """
+    Decode logs from any contract, using an index of event ABIs by topic ID
+    (``topics[0]``) and topic count. The index holds the events of every cached
+    contract type as well as well-known standards, such as ERC-20 and ERC-721.
+    When the emitting contract's type is known, its own events take precedence,
+    which resolves ambiguous topic IDs.
+
+    Usage example::
+
+        from ape import chain
+
+        block_logs = chain.provider.make_request("eth_getLogs", [{"blockHash": block_hash}])
+        logs = chain.contracts.log_decoder.decode_logs(block_logs)
+    """
+
+    def __init__(self):
+        # (topic ID, topic count) -> event
+        self._events: dict[tuple[str, int], EventABI] = {}
+        # id(contract_type) -> (contract_type, topic ID -> event)
+        self._contract_events: LRUCache[int, tuple[ContractType, dict[str, EventABI]]] = LRUCache(
+            maxsize=1024
+        )
+        self._lock = threading.Lock()
+        self.register(*(EventABI.model_validate(data) for data in _STANDARD_EVENTS))
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def register(self, *events: EventABI):
+        """
+        Add events to the index. The first event registered
+        for a topic ID and topic count is the one used.
+
+        Args:
+            *events (EventABI): The events to add.
+        """
+        with self._lock:
+            for event in events:
+                if event.anonymous:
+                    # No topic ID to find it by.
+                    continue
+
+                key = (_get_topic_id(event), 1 + sum(1 for i in event.inputs if i.indexed))
+                self._events.setdefault(key, event)
+
+    def register_contract_type(self, contract_type: ContractType):
+        """
+        Add the events of a contract type to the index.
+
+        Args:
+            contract_type (ContractType): The contract type.
+        """
+        self.register(*self._get_contract_events(contract_type).values())
+
+    def get_event_abi(
+        self, topics: Sequence[str | bytes], contract_type: ContractType | None = None
+    ) -> EventABI | None:
+        """
+        Get the event ABI of a log.
+
+        Args:
+            topics (Sequence[str | bytes]): The topics of the log.
+            contract_type (ContractType | None): The type of the emitting contract,
+              if known. Its events are checked first.
+
+        Returns:
+            EventABI | None: The event, or ``None`` when not indexed.
+        """
+        if not topics:
+            # Anonymous.
+            return None
+
+        topic_id = encode_hex(topics[0]) if isinstance(topics[0], bytes) else topics[0].lower()
+        if contract_type is not None and (
+            event := self._get_contract_events(contract_type).get(topic_id)
+        ):
+            return event
+
+        return self._events.get((topic_id, len(topics)))
+
+    def decode_logs(
+        self, logs: Iterable[dict], fetch_contract_types: bool = True
+    ) -> ContractLogContainer:
+        """
+        Decode logs from any contracts, such as all the logs of a block, in one pass.
+        Logs that cannot be decoded are skipped.
+
+        Args:
+            logs (Iterable[dict]): The raw logs.
+            fetch_contract_types (bool): Set to ``False`` to avoid looking up the
+              contract types of the emitting contracts. Defaults to ``True``.
+
+        Returns:
+            :class:`~ape.types.events.ContractLogContainer`
+        """
+        log_list = list(logs)
+        contract_types: dict[AddressType, ContractType] = {}
+        if fetch_contract_types and log_list:
+            addresses = {log["address"] for log in log_list if log.get("address")}
+            contract_types = self.chain_manager.contracts.get_multiple(addresses)
+
+        ecosystem = self.provider.network.ecosystem
+        decoded_logs = ContractLogContainer()
+        for log in log_list:
+            address = log.get("address")
+            contract_type = (
+                contract_types.get(ecosystem.decode_address(address)) if address else None
+            )
+            if event := self.get_event_abi(log.get("topics") or [], contract_type):
+                decoded_logs.extend(ecosystem.decode_logs([log], event))
+
+        return decoded_logs
+
+    def _get_contract_events(self, contract_type: ContractType) -> dict[str, EventABI]:
+        # NOTE: Keyed by identity; the entry holds a reference to the contract type,
+        #  so the ID is not re-used while cached.
+        cached = self._contract_events.get(id(contract_type))
+        if cached is not None and cached[0] is contract_type:
+            return cached[1]
+
+        events = {_get_topic_id(e): e for e in contract_type.events if not e.anonymous}
+        self._contract_events[id(contract_type)] = (contract_type, events)
+        return events
+
+
+def _get_topic_id(event: EventABI) -> str:
+    return encode_hex(keccak(text=event.selector))
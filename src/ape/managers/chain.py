@@ -1,5 +1,5 @@
 from collections import defaultdict
-from collections.abc import Iterator
+from collections.abc import Iterable, Iterator
 from contextlib import contextmanager
 from datetime import datetime
 from functools import cached_property, partial, singledispatchmethod
@@ -16,6 +16,7 @@ from ape.api.providers import BlockAPI
 from ape.api.query import (
     AccountTransactionQuery,
     BlockQuery,
+    concat_columns,
     extract_fields,
     validate_and_expand_columns,
 )
@@ -35,7 +36,13 @@ from ape.managers._contractscache import ContractCache
 from ape.managers.base import BaseManager
 from ape.types.address import AddressType
 from ape.utils.basemodel import BaseInterfaceModel
-from ape.utils.misc import ZERO_ADDRESS, is_evm_precompile, is_zero_hex, log_instead_of_fail
+from ape.utils.misc import (
+    ZERO_ADDRESS,
+    LRUCache,
+    is_evm_precompile,
+    is_zero_hex,
+    log_instead_of_fail,
+)
 
 if TYPE_CHECKING:
     from rich.console import Console as RichConsole
@@ -167,20 +174,19 @@ class BlockContainer(BaseManager):
                 f"'stop={stop_block}' cannot be greater than the chain length ({self.height})."
             )
 
+        columns: list[str] = validate_and_expand_columns(  # type: ignore
+            columns, self.head.__class__
+        )
         query = BlockQuery(
-            columns=list(columns),
+            columns=columns,
             start_block=start_block,
             stop_block=stop_block,
             step=step,
         )
 
-        blocks = self.query_manager.query(query, engine_to_use=engine_to_use)
-        columns: list[str] = validate_and_expand_columns(  # type: ignore
-            columns, self.head.__class__
-        )
-        extraction = partial(extract_fields, columns=columns)
-        data = (extraction(b) for b in blocks)
-        return pd.DataFrame(columns=columns, data=data)
+        # NOTE: Built from columns so engines that can, skip creating a block per row.
+        batches = self.query_manager.query_columns(query, engine_to_use=engine_to_use)
+        return pd.DataFrame(concat_columns(batches, columns), columns=columns)
 
     def range(
         self,
@@ -743,7 +749,13 @@ class ChainManager(BaseManager):
     _block_container_map: ClassVar[dict[int, BlockContainer]] = {}
     _transaction_history_map: ClassVar[dict[int, TransactionHistory]] = {}
     _reports: ReportManager = ReportManager()
-    _code: ClassVar[dict[str, dict[str, dict[AddressType, "ContractCode"]]]] = {}
+    _code: ClassVar[dict[str, dict[str, LRUCache[AddressType, "ContractCode"]]]] = {}
+
+    code_cache_size: ClassVar[int] = 10_000
+    """
+    The most contract codes to keep in memory per network,
+    evicting the least-recently used.
+    """
 
     @cached_property
     def contracts(self) -> ContractCache:
@@ -1084,16 +1096,56 @@ class ChainManager(BaseManager):
         if skip_cache:
             return self.provider.get_code(address, block_id=block_id)
 
-        self._code.setdefault(network.ecosystem.name, {})
-        self._code[network.ecosystem.name].setdefault(network.name, {})
-        if address in self._code[network.ecosystem.name][network.name]:
-            return self._code[network.ecosystem.name][network.name][address]
+        cache = self._get_code_cache()
+        if (code := cache.get(address)) is not None:
+            return code
 
         # Get from RPC for the first time AND use cache.
         code = self.provider.get_code(address)
-        self._code[network.ecosystem.name][network.name][address] = code
+        cache[address] = code
         return code
 
+    def get_codes(
+        self, addresses: Iterable[AddressType], raise_on_error: bool = True
+    ) -> dict[AddressType, "ContractCode | Exception"]:
+        """
+        Get the code of many contracts, requesting only the ones not
+        already cached, all at once (see :meth:`~ape.api.providers.ProviderAPI.get_codes`).
+
+        Args:
+            addresses (Iterable[:class:`~ape.types.address.AddressType`]): The addresses.
+            raise_on_error (bool): Set to ``False`` to place errors in the
+              results instead of raising the first one. Defaults to ``True``.
+
+        Returns:
+            dict[AddressType, :class:`~ape.types.ContractCode`]: The code by address.
+        """
+        address_list = list(addresses)
+        network = self.provider.network
+        if network.is_dev:
+            results = self.provider.get_codes(address_list, raise_on_error=raise_on_error)
+            return dict(zip(address_list, results))
+
+        cache = self._get_code_cache()
+        codes = {a: code for a in dict.fromkeys(address_list) if (code := cache.get(a)) is not None}
+        if missing := [a for a in dict.fromkeys(address_list) if a not in codes]:
+            fetched = dict(
+                zip(missing, self.provider.get_codes(missing, raise_on_error=raise_on_error))
+            )
+            # NOTE: Errors are not cached, as they may be temporary.
+            cache.update({a: c for a, c in fetched.items() if not isinstance(c, Exception)})
+            codes.update(fetched)
+
+        return {address: codes[address] for address in address_list}
+
+    def _get_code_cache(self) -> LRUCache[AddressType, "ContractCode"]:
+        network = self.provider.network
+        networks = self._code.setdefault(network.ecosystem.name, {})
+        if network.name not in networks:
+            networks[network.name] = LRUCache(maxsize=self.code_cache_size)
+
+        return networks[network.name]
+
     def get_delegate(self, address: AddressType) -> BaseAddress | None:
         ecosystem = self.provider.network.ecosystem
 
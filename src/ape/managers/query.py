@@ -1,8 +1,13 @@
+import atexit
 import difflib
 import time
+from collections import deque
 from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from functools import cached_property, singledispatchmethod
-from itertools import tee
+from queue import Full, Queue
+from threading import Lock, Thread
+from weakref import WeakSet
 
 from ape.api.query import (
     AccountTransactionQuery,
@@ -12,6 +17,7 @@ from ape.api.query import (
     ContractEventQuery,
     QueryAPI,
     QueryType,
+    iter_column_batches,
 )
 from ape.api.transactions import ReceiptAPI, TransactionAPI
 from ape.contracts.base import ContractLog, LogFilter
@@ -30,14 +36,22 @@ class DefaultQueryProvider(QueryAPI):
     def __init__(self):
         self.supports_contract_creation = None
 
+    @property
+    def _block_page_size(self) -> int:
+        # NOTE: Each page of blocks is requested in a single batch.
+        return max(min(self.provider.block_page_size, self.provider.max_batch_size), 1)
+
     @singledispatchmethod
     def estimate_query(self, query: QueryType) -> int | None:  # type: ignore
         return None  # can't handle this query
 
     @estimate_query.register
     def estimate_block_query(self, query: BlockQuery) -> int | None:
-        # NOTE: Very loose estimate of 100ms per block
-        return (1 + query.stop_block - query.start_block) * 100
+        # NOTE: Very loose estimate of 250ms per page of blocks,
+        #       where `concurrency` pages are fetched at a time.
+        num_blocks = len(range(query.start_block, query.stop_block + 1, query.step))
+        num_pages = -(-num_blocks // self._block_page_size)
+        return -(-num_pages // max(self.provider.concurrency, 1)) * 250
 
     @estimate_query.register
     def estimate_block_transaction_query(self, query: BlockTransactionQuery) -> int:
@@ -61,12 +75,23 @@ class DefaultQueryProvider(QueryAPI):
 
     @perform_query.register
     def perform_block_query(self, query: BlockQuery) -> Iterator:
-        return map(
-            self.provider.get_block,
-            # NOTE: the range stop block is a non-inclusive stop.
-            #       Where the query method is an inclusive stop.
-            range(query.start_block, query.stop_block + 1, query.step),
-        )
+        # NOTE: the range stop block is a non-inclusive stop.
+        #       Where the query method is an inclusive stop.
+        block_numbers = range(query.start_block, query.stop_block + 1, query.step)
+        page_size = self._block_page_size
+        concurrency = max(self.provider.concurrency, 1)
+        with ThreadPoolExecutor(concurrency) as pool:
+            # NOTE: Only keep `concurrency` pages in-flight so blocks are yielded
+            #       incrementally (and in order) without buffering the whole range.
+            pages: deque[Future] = deque()
+            for start in range(0, len(block_numbers), page_size):
+                page = block_numbers[start : start + page_size]
+                pages.append(pool.submit(self.provider.get_blocks, page))
+                if len(pages) >= concurrency:
+                    yield from pages.popleft().result()
+
+            while pages:
+                yield from pages.popleft().result()
 
     @perform_query.register
     def perform_block_transaction_query(
@@ -98,6 +123,174 @@ class DefaultQueryProvider(QueryAPI):
         )
 
 
+# NOTE: Sentinels marking the end of a result stream in a cache-write queue.
+_RESULT_DONE = object()
+_RESULT_ABORTED = object()
+
+# NOTE: Flushed once at exit, rather than registering an exit hook per writer.
+_cache_writers: WeakSet["CacheWriter"] = WeakSet()
+
+
+@atexit.register
+def _flush_cache_writers():
+    for writer in list(_cache_writers):
+        writer.flush()
+
+
+class _ResultsAborted(Exception):
+    """
+    Raised to query engines updating their cache when the consumer of
+    the query stopped (or failed) before reaching the end of the results.
+    """
+
+
+class _CacheWriteJob:
+    def __init__(self, engine: QueryAPI, query: QueryType, max_queue_size: int):
+        self.engine = engine
+        self.query = query
+        self.queue: Queue = Queue(maxsize=max_queue_size)
+        self.thread: Thread | None = None
+        self.produced = False
+
+
+class CacheWriter:
+    """
+    Updates the caches of query engines in the background. Query results are
+    pushed to a bounded queue per engine that a background thread passes to
+    :meth:`~ape.api.query.QueryAPI.update_cache`. When a writer falls
+    ``max_queue_size`` results behind, the consumer of the query blocks
+    until it catches up.
+
+    Args:
+        max_queue_size (int): The max number of results waiting to be written
+          per engine.
+    """
+
+    def __init__(self, max_queue_size: int = 1000):
+        self.max_queue_size = max_queue_size
+        self._jobs: set[_CacheWriteJob] = set()
+        self._lock = Lock()
+
+        self.results_queued = 0
+        """The number of results queued for writing."""
+
+        self.results_written = 0
+        """The number of results passed to query engine caches."""
+
+        self.max_lag = 0
+        """The most results ever waiting to be written."""
+
+        self.blocked_time = 0.0
+        """Seconds spent waiting on writers to catch up (back-pressure)."""
+
+        _cache_writers.add(self)
+
+    @property
+    def lag(self) -> int:
+        """
+        The number of results waiting to be written.
+        """
+        return self.results_queued - self.results_written
+
+    def write(self, engines: list[QueryAPI], query: QueryType, result: Iterator) -> Iterator:
+        """
+        Pass-through the results of a query, writing them to the cache of each
+        given engine in the background. If the results are not fully consumed,
+        the caches are not updated.
+
+        Args:
+            engines (list[:class:`~ape.api.query.QueryAPI`]): The engines to update.
+            query (``QueryType``): The query that was executed.
+            result (Iterator): The results of the query.
+
+        Returns:
+            Iterator
+        """
+        jobs = [self._start(engine, query) for engine in engines]
+        completed = False
+        try:
+            for item in result:
+                for job in jobs:
+                    self._put(job, item)
+
+                yield item
+
+            completed = True
+
+        finally:
+            for job in jobs:
+                job.queue.put(_RESULT_DONE if completed else _RESULT_ABORTED)
+                job.produced = True
+
+    def flush(self, timeout: float | None = None):
+        """
+        Wait for all fully consumed query results to be written.
+
+        Args:
+            timeout (float | None): Max seconds to wait for each writer.
+        """
+        with self._lock:
+            jobs = [job for job in self._jobs if job.produced]
+
+        for job in jobs:
+            if job.thread is not None:
+                job.thread.join(timeout=timeout)
+
+    def _start(self, engine: QueryAPI, query: QueryType) -> _CacheWriteJob:
+        job = _CacheWriteJob(engine, query, self.max_queue_size)
+        job.thread = Thread(target=self._run, args=(job,), name="ape-cache-writer", daemon=True)
+        with self._lock:
+            self._jobs.add(job)
+
+        job.thread.start()
+        return job
+
+    def _put(self, job: _CacheWriteJob, item):
+        with self._lock:
+            self.results_queued += 1
+            self.max_lag = max(self.max_lag, self.lag)
+
+        try:
+            job.queue.put_nowait(item)
+        except Full:
+            start_time = time.perf_counter()
+            job.queue.put(item)
+            with self._lock:
+                self.blocked_time += time.perf_counter() - start_time
+
+    def _get_results(self, job: _CacheWriteJob) -> Iterator:
+        while (item := job.queue.get()) is not _RESULT_DONE:
+            if item is _RESULT_ABORTED:
+                raise _ResultsAborted("Query results were not fully consumed.")
+
+            with self._lock:
+                self.results_written += 1
+
+            yield item
+
+    def _run(self, job: _CacheWriteJob):
+        results = self._get_results(job)
+        try:
+            job.engine.update_cache(job.query, results)
+        except _ResultsAborted as err:
+            logger.debug(f"Not caching query: {err}")
+        except QueryEngineError as err:
+            logger.error(str(err))
+        except Exception as err:  # noqa: BLE001
+            logger.error(f"Failed to update cache: {err}")
+        finally:
+            # NOTE: Drain anything the engine did not use so the consumer never blocks.
+            try:
+                for _ in results:
+                    pass
+
+            except _ResultsAborted:
+                pass
+
+            with self._lock:
+                self._jobs.discard(job)
+
+
 class QueryManager(ManagerAccessMixin):
     """
     A singleton that manages query engines and performs queries.
@@ -124,32 +317,32 @@ class QueryManager(ManagerAccessMixin):
 
         for plugin_name, engine_class in self.plugin_manager.query_engines:
             engine_name = clean_plugin_name(plugin_name)
+            if engine_name in engines:
+                # NOTE: Plugins with more than one engine; name the others by their module.
+                module_name = engine_class.__module__.split(".")[-1]  # type: ignore
+                engine_name = f"{engine_name}-{clean_plugin_name(module_name)}"
+
             engines[engine_name] = engine_class()  # type: ignore
 
         return engines
 
-    def _suggest_engines(self, engine_selection):
-        return difflib.get_close_matches(engine_selection, list(self.engines), cutoff=0.6)
-
-    def query(
-        self,
-        query: QueryType,
-        engine_to_use: str | None = None,
-    ) -> Iterator[BaseInterfaceModel]:
+    @cached_property
+    def cache_writer(self) -> CacheWriter:
         """
-        Args:
-            query (``QueryType``): The type of query to execute
-            engine_to_use (str | None): Short-circuit selection logic using
-              a specific engine. Defaults is set by performance-based selection logic.
-
-        Raises:
-            :class:`~ape.exceptions.QueryEngineError`: When given an invalid or
-          inaccessible ``engine_to_use`` value.
+        The :class:`~ape.managers.query.CacheWriter` that updates the caches
+        of the query engines in the background.
 
         Returns:
-            Iterator[``BaseInterfaceModel``]
+            :class:`~ape.managers.query.CacheWriter`
         """
+        return CacheWriter()
 
+    def _suggest_engines(self, engine_selection):
+        return difflib.get_close_matches(engine_selection, list(self.engines), cutoff=0.6)
+
+    def _select_engine(
+        self, query: QueryType, engine_to_use: str | None
+    ) -> tuple[QueryAPI, int | None]:
         if engine_to_use:
             if engine_to_use not in self.engines:
                 raise QueryEngineError(
@@ -175,7 +368,11 @@ class QueryManager(ManagerAccessMixin):
             except ValueError as e:
                 raise QueryEngineError("No query engines are available.") from e
 
-        # Go fetch the result from the engine
+        return sel_engine, est_time
+
+    def _perform_query(
+        self, sel_engine: QueryAPI, est_time: int | None, query: QueryType, columnar: bool = False
+    ) -> Iterator:
         sel_engine_name = getattr(type(sel_engine), "__name__", None)
         query_type_name = getattr(type(query), "__name__", None)
         if not sel_engine_name:
@@ -187,7 +384,8 @@ class QueryManager(ManagerAccessMixin):
             logger.debug(f"{sel_engine_name}: {query_type_name}({query})")
 
         start_time = time.time_ns()
-        result = sel_engine.perform_query(query)
+        perform = sel_engine.perform_columnar_query if columnar else sel_engine.perform_query
+        result = perform(query)
         exec_time = (time.time_ns() - start_time) // 1000
 
         if sel_engine_name and query_type_name:
@@ -196,13 +394,79 @@ class QueryManager(ManagerAccessMixin):
                 f" executed in {exec_time} ms (expected: {est_time} ms)"
             )
 
-        # Update any caches
-        for engine in self.engines.values():
-            if not isinstance(engine, sel_engine.__class__):
-                result, cache_data = tee(result)
-                try:
-                    engine.update_cache(query, cache_data)
-                except QueryEngineError as err:
-                    logger.error(str(err))
+        return result
+
+    def _get_caching_engines(self, sel_engine: QueryAPI, query: QueryType) -> list[QueryAPI]:
+        return [
+            engine
+            for engine in self.engines.values()
+            if not isinstance(engine, sel_engine.__class__)
+            # NOTE: Skip engines that do not have a cache (or cannot store these results).
+            and engine.can_cache(query)
+        ]
+
+    def query(
+        self,
+        query: QueryType,
+        engine_to_use: str | None = None,
+    ) -> Iterator[BaseInterfaceModel]:
+        """
+        Args:
+            query (``QueryType``): The type of query to execute
+            engine_to_use (str | None): Short-circuit selection logic using
+              a specific engine. Defaults is set by performance-based selection logic.
+
+        Raises:
+            :class:`~ape.exceptions.QueryEngineError`: When given an invalid or
+          inaccessible ``engine_to_use`` value.
+
+        Returns:
+            Iterator[``BaseInterfaceModel``]
+        """
+        sel_engine, est_time = self._select_engine(query, engine_to_use)
+
+        # Go fetch the result from the engine
+        result = self._perform_query(sel_engine, est_time, query)
+
+        # Update any caches (in the background, as the results are consumed)
+        if caching_engines := self._get_caching_engines(sel_engine, query):
+            return self.cache_writer.write(caching_engines, query, result)
 
         return result
+
+    def query_columns(
+        self,
+        query: QueryType,
+        engine_to_use: str | None = None,
+    ) -> Iterator[dict[str, list]]:
+        """
+        Perform a query, getting the results as batches of columns, each mapping
+        the query's columns to lists of values. Engines able to produce columns
+        directly, such as from a database, skip creating an object per result.
+
+        Usage example::
+
+            batches = chain.query_manager.query_columns(query)
+            df = pd.DataFrame(concat_columns(batches, query.columns))
+
+        Args:
+            query (``QueryType``): The type of query to execute
+            engine_to_use (str | None): Short-circuit selection logic using
+              a specific engine. Defaults is set by performance-based selection logic.
+
+        Raises:
+            :class:`~ape.exceptions.QueryEngineError`: When given an invalid or
+          inaccessible ``engine_to_use`` value.
+
+        Returns:
+            Iterator[dict[str, list]]
+        """
+        sel_engine, est_time = self._select_engine(query, engine_to_use)
+        if caching_engines := self._get_caching_engines(sel_engine, query):
+            # NOTE: Caches are updated from the results themselves, so get those first.
+            result = self.cache_writer.write(
+                caching_engines, query, self._perform_query(sel_engine, est_time, query)
+            )
+            return iter_column_batches(result, query.columns, sel_engine.column_batch_size)
+
+        return self._perform_query(sel_engine, est_time, query, columnar=True)
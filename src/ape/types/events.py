@@ -352,6 +352,35 @@ class MockContractLog(BaseContractLog):
         return True
 
 
+LOG_COLUMNS = (
+    "block_number",
+    "block_hash",
+    "transaction_hash",
+    "transaction_index",
+    "log_index",
+    "contract_address",
+)
+"""
+The columns of logs decoded in columnar form, before the event-argument columns
+(see :meth:`~ape.api.networks.EcosystemAPI.decode_logs_columnar`).
+"""
+
+
+def _logs_to_columns(logs: Iterable[ContractLog], event: EventABI) -> dict[str, list]:
+    columns: dict[str, list] = {
+        name: [] for name in (*LOG_COLUMNS, *(i.name or "" for i in event.inputs))
+    }
+    for log in logs:
+        for name in LOG_COLUMNS:
+            columns[name].append(getattr(log, name))
+
+        for abi_input in event.inputs:
+            name = abi_input.name or ""
+            columns[name].append(log.event_arguments.get(name))
+
+    return columns
+
+
 class ContractLogContainer(list):
     """
     Container for ContractLogs which is adding capability of filtering logs
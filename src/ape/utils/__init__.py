@@ -37,6 +37,7 @@ def __getattr__(name: str):
         "DEFAULT_TRANSACTION_ACCEPTANCE_TIMEOUT",
         "EMPTY_BYTES32",
         "LOCAL_NETWORK_NAME",
+        "LRUCache",
         "SOURCE_EXCLUDE_PATTERNS",
         "ZERO_ADDRESS",
         "add_padding_to_strings",
@@ -147,6 +148,7 @@ __all__ = [
     "ExtraModelAttributes",
     "GeneratedDevAccount",
     "JoinableQueue",
+    "LRUCache",
     "LogInputABICollection",
     "ManagerAccessMixin",
     "RPCHeaders",
@@ -455,16 +455,24 @@ class LogInputABICollection:
         if len(set(names)) < len(names):
             raise ValueError("duplicate names found in log input", abi)
 
+        # Computed once, as the collection is re-used for every log of the event.
+        # NOTE: Reference types as indexed arguments are written as a hash
+        #  https://docs.soliditylang.org/en/v0.8.15/contracts.html#events
+        self.topic_types = [
+            "bytes32" if is_dynamic_sized_type(i.type) else i.canonical_type
+            for i in self.topic_abi_types
+        ]
+        self.data_types = [i.canonical_type for i in self.data_abi_types]
+
     @property
     def event_name(self):
         return self.abi.name
 
     def decode(self, topics: list[str], data: str | bytes, use_hex_on_fail: bool = False) -> dict:
         decoded = {}
-        for abi, topic_value in zip(self.topic_abi_types, topics[1:], strict=True):
-            # reference types as indexed arguments are written as a hash
-            # https://docs.soliditylang.org/en/v0.8.15/contracts.html#events
-            abi_type = "bytes32" if is_dynamic_sized_type(abi.type) else abi.canonical_type
+        for abi, abi_type, topic_value in zip(
+            self.topic_abi_types, self.topic_types, topics[1:], strict=True
+        ):
             hex_value = decode_hex(topic_value)
 
             try:
@@ -483,7 +491,7 @@ class LogInputABICollection:
                 result = self.decode_value(abi, value, abi_type_override=abi_type)
                 decoded[abi.name] = result
 
-        data_abi_types = [abi.canonical_type for abi in self.data_abi_types]
+        data_abi_types = self.data_types
         hex_data = decode_hex(data) if isinstance(data, str) else data
         try:
             data_values = decode(data_abi_types, hex_data)
@@ -513,13 +521,17 @@ class LogInputABICollection:
                     "However, we are able to get a value using decode(strict=False)"
                 )
                 logger.warn_from_exception(err, warning_message)
-                for abi, value in zip(self.data_abi_types, data_values, strict=True):
-                    decoded[abi.name] = self.decode_value(abi, value)
+                for abi, abi_type, value in zip(
+                    self.data_abi_types, data_abi_types, data_values, strict=True
+                ):
+                    decoded[abi.name] = self.decode_value(abi, value, abi_type_override=abi_type)
 
         else:
             # The data was formatted correctly and we were able to decode logs.
-            for abi, value in zip(self.data_abi_types, data_values, strict=True):
-                decoded[abi.name] = self.decode_value(abi, value)
+            for abi, abi_type, value in zip(
+                self.data_abi_types, data_abi_types, data_values, strict=True
+            ):
+                decoded[abi.name] = self.decode_value(abi, value, abi_type_override=abi_type)
 
         return decoded
 
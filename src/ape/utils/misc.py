@@ -3,6 +3,7 @@ import functools
 import inspect
 import json
 import sys
+import threading
 
 if sys.version_info >= (3, 11):
     # 3.11 or greater
@@ -12,13 +13,14 @@ else:
     import toml as tomllib  # type: ignore[no-redef]
 
 from asyncio import gather
-from collections.abc import Coroutine, Mapping
+from collections import OrderedDict
+from collections.abc import Coroutine, Iterator, Mapping, MutableMapping
 from datetime import datetime, timezone
 from functools import cached_property, singledispatchmethod, wraps
 from importlib.metadata import PackageNotFoundError, distributions
 from importlib.metadata import version as version_metadata
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, TypeVar, cast
+from typing import TYPE_CHECKING, Any, Generic, TypeVar, cast
 
 import yaml
 from eth_keys import keys  # type: ignore
@@ -496,6 +498,115 @@ def log_instead_of_fail(default: Any | None = None):
     return wrapper
 
 
+_KT = TypeVar("_KT")
+_VT = TypeVar("_VT")
+
+
+class LRUCache(MutableMapping[_KT, _VT], Generic[_KT, _VT]):
+    """
+    A thread-safe mapping holding up to ``maxsize`` items,
+    evicting the least-recently used item when full.
+    Counts hits, misses, and evictions, for tuning ``maxsize``.
+
+    Usage example::
+
+        from ape.utils import LRUCache
+
+        cache: LRUCache[str, int] = LRUCache(maxsize=2)
+        cache["a"] = 1
+        cache["b"] = 2
+        _ = cache["a"]
+        cache["c"] = 3  # Evicts "b".
+        assert cache.evictions == 1
+    """
+
+    def __init__(self, maxsize: int | None = 1024):
+        # NOTE: A ``maxsize`` of ``None`` means unbounded.
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._data: OrderedDict[_KT, _VT] = OrderedDict()
+        self._lock = threading.RLock()
+
+    def __getitem__(self, key: _KT) -> _VT:
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                raise
+
+            self.hits += 1
+            self._data.move_to_end(key)
+            return value
+
+    def __setitem__(self, key: _KT, value: _VT):
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if self.maxsize is None:
+                return
+
+            while len(self._data) > max(self.maxsize, 0):
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def __delitem__(self, key: _KT):
+        with self._lock:
+            del self._data[key]
+
+    def __contains__(self, key: object) -> bool:
+        # NOTE: Checking does not count as using the item.
+        return key in self._data
+
+    def __iter__(self) -> Iterator[_KT]:
+        with self._lock:
+            return iter(list(self._data))
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __repr__(self) -> str:
+        return (
+            f"<{type(self).__name__} size={len(self)} maxsize={self.maxsize} "
+            f"hits={self.hits} misses={self.misses} evictions={self.evictions}>"
+        )
+
+    def get(self, key: _KT, default: Any = None) -> Any:
+        with self._lock:
+            if key not in self._data:
+                self.misses += 1
+                return default
+
+            return self[key]
+
+    def items(self) -> list[tuple[_KT, _VT]]:  # type: ignore[override]
+        # NOTE: A snapshot, which does not count as using the items.
+        with self._lock:
+            return list(self._data.items())
+
+    def values(self) -> list[_VT]:  # type: ignore[override]
+        with self._lock:
+            return list(self._data.values())
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """
+        The number of items, hits, misses, and evictions.
+        """
+        return {
+            "size": len(self),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
 _MOD_T = TypeVar("_MOD_T")
 
 
@@ -1,11 +1,14 @@
 import json
 import os
 import re
+import sqlite3
 import stat
 import sys
 import tarfile
+import threading
 import zipfile
-from collections.abc import Callable, Iterator
+import zlib
+from collections.abc import Callable, Iterable, Iterator
 from contextlib import contextmanager
 from fnmatch import fnmatch
 from importlib.metadata import PackageNotFoundError, distribution
@@ -444,6 +447,128 @@ class CacheDirectory:
         file.unlink(missing_ok=True)
 
 
+class CacheDatabase:
+    """
+    A single-file SQLite database for caching data, as an alternative to
+    :class:`~ape.utils.os.CacheDirectory` for caches with many items.
+    Items are stored as compressed JSON, by kind (e.g. ``"contract_types"``)
+    and key. Writes are atomic and bulk writes use a single transaction.
+    """
+
+    def __init__(self, path: Path, kind: str):
+        if path.is_dir():
+            raise ValueError("Expecting file.")
+
+        self._path = path
+        self.kind = kind
+        self._lock = threading.Lock()
+        self._connection: sqlite3.Connection | None = None
+
+    def __getitem__(self, key: str) -> dict:
+        return self.get_data(key)
+
+    def __setitem__(self, key: str, value: dict):
+        self.cache_data(key, value)
+
+    def __delitem__(self, key: str):
+        self.delete_data(key)
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(self._path, check_same_thread=False, timeout=30)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS cache "
+                "(kind TEXT NOT NULL, key TEXT NOT NULL, value BLOB NOT NULL, "
+                "PRIMARY KEY (kind, key))"
+            )
+            connection.commit()
+            self._connection = connection
+
+        return self._connection
+
+    def cache_data(self, key: str, data: dict):
+        self.put_many({key: data})
+
+    def get_data(self, key: str) -> dict:
+        return self.get_many([key]).get(key, {})
+
+    def delete_data(self, key: str):
+        with self._lock, self.connection:
+            self.connection.execute(
+                "DELETE FROM cache WHERE kind = ? AND key = ?", (self.kind, key)
+            )
+
+    def clear(self):
+        """
+        Delete all the data of this kind.
+        """
+        with self._lock, self.connection:
+            self.connection.execute("DELETE FROM cache WHERE kind = ?", (self.kind,))
+
+    def get_many(self, keys: Iterable[str]) -> dict[str, dict]:
+        """
+        Get the data for many keys at once. Missing keys are not included.
+        """
+        key_list = list(keys)
+        result: dict[str, dict] = {}
+        # NOTE: Chunked to stay under SQLite's max variables.
+        for start in range(0, len(key_list), 500):
+            chunk = key_list[start : start + 500]
+            placeholders = ", ".join("?" for _ in chunk)
+            with self._lock:
+                rows = self.connection.execute(
+                    f"SELECT key, value FROM cache WHERE kind = ? AND key IN ({placeholders})",
+                    (self.kind, *chunk),
+                ).fetchall()
+
+            for key, value in rows:
+                result[key] = json.loads(zlib.decompress(value))
+
+        return result
+
+    def put_many(self, items: dict[str, dict]):
+        """
+        Cache the data for many keys in a single transaction.
+        """
+        rows = [
+            (self.kind, key, zlib.compress(json.dumps(data).encode("utf8")))
+            for key, data in items.items()
+        ]
+        with self._lock, self.connection:
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO cache (kind, key, value) VALUES (?, ?, ?)", rows
+            )
+
+    def import_directory(self, directory: CacheDirectory):
+        """
+        Move the items of a :class:`~ape.utils.os.CacheDirectory`
+        (one ``<key>.json`` file per item) into the database.
+        """
+        path = directory._path
+        if not path.is_dir():
+            return
+
+        files = [file for file in path.glob("*.json") if file.is_file()]
+        items = {}
+        for file in files:
+            try:
+                items[file.stem] = json.loads(file.read_text(encoding="utf8"))
+            except ValueError:
+                # Corrupt; not worth migrating.
+                continue
+
+        self.put_many(items)
+        for file in files:
+            file.unlink(missing_ok=True)
+
+        if not any(path.iterdir()):
+            path.rmdir()
+
+
 @contextmanager
 def within_directory(directory: Path):
     """
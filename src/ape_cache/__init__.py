@@ -13,7 +13,10 @@ def config_class():
 @register(QueryPlugin)
 def query_engines():
     query = import_module("ape_cache.query")
-    return query.CacheQueryProvider
+    yield query.CacheQueryProvider
+
+    parquet = import_module("ape_cache.parquet")
+    yield parquet.ParquetQueryProvider
 
 
 def __getattr__(name):
@@ -21,6 +24,10 @@ def __getattr__(name):
         module = import_module("ape_cache.query")
         return module.CacheQueryProvider
 
+    elif name == "ParquetQueryProvider":
+        module = import_module("ape_cache.parquet")
+        return module.ParquetQueryProvider
+
     elif name == "CacheConfig":
         module = import_module("ape_cache.config")
         return module.CacheConfig
@@ -32,4 +39,5 @@ def __getattr__(name):
 __all__ = [
     "CacheConfig",
     "CacheQueryProvider",
+    "ParquetQueryProvider",
 ]
@@ -1,4 +1,5 @@
 from importlib import import_module
+from pathlib import Path
 from typing import TYPE_CHECKING
 
 import click
@@ -9,6 +10,7 @@ from ape.cli.options import network_option
 from ape.logging import logger
 
 if TYPE_CHECKING:
+    from ape_cache.parquet import ParquetQueryProvider
     from ape_cache.query import CacheQueryProvider
 
 
@@ -18,6 +20,12 @@ def get_engine() -> "CacheQueryProvider":
     return ManagerAccessMixin.query_manager.engines["cache"]
 
 
+def get_parquet_engine() -> "ParquetQueryProvider":
+    from ape.utils.basemodel import ManagerAccessMixin
+
+    return ManagerAccessMixin.query_manager.engines["cache-parquet"]
+
+
 @click.group(short_help="Query from caching database")
 def cli():
     """
@@ -81,3 +89,57 @@ def purge(cli_ctx, ecosystem, network):
 
     get_engine().purge_database(ecosystem.name, network.name)
     logger.success(f"Caching database purged for {ecosystem.name}:{network.name}.")
+
+
+@cli.command(name="export", short_help="Export the database to Parquet files")
+@ape_cli_context()
+@network_option(required=True)
+@click.argument("directory", type=click.Path(file_okay=False, path_type=Path), required=False)
+@click.option(
+    "--partition-size",
+    type=click.IntRange(min=1),
+    default=None,
+    help="The number of blocks in each file. Defaults to 100,000.",
+)
+def export_cmd(cli_ctx, ecosystem, network, directory, partition_size):
+    """
+    Exports the blocks, transactions, and contract events of the database
+    to Parquet files, partitioned by block range.
+
+    Without a directory, the files are exported next to the database,
+    where the ``cache-parquet`` query engine answers queries from them.
+    """
+    from ape_cache.parquet import DEFAULT_PARTITION_SIZE, export_parquet
+
+    if (engine := get_engine()._get_engine(ecosystem.name, network.name)) is None:
+        cli_ctx.abort(f"Caching database not initialized for {ecosystem.name}:{network.name}.")
+
+    directory = directory or get_parquet_engine().get_directory(ecosystem.name, network.name)
+    with engine.connect() as conn:
+        counts = export_parquet(conn, directory, partition_size or DEFAULT_PARTITION_SIZE)
+
+    summary = ", ".join(f"{count} {name}" for name, count in counts.items())
+    logger.success(f"Exported {summary} to '{directory}'.")
+
+
+@cli.command(name="import", short_help="Import Parquet files into the database")
+@ape_cli_context()
+@network_option(required=True)
+@click.argument("directory", type=click.Path(exists=True, file_okay=False, path_type=Path))
+def import_cmd(cli_ctx, ecosystem, network, directory):
+    """
+    Imports the Parquet files made by ``ape cache export`` into the database,
+    initializing it if needed. Rows that are already stored are skipped.
+    """
+    from ape_cache.parquet import import_parquet
+
+    cache = get_engine()
+    if (engine := cache._get_engine(ecosystem.name, network.name)) is None:
+        cache.init_database(ecosystem.name, network.name)
+        engine = cache._get_engine(ecosystem.name, network.name)
+
+    with engine.begin() as conn:  # type: ignore[union-attr]
+        counts = import_parquet(cache, conn, directory)
+
+    summary = ", ".join(f"{count} {name}" for name, count in counts.items())
+    logger.success(f"Imported {summary} from '{directory}'.")
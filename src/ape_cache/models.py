@@ -62,6 +62,8 @@ class ContractEvents(Base):
 
     id = Column(Integer, primary_key=True, index=True)
     event_name = Column(String, nullable=False, index=True)
+    # NOTE: The event signature, which (unlike the name) tells overloaded events apart.
+    event_selector = Column(String, index=True)
     contract_address = Column(HexByteString, nullable=False, index=True)
     event_arguments = Column(JSON, index=True)
     transaction_hash = Column(HexByteString, nullable=False, index=True)
@@ -69,3 +71,17 @@ class ContractEvents(Base):
     block_hash = Column(HexByteString, nullable=False, index=True)
     log_index = Column(Integer, nullable=False, index=True)
     transaction_index = Column(Integer, nullable=False, index=True)
+
+
+class QueryCoverage(Base):
+    """
+    Inclusive block ranges (per table and key) that are fully stored in the cache.
+    """
+
+    __tablename__ = "query_coverage"  # type: ignore
+
+    id = Column(Integer, primary_key=True, index=True)
+    table_name = Column(String, nullable=False, index=True)
+    key = Column(String, nullable=False, index=True)
+    start_block = Column(Integer, nullable=False)
+    stop_block = Column(Integer, nullable=False)
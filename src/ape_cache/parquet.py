@@ -0,0 +1,461 @@
+import json
+from collections.abc import Iterator, Sequence
+from decimal import Decimal
+from functools import singledispatchmethod
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import JSON, Integer, LargeBinary, Numeric, Table, func, select
+from sqlalchemy.engine import Connection
+from sqlalchemy.sql import insert
+
+from ape.api.providers import BlockAPI
+from ape.api.query import BlockQuery, ContractEventQuery, QueryAPI, QueryType
+from ape.exceptions import QueryEngineError
+from ape.logging import logger
+from ape.types.events import ContractLog
+
+from .models import Blocks, ContractEvents, HexByteString, QueryCoverage, Transactions
+from .query import (
+    _COLUMN_CONVERTERS,
+    _get_coverage_keys,
+    _intersect_ranges,
+    _merge_ranges,
+    _to_checksum_address,
+)
+
+if TYPE_CHECKING:
+    import pyarrow as pa  # type: ignore[import-not-found]
+
+    from ape_cache.query import CacheQueryProvider
+
+# The block range of each Parquet file, by default
+DEFAULT_PARTITION_SIZE = 100_000
+
+_COVERAGE_FILE_NAME = f"{QueryCoverage.__tablename__}.parquet"
+
+# The exported tables and the column of the block number to partition them by.
+_TABLES: dict[str, tuple[Table, str]] = {
+    Blocks.__tablename__: (Blocks.__table__, "number"),  # type: ignore[dict-item]
+    # NOTE: Transactions are partitioned by the number of their block (joined when exporting).
+    Transactions.__tablename__: (Transactions.__table__, "block_number"),  # type: ignore[dict-item]
+    ContractEvents.__tablename__: (ContractEvents.__table__, "block_number"),  # type: ignore
+}
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow as pa  # type: ignore[import-not-found]
+        import pyarrow.parquet as pq  # type: ignore[import-not-found]
+    except ImportError as err:
+        raise QueryEngineError(
+            "Parquet support requires `pyarrow`. Install it using `pip install eth-ape[parquet]`."
+        ) from err
+
+    return pa, pq
+
+
+def _get_columns(table: Table) -> list:
+    # NOTE: Row IDs are specific to a database.
+    return [c for c in table.columns if c.key != "id"]
+
+
+def _get_arrow_type(pa, column) -> "pa.DataType":
+    if isinstance(column.type, (HexByteString, LargeBinary)):
+        return pa.binary()
+
+    elif isinstance(column.type, Numeric):
+        # NOTE: Stored as text, because values such as wei amounts can exceed 64-bit integers.
+        return pa.string()
+
+    elif isinstance(column.type, Integer):
+        return pa.int64()
+
+    return pa.string()
+
+
+def _to_arrow_value(value: Any) -> Any:
+    if isinstance(value, Decimal):
+        return str(int(value))
+
+    elif isinstance(value, dict):
+        return json.dumps(value)
+
+    return value
+
+
+def _from_arrow_value(column, value: Any) -> Any:
+    if value is None:
+        return None
+
+    elif isinstance(column.type, Numeric):
+        return int(value)
+
+    elif isinstance(column.type, JSON):
+        return json.loads(value)
+
+    return value
+
+
+def _get_partitions(directory: Path, table_name: str, start: int, stop: int) -> list[Path]:
+    # NOTE: Files are named by the (inclusive) block range they hold.
+    partitions = []
+    for path in sorted((directory / table_name).glob("*.parquet")):
+        first, last = (int(n) for n in path.stem.split("-"))
+        if first <= stop and last >= start:
+            partitions.append(path)
+
+    return partitions
+
+
+def export_parquet(
+    conn: Connection, directory: Path, partition_size: int = DEFAULT_PARTITION_SIZE
+) -> dict[str, int]:
+    """
+    Export the blocks, transactions, and contract events of a cache database
+    to Parquet files, partitioned by block range, replacing any previous export.
+
+    Args:
+        conn (`sqlalchemy.engine.Connection`): The cache database connection.
+        directory (Path): The directory to export to.
+        partition_size (int): The number of blocks in each file.
+          Defaults to ``100_000``.
+
+    Returns:
+        dict[str, int]: The number of rows exported per table.
+    """
+    pa, pq = _import_pyarrow()
+    counts: dict[str, int] = {}
+    for table_name, (table, number_key) in _TABLES.items():
+        columns = _get_columns(table)
+        from_clause: Any = table
+        if table_name == Transactions.__tablename__:
+            from_clause = table.join(Blocks.__table__, Transactions.block_hash == Blocks.hash)
+            number_column = Blocks.number.label(number_key)
+            columns = [*columns, number_column]
+        else:
+            number_column = table.columns[number_key]
+
+        order_by = [number_column]
+        if "log_index" in table.columns:
+            order_by.append(table.columns["log_index"])
+
+        table_dir = directory / table_name
+        table_dir.mkdir(parents=True, exist_ok=True)
+        for path in table_dir.glob("*.parquet"):
+            path.unlink()
+
+        schema = pa.schema(
+            [
+                pa.field(c.key, pa.int64() if c.key == number_key else _get_arrow_type(pa, c))
+                for c in columns
+            ]
+        )
+        counts[table_name] = 0
+        first, last = conn.execute(
+            select(func.min(number_column), func.max(number_column)).select_from(from_clause)
+        ).one()
+        if first is None:
+            continue
+
+        for start in range(first - first % partition_size, last + 1, partition_size):
+            stop = start + partition_size - 1
+            rows = conn.execute(
+                select(*columns)
+                .select_from(from_clause)
+                .where(number_column >= start)
+                .where(number_column <= stop)
+                .order_by(*order_by)
+            ).fetchall()
+            if not rows:
+                continue
+
+            data = {
+                c.key: [_to_arrow_value(v) for v in values]
+                for c, values in zip(columns, zip(*rows))
+            }
+            pq.write_table(
+                pa.table(data, schema=schema), table_dir / f"{start:012d}-{stop:012d}.parquet"
+            )
+            counts[table_name] += len(rows)
+
+    coverage_columns = _get_columns(QueryCoverage.__table__)  # type: ignore[arg-type]
+    rows = conn.execute(select(*coverage_columns)).fetchall()
+    pq.write_table(
+        pa.table(
+            {c.key: list(values) for c, values in zip(coverage_columns, zip(*rows))}
+            if rows
+            else {c.key: [] for c in coverage_columns},
+            schema=pa.schema([pa.field(c.key, _get_arrow_type(pa, c)) for c in coverage_columns]),
+        ),
+        directory / _COVERAGE_FILE_NAME,
+    )
+    return counts
+
+
+def import_parquet(
+    cache: "CacheQueryProvider", conn: Connection, directory: Path
+) -> dict[str, int]:
+    """
+    Import the Parquet files made by :func:`~ape_cache.parquet.export_parquet`
+    into a cache database. Rows that are already stored are skipped.
+
+    Args:
+        cache (:class:`~ape_cache.query.CacheQueryProvider`): The cache engine.
+        conn (`sqlalchemy.engine.Connection`): The cache database connection.
+        directory (Path): The directory to import from.
+
+    Returns:
+        dict[str, int]: The number of rows read per table.
+    """
+    _, pq = _import_pyarrow()
+    if not (directory / _COVERAGE_FILE_NAME).is_file():
+        raise QueryEngineError(f"'{directory}' is not a Parquet export.")
+
+    counts: dict[str, int] = {}
+    for table_name, (table, number_key) in _TABLES.items():
+        columns = {c.key: c for c in _get_columns(table)}
+        counts[table_name] = 0
+        for path in _get_partitions(directory, table_name, 0, 2**63 - 1):
+            data = pq.read_table(path, columns=list(columns)).to_pydict()
+            rows = [
+                {key: _from_arrow_value(columns[key], v) for key, v in zip(data, values)}
+                for values in zip(*data.values())
+            ]
+            counts[table_name] += len(rows)
+            if table_name == ContractEvents.__tablename__ and rows:
+                # NOTE: Events have no unique key, so skip the ones already stored.
+                stored = set(
+                    conn.execute(
+                        select(ContractEvents.block_number, ContractEvents.log_index)
+                        .where(ContractEvents.block_number >= rows[0][number_key])
+                        .where(ContractEvents.block_number <= rows[-1][number_key])
+                    ).tuples()
+                )
+                rows = [r for r in rows if (r["block_number"], r["log_index"]) not in stored]
+
+            if rows:
+                conn.execute(insert(table).prefix_with("OR IGNORE"), rows)
+
+    coverage = pq.read_table(directory / _COVERAGE_FILE_NAME).to_pylist()
+    for row in coverage:
+        cache._add_coverage(
+            conn, row["table_name"], row["key"], row["start_block"], row["stop_block"]
+        )
+
+    return counts
+
+
+class ParquetQueryProvider(QueryAPI):
+    """
+    Answers block and contract-event queries from the Parquet files made by
+    ``ape cache export``, only reading the files of the queried block range
+    and the queried columns. Only queries fully covered by the export are
+    answered.
+    """
+
+    def __init__(self):
+        # directory -> (modified time, coverage rows)
+        self._coverage: dict[Path, tuple[float, list[dict]]] = {}
+
+    def get_directory(self, ecosystem_name: str, network_name: str) -> Path:
+        """
+        The default directory of the Parquet files of a network.
+
+        Args:
+            ecosystem_name (str): Name of the ecosystem (ex: ethereum)
+            network_name (str): Name of the network (ex: mainnet)
+
+        Returns:
+            Path
+        """
+        # NOTE: Next to the cache database.
+        cache = self.query_manager.engines["cache"]
+        return cache._get_database_file(ecosystem_name, network_name).parent / "parquet"
+
+    @property
+    def directory(self) -> Path | None:
+        """
+        The directory of the Parquet files for the connected network,
+        or ``None`` when there are none.
+        """
+        network = self.provider.network
+        if network.is_local:
+            return None
+
+        directory = self.get_directory(network.ecosystem.name, network.name)
+        return directory if (directory / _COVERAGE_FILE_NAME).is_file() else None
+
+    def _get_coverage(self, directory: Path) -> list[dict]:
+        path = directory / _COVERAGE_FILE_NAME
+        modified = path.stat().st_mtime
+        cached = self._coverage.get(directory)
+        if cached is None or cached[0] != modified:
+            _, pq = _import_pyarrow()
+            cached = (modified, pq.read_table(path).to_pylist())
+            self._coverage[directory] = cached
+
+        return cached[1]
+
+    def _is_covered(self, directory: Path, query: QueryType) -> bool:
+        if (coverage_keys := _get_coverage_keys(query)) is None:
+            return False
+
+        table_name, keys = coverage_keys
+        start, stop = query.start_block, query.stop_block  # type: ignore[union-attr]
+        rows = self._get_coverage(directory)
+        covered: list[tuple[int, int]] | None = None
+        for key in keys:
+            ranges = _merge_ranges(
+                (max(r["start_block"], start), min(r["stop_block"], stop))
+                for r in rows
+                if r["table_name"] == table_name
+                and r["key"] == key
+                and r["start_block"] <= stop
+                and r["stop_block"] >= start
+            )
+            covered = ranges if covered is None else _intersect_ranges(covered, ranges)
+
+        return covered == [(start, stop)]
+
+    def estimate_query(self, query: QueryType) -> int | None:
+        """
+        Method called by the client to return a query time estimate.
+        Only block and contract-event queries fully covered by the
+        exported files are estimated.
+
+        Args:
+            query (QueryType): The query.
+
+        Returns:
+            int | None
+        """
+        if not isinstance(query, (BlockQuery, ContractEventQuery)):
+            return None
+
+        try:
+            if (directory := self.directory) is None or not self._is_covered(directory, query):
+                return None
+
+        except QueryEngineError as err:
+            # NOTE: `pyarrow` is not installed.
+            logger.debug(str(err))
+            return None
+
+        # NOTE: Assume 100 msec to read the files
+        return 100
+
+    @singledispatchmethod
+    def perform_query(self, query: QueryType) -> Iterator:  # type: ignore[override]
+        raise QueryEngineError(f"Cannot handle '{type(query)}'.")
+
+    @perform_query.register
+    def _perform_block_query(self, query: BlockQuery) -> Iterator[BlockAPI]:
+        ecosystem = self.provider.network.ecosystem
+        for batch in self._read(query, [c.key for c in _get_columns(Blocks.__table__)]):
+            for values in zip(*batch.values()):
+                yield ecosystem.decode_block(dict(zip(batch, values)))
+
+    @perform_query.register
+    def _perform_contract_events_query(self, query: ContractEventQuery) -> Iterator[ContractLog]:
+        columns = [
+            c.key
+            for c in _get_columns(ContractEvents.__table__)  # type: ignore[arg-type]
+            if c.key != "event_selector"
+        ]
+        for batch in self._read(query, columns):
+            batch["contract_address"] = [_to_checksum_address(a) for a in batch["contract_address"]]
+            for values in zip(*batch.values()):
+                yield ContractLog.model_validate(dict(zip(batch, values)))
+
+    def perform_columnar_query(self, query: QueryType) -> Iterator[dict[str, list]]:
+        """
+        Performs the requested query, reading the columns straight
+        from the files rather than creating an object per row.
+
+        Args:
+            query (QueryType): The query.
+
+        Returns:
+            Iterator[dict[str, list]]
+        """
+        if isinstance(query, BlockQuery):
+            table: Table = Blocks.__table__  # type: ignore[assignment]
+        elif isinstance(query, ContractEventQuery):
+            table = ContractEvents.__table__  # type: ignore[assignment]
+        else:
+            raise QueryEngineError(f"Cannot handle '{type(query)}'.")
+
+        stored = {c.key for c in _get_columns(table)}
+        if isinstance(query, ContractEventQuery):
+            # NOTE: Removed logs are never stored.
+            stored.add("removed")
+
+        if any(c not in stored for c in query.columns):
+            # NOTE: Properties of the results need the decoded results.
+            return super().perform_columnar_query(query)
+
+        return self._read_columns(query)
+
+    def _read_columns(self, query: QueryType) -> Iterator[dict[str, list]]:
+        selected = [c for c in query.columns if c != "removed"]
+        for batch in self._read(query, selected):
+            columns = {
+                col: (
+                    [False] * len(next(iter(batch.values())))
+                    if col == "removed"
+                    else (
+                        [convert(v) for v in batch[col]]
+                        if (convert := _COLUMN_CONVERTERS.get(col))
+                        else batch[col]
+                    )
+                )
+                for col in query.columns
+            }
+            yield columns
+
+    def _read(self, query: QueryType, columns: Sequence[str]) -> Iterator[dict[str, list]]:
+        # NOTE: The batches also have the block number column.
+        _, pq = _import_pyarrow()
+        if (directory := self.directory) is None:
+            raise QueryEngineError("No Parquet files for this network.")
+
+        if isinstance(query, BlockQuery):
+            table_name, number_key = Blocks.__tablename__, "number"
+            filters = []
+        else:
+            event_query: ContractEventQuery = query  # type: ignore[assignment]
+            table_name, number_key = ContractEvents.__tablename__, "block_number"
+            addresses = (
+                event_query.contract
+                if isinstance(event_query.contract, list)
+                else [event_query.contract]
+            )
+            filters = [
+                ("contract_address", "in", [bytes.fromhex(a[2:]) for a in addresses]),
+                ("event_selector", "=", event_query.event.selector),
+            ]
+
+        table, _ = _TABLES[table_name]
+        table_columns = table.columns
+        start, stop = query.start_block, query.stop_block  # type: ignore[union-attr]
+        step = query.step  # type: ignore[union-attr]
+        filters = [*filters, (number_key, ">=", start), (number_key, "<=", stop)]
+        read_columns = list(dict.fromkeys([*columns, number_key]))
+        for path in _get_partitions(directory, table_name, start, stop):
+            # NOTE: Only the needed columns (and row groups) of the file are read.
+            data = pq.read_table(path, columns=read_columns, filters=filters)
+            if data.num_rows == 0:
+                continue
+
+            for record_batch in data.to_batches(max_chunksize=self.column_batch_size):
+                batch = record_batch.to_pydict()
+                keep = None if step == 1 else [(n - start) % step == 0 for n in batch[number_key]]
+                yield {
+                    col: [
+                        _from_arrow_value(table_columns[col], v)
+                        for i, v in enumerate(batch[col])
+                        if keep is None or keep[i]
+                    ]
+                    for col in read_columns
+                }
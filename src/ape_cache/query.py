@@ -1,12 +1,18 @@
-from collections.abc import Iterator
-from functools import singledispatchmethod
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from decimal import Decimal
+from functools import singledispatch, singledispatchmethod
+from itertools import islice
 from pathlib import Path
+from threading import Lock
 from typing import Any, cast
 
-from sqlalchemy import create_engine, func
-from sqlalchemy.engine import CursorResult
-from sqlalchemy.sql import column, insert, select
-from sqlalchemy.sql.expression import Insert, Select
+from eth_pydantic_types import HexBytes
+from eth_utils import to_checksum_address
+from sqlalchemy import create_engine, delete, event, inspect, literal, text
+from sqlalchemy.engine import Connection, Engine, Row
+from sqlalchemy.pool import QueuePool
+from sqlalchemy.sql import Select, insert, select
+from sqlalchemy.sql.expression import Insert
 
 from ape.api.providers import BlockAPI
 from ape.api.query import (
@@ -16,6 +22,7 @@ from ape.api.query import (
     ContractEventQuery,
     QueryAPI,
     QueryType,
+    iter_column_batches,
 )
 from ape.api.transactions import TransactionAPI
 from ape.exceptions import QueryEngineError
@@ -24,7 +31,7 @@ from ape.types.events import ContractLog
 from ape.utils.misc import LOCAL_NETWORK_NAME
 
 from . import models
-from .models import Blocks, ContractEvents, Transactions
+from .models import Blocks, ContractEvents, QueryCoverage, Transactions
 
 
 class CacheQueryProvider(QueryAPI):
@@ -36,6 +43,15 @@ class CacheQueryProvider(QueryAPI):
     # Class var for tracking if we detect a scenario where the cache db isn't working
     database_bypass = False
 
+    # The number of results inserted at a time when updating the cache
+    cache_write_chunk_size = 1000
+
+    def __init__(self):
+        # NOTE: Engines are created once per (ecosystem, network) and shared
+        #   by all threads (e.g. when the provider fetches logs concurrently).
+        self._engines: dict[tuple[str, str], Engine] = {}
+        self._engines_lock = Lock()
+
     def _get_database_file(self, ecosystem_name: str, network_name: str) -> Path:
         """
         Allows us to figure out what the file *will be*, mostly used for database management.
@@ -71,6 +87,77 @@ class CacheQueryProvider(QueryAPI):
 
         return f"sqlite:///{database_file}"
 
+    def _create_engine(self, database_file: Path) -> Engine:
+        engine = create_engine(
+            self._get_sqlite_uri(database_file),
+            poolclass=QueuePool,
+            pool_pre_ping=True,
+            # NOTE: Connections are shared across threads via the pool.
+            connect_args={"check_same_thread": False},
+        )
+        mmap_size = self.config_manager.get_config("cache").size
+
+        @event.listens_for(engine, "connect")
+        def set_sqlite_pragmas(dbapi_connection, connection_record):
+            cursor = dbapi_connection.cursor()
+            # NOTE: WAL allows reading while another connection is writing.
+            cursor.execute("PRAGMA journal_mode=WAL")
+            # NOTE: NORMAL is safe from corruption when using WAL.
+            cursor.execute("PRAGMA synchronous=NORMAL")
+            cursor.execute(f"PRAGMA mmap_size={int(mmap_size)}")
+            # NOTE: Negative values are in KiB (~64MB).
+            cursor.execute("PRAGMA cache_size=-64000")
+            cursor.execute("PRAGMA temp_store=MEMORY")
+            cursor.execute("PRAGMA busy_timeout=5000")
+            cursor.close()
+
+        return engine
+
+    def _get_engine(self, ecosystem_name: str, network_name: str) -> Engine | None:
+        key = (ecosystem_name, network_name)
+        if engine := self._engines.get(key):
+            return engine
+
+        with self._engines_lock:
+            if engine := self._engines.get(key):
+                # Created by another thread while waiting.
+                return engine
+
+            database_file = self._get_database_file(ecosystem_name, network_name)
+            if not database_file.is_file():
+                return None
+
+            engine = self._create_engine(database_file)
+            # NOTE: Adds any tables missing from databases made by older versions.
+            models.Base.metadata.create_all(bind=engine)  # type: ignore
+            self._migrate_database(engine)
+            self._engines[key] = engine
+            return engine
+
+    def _migrate_database(self, engine: Engine):
+        """
+        Add the columns missing from databases made by older versions.
+        """
+        table = ContractEvents.__table__  # type: ignore[attr-defined]
+        if "event_selector" in {c["name"] for c in inspect(engine).get_columns(table.name)}:
+            return
+
+        with engine.begin() as conn:
+            conn.execute(text(f"ALTER TABLE {table.name} ADD COLUMN event_selector VARCHAR"))
+            for index in table.indexes:
+                if "event_selector" in index.columns:
+                    index.create(bind=conn)
+
+            # NOTE: The stored events cannot be told apart from their overloads,
+            #   so they are removed (and re-fetched when next queried).
+            conn.execute(delete(ContractEvents))
+            conn.execute(delete(QueryCoverage).where(QueryCoverage.table_name == table.name))
+
+    def _dispose_engine(self, ecosystem_name: str, network_name: str):
+        with self._engines_lock:
+            if engine := self._engines.pop((ecosystem_name, network_name), None):
+                engine.dispose()
+
     def init_database(self, ecosystem_name: str, network_name: str):
         """
         Initialize the SQLite database for caching of provider data.
@@ -90,9 +177,10 @@ class CacheQueryProvider(QueryAPI):
         # NOTE: Make sure database folder location has been created
         database_file.parent.mkdir(exist_ok=True, parents=True)
 
-        models.Base.metadata.create_all(  # type: ignore
-            bind=create_engine(self._get_sqlite_uri(database_file), pool_pre_ping=True)
-        )
+        engine = self._create_engine(database_file)
+        models.Base.metadata.create_all(bind=engine)  # type: ignore
+        with self._engines_lock:
+            self._engines[(ecosystem_name, network_name)] = engine
 
     def purge_database(self, ecosystem_name: str, network_name: str):
         """
@@ -110,21 +198,22 @@ class CacheQueryProvider(QueryAPI):
         if not database_file.is_file():
             raise QueryEngineError("Database must be initialized")
 
+        self._dispose_engine(ecosystem_name, network_name)
         database_file.unlink()
+        for suffix in ("-wal", "-shm"):
+            # NOTE: Left over from WAL journaling.
+            database_file.with_name(f"{database_file.name}{suffix}").unlink(missing_ok=True)
 
     @property
-    def database_connection(self):
+    def database_engine(self) -> Engine | None:
         """
-        Returns a connection for the currently active network.
-
-        **NOTE**: Creates a database if it doesn't exist.
+        Returns the (shared) engine for the currently active network.
 
         Raises:
-            :class:`~ape.exceptions.QueryEngineError`: If you are not connected to a provider,
-                or if the database has not been initialized.
+            :class:`~ape.exceptions.QueryEngineError`: If you are not connected to a provider.
 
         Returns:
-            `sqlalchemy.engine.Connection` | None
+            `sqlalchemy.engine.Engine` | None
         """
         if self.provider.network.is_local:
             return None
@@ -132,165 +221,181 @@ class CacheQueryProvider(QueryAPI):
         if not self.network_manager.connected:
             raise QueryEngineError("Not connected to a provider")
 
-        database_file = self._get_database_file(
-            self.provider.network.ecosystem.name, self.provider.network.name
-        )
+        try:
+            engine = self._get_engine(
+                self.provider.network.ecosystem.name, self.provider.network.name
+            )
 
-        if not database_file.is_file():
-            logger.debug("`ape-cache` database has not been initialized")
+        except QueryEngineError as e:
+            logger.debug(f"Exception when querying:\n{e}")
+            return None
+
+        except Exception as e:  # noqa: BLE001
+            logger.warning(f"Unhandled exception when querying:\n{e}")
             self.database_bypass = True
             return None
 
-        try:
-            sqlite_uri = self._get_sqlite_uri(database_file)
-            return create_engine(sqlite_uri, pool_pre_ping=True).connect()
+        if engine is None:
+            logger.debug("`ape-cache` database has not been initialized")
+            self.database_bypass = True
 
-        except QueryEngineError as e:
-            logger.debug(f"Exception when querying:\n{e}")
+        return engine
+
+    @property
+    def database_connection(self):
+        """
+        Returns a connection for the currently active network.
+
+        Raises:
+            :class:`~ape.exceptions.QueryEngineError`: If you are not connected to a provider,
+                or if the database has not been initialized.
+
+        Returns:
+            `sqlalchemy.engine.Connection` | None
+        """
+        if (engine := self.database_engine) is None:
             return None
 
+        try:
+            return engine.connect()
+
         except Exception as e:  # noqa: BLE001
             logger.warning(f"Unhandled exception when querying:\n{e}")
             self.database_bypass = True
             return None
 
-    @singledispatchmethod
-    def _estimate_query_clause(self, query: QueryType) -> Select:
+    def _get_coverage_keys(self, query: QueryType) -> tuple[str, list[str]] | None:
         """
-        A singledispatchmethod that returns a select statement.
+        Returns the table and the keys used to track which block
+        ranges of the query are fully stored in the database.
 
         Args:
-            query (QueryType): Choice of query type to perform a
-                check of the number of rows that match the clause.
-
-        Raises:
-            :class:`~ape.exceptions.QueryEngineError`: When given an
-                incompatible QueryType.
+            query (QueryType): Choice of query type to track coverage for.
 
         Returns:
-            `sqlalchemy.sql.expression.Select`
+            tuple[str, list[str]] | None: ``None`` when coverage is not tracked.
         """
 
-        raise QueryEngineError(
-            """
-            Not a compatible QueryType. For more details see our docs
-            https://docs.apeworx.io/ape/stable/methoddocs/exceptions.html#ape.exceptions.QueryEngineError
-            """
-        )
+        return _get_coverage_keys(query)
 
-    @_estimate_query_clause.register
-    def _block_estimate_query_clause(self, query: BlockQuery) -> Select:
-        return (
-            select(func.count())
-            .select_from(Blocks)
-            .where(Blocks.number >= query.start_block)
-            .where(Blocks.number <= query.stop_block)
-            .where(Blocks.number % query.step == 0)
+    def _get_covered_ranges(
+        self, conn: Connection, table_name: str, keys: list[str], start: int, stop: int
+    ) -> list[tuple[int, int]]:
+        covered: list[tuple[int, int]] | None = None
+        for key in keys:
+            result = conn.execute(
+                select(QueryCoverage.start_block, QueryCoverage.stop_block)
+                .where(QueryCoverage.table_name == table_name)
+                .where(QueryCoverage.key == key)
+                .where(QueryCoverage.start_block <= stop)
+                .where(QueryCoverage.stop_block >= start)
+            )
+            ranges = _merge_ranges((max(a, start), min(b, stop)) for a, b in result)
+            covered = ranges if covered is None else _intersect_ranges(covered, ranges)
+
+        return covered or []
+
+    def _add_coverage(self, conn: Connection, table_name: str, key: str, start: int, stop: int):
+        # NOTE: Merge with any overlapping or adjacent ranges so the index stays small.
+        overlapping = (
+            (QueryCoverage.table_name == table_name)
+            & (QueryCoverage.key == key)
+            & (QueryCoverage.start_block <= stop + 1)
+            & (QueryCoverage.stop_block >= start - 1)
         )
-
-    @_estimate_query_clause.register
-    def _transaction_estimate_query_clause(self, query: BlockTransactionQuery) -> Select:
-        return (
-            select(func.count())
-            .select_from(Transactions)
-            .where(Transactions.block_hash == query.block_id)
+        result = conn.execute(
+            select(QueryCoverage.start_block, QueryCoverage.stop_block).where(overlapping)
         )
-
-    @_estimate_query_clause.register
-    def _contract_events_estimate_query_clause(self, query: ContractEventQuery) -> Select:
-        return (
-            select(func.count())
-            .select_from(ContractEvents)
-            .where(ContractEvents.block_number >= query.start_block)
-            .where(ContractEvents.block_number <= query.stop_block)
-            .where(ContractEvents.block_number % query.step == 0)
+        ranges = [(start, stop), *((a, b) for a, b in result)]
+        conn.execute(delete(QueryCoverage).where(overlapping))
+        (merged_start, merged_stop), *_ = _merge_ranges(ranges)
+        conn.execute(
+            insert(QueryCoverage).values(
+                table_name=table_name, key=key, start_block=merged_start, stop_block=merged_stop
+            )
         )
 
-    @singledispatchmethod
-    def _compute_estimate(self, query: QueryType, result: CursorResult) -> int | None:
-        """
-        A singledispatchemethod that computes the time a query
-        will take to perform from the caching database
+    def _plan_query(self, conn: Connection, query: QueryType) -> list[tuple[Any, bool]] | None:
         """
+        Split the query into block-ordered sub-queries, each marked
+        whether it can be served from the database.
 
-        return None  # can't handle this query
+        Args:
+            conn (`sqlalchemy.engine.Connection`): The database connection.
+            query (QueryType): Choice of query type to split.
 
-    @_compute_estimate.register
-    def _compute_estimate_block_query(
-        self,
-        query: BlockQuery,
-        result: CursorResult,
-    ) -> int | None:
-        if result.scalar() == (1 + query.stop_block - query.start_block) // query.step:
-            # NOTE: Assume 200 msec to get data from database
-            return 200
-
-        # Can't handle this query
-        # TODO: Allow partial queries
-        return None
+        Returns:
+            list[tuple[QueryType, bool]] | None: ``None`` when the query cannot be planned.
+        """
 
-    @_compute_estimate.register
-    def _compute_estimate_block_transaction_query(
-        self,
-        query: BlockTransactionQuery,
-        result: CursorResult,
-    ) -> int | None:
-        # TODO: Update `transactions` table schema so this query functions properly
-        # Uncomment below after https://github.com/ApeWorX/ape/issues/994
-        # if result.scalar() > 0:  # type: ignore
-        #    # NOTE: Assume 200 msec to get data from database
-        #    return 200
-
-        # Can't handle this query
-        return None
+        if (coverage_keys := self._get_coverage_keys(query)) is None:
+            return None
 
-    @_compute_estimate.register
-    def _compute_estimate_contract_events_query(
-        self,
-        query: ContractEventQuery,
-        result: CursorResult,
-    ) -> int | None:
-        if result.scalar() == (query.stop_block - query.start_block) // query.step:
-            # NOTE: Assume 200 msec to get data from database
-            return 200
-
-        # Can't handle this query
-        # TODO: Allow partial queries
-        return None
+        query = cast(BlockQuery | ContractEventQuery, query)
+        table_name, keys = coverage_keys
+        covered = self._get_covered_ranges(
+            conn, table_name, keys, query.start_block, query.stop_block
+        )
+        plan = []
+        for start, stop, is_cached in _split_range(query.start_block, query.stop_block, covered):
+            # NOTE: Align the sub-range to the step of the original query.
+            start += -(start - query.start_block) % query.step
+            if start <= stop:
+                sub_query = query.model_copy(update={"start_block": start, "stop_block": stop})
+                plan.append((sub_query, is_cached))
+
+        return plan
+
+    def _estimate_missing_query(self, query: QueryType) -> int | None:
+        estimates = [
+            estimate
+            for engine in self.query_manager.engines.values()
+            if engine is not self and (estimate := engine.estimate_query(query)) is not None
+        ]
+        return min(estimates) if estimates else None
 
     def estimate_query(self, query: QueryType) -> int | None:
         """
         Method called by the client to return a query time estimate.
+        Queries only partially stored in the database are estimated
+        as the time to read the stored ranges plus the time for the
+        fastest other engine to fetch the missing ranges.
 
         Args:
             query (QueryType): Choice of query type to perform a
-                check of the number of rows that match the clause.
+                check of the ranges stored in the database.
 
         Returns:
             int | None
         """
 
-        # NOTE: Because of Python shortcircuiting, the first time `database_connection` is missing
+        # NOTE: Because of Python shortcircuiting, the first time `database_engine` is missing
         #       this will lock the class var `database_bypass` in place for the rest of the session
-        if self.database_bypass or self.database_connection is None:
+        if self.database_bypass or (engine := self.database_engine) is None:
             # No database, or some other issue
             return None
 
-        try:
-            with self.database_connection as conn:
-                result = conn.execute(self._estimate_query_clause(query))
-                if not result:
-                    return None
-
-                return self._compute_estimate(query, result)
+        with engine.connect() as conn:
+            plan = self._plan_query(conn, query)
 
-        except QueryEngineError as err:
-            logger.debug(f"Bypassing cache database: {err}")
-            # Note: The reason we return None instead of failing is that we want
-            #       a failure of the query to bypass the query logic so that the
-            #       estimation phase does not fail in `QueryManager`.
+        if not plan or not any(is_cached for _, is_cached in plan):
+            # NOTE: Nothing is stored; let the other engines handle (and cache) it.
             return None
 
+        # NOTE: Assume 200 msec to get data from database
+        estimate = 200
+        for sub_query, is_cached in plan:
+            if is_cached:
+                continue
+
+            elif (missing_estimate := self._estimate_missing_query(sub_query)) is None:
+                # Can't fetch the missing ranges.
+                return None
+
+            estimate += missing_estimate
+
+        return estimate
+
     @singledispatchmethod
     def perform_query(self, query: QueryType) -> Iterator:  # type: ignore
         """
@@ -317,50 +422,170 @@ class CacheQueryProvider(QueryAPI):
 
     @perform_query.register
     def _perform_block_query(self, query: BlockQuery) -> Iterator[BlockAPI]:
-        with self.database_connection as conn:
-            result = conn.execute(
-                select([column(c) for c in query.columns])
-                .where(Blocks.number >= query.start_block)
-                .where(Blocks.number <= query.stop_block)
-                .where(Blocks.number % query.step == 0)
-            )
-
-            if not result:
-                # NOTE: Should be unreachable if estimated correctly
-                raise QueryEngineError(f"Could not perform query:\n{query}")
+        yield from self._perform_planned_query(query, self._get_cached_blocks)
 
-            yield from (
-                self.provider.network.ecosystem.decode_block(dict(row.items())) for row in result
-            )
+    @perform_query.register
+    def _perform_contract_events_query(self, query: ContractEventQuery) -> Iterator[ContractLog]:
+        yield from self._perform_planned_query(query, self._get_cached_contract_events)
 
     @perform_query.register
     def _perform_transaction_query(self, query: BlockTransactionQuery) -> Iterator[dict]:
         with self.database_connection as conn:
             result = conn.execute(
-                select([Transactions]).where(Transactions.block_hash == query.block_id)
+                select(Transactions).where(Transactions.block_hash == query.block_id)
             )
 
             if not result:
                 # NOTE: Should be unreachable if estimated correctly
                 raise QueryEngineError(f"Could not perform query:\n{query}")
 
-            yield from (dict(row.items()) for row in result)
+            yield from (dict(row._mapping) for row in result)
 
-    @perform_query.register
-    def _perform_contract_events_query(self, query: ContractEventQuery) -> Iterator[ContractLog]:
-        with self.database_connection as conn:
+    @singledispatchmethod
+    def perform_columnar_query(self, query: QueryType) -> Iterator[dict[str, list]]:  # type: ignore
+        """
+        Performs the requested query from cache, reading the columns
+        straight from the database rather than creating an object per row.
+
+        Args:
+            query (QueryType): Choice of query type to perform.
+
+        Returns:
+            Iterator[dict[str, list]]
+        """
+
+        return super().perform_columnar_query(query)
+
+    @perform_columnar_query.register
+    def _perform_columnar_block_query(self, query: BlockQuery) -> Iterator[dict[str, list]]:
+        yield from self._perform_planned_query(
+            query, self._get_cached_block_columns, self.query_manager.query_columns
+        )
+
+    @perform_columnar_query.register
+    def _perform_columnar_contract_events_query(
+        self, query: ContractEventQuery
+    ) -> Iterator[dict[str, list]]:
+        yield from self._perform_planned_query(
+            query, self._get_cached_contract_event_columns, self.query_manager.query_columns
+        )
+
+    def _perform_planned_query(
+        self,
+        query: QueryType,
+        get_cached: Callable[[Any], Iterator],
+        get_missing: Callable[[Any], Iterator] | None = None,
+    ) -> Iterator:
+        if (engine := self.database_engine) is None:
+            raise QueryEngineError("`ape-cache` database is not available.")
+
+        with engine.connect() as conn:
+            plan = self._plan_query(conn, query)
+
+        if plan is None:
+            raise QueryEngineError(f"Could not perform query:\n{query}")
+
+        for sub_query, is_cached in plan:
+            if is_cached:
+                yield from get_cached(sub_query)
+
+            else:
+                # NOTE: The missing range is fetched by the fastest other engine,
+                #   which also stores it in the cache for next time.
+                yield from (get_missing or self.query_manager.query)(sub_query)
+
+    def _get_cached_blocks(self, query: BlockQuery) -> Iterator[BlockAPI]:
+        with self.database_engine.connect() as conn:  # type: ignore[union-attr]
+            result = conn.execute(
+                select(*Blocks.__table__.columns)  # type: ignore[attr-defined]
+                .where(Blocks.number >= query.start_block)
+                .where(Blocks.number <= query.stop_block)
+                .where((Blocks.number - query.start_block) % query.step == 0)
+                .order_by(Blocks.number)
+            )
+            ecosystem = self.provider.network.ecosystem
+            yield from (ecosystem.decode_block(_get_row_data(row)) for row in result)
+
+    def _get_cached_contract_events(self, query: ContractEventQuery) -> Iterator[ContractLog]:
+        addresses = query.contract if isinstance(query.contract, list) else [query.contract]
+        columns = [
+            c
+            for c in ContractEvents.__table__.columns  # type: ignore[attr-defined]
+            if c.key not in ("id", "event_selector")
+        ]
+        with self.database_engine.connect() as conn:  # type: ignore[union-attr]
             result = conn.execute(
-                select([column(c) for c in query.columns])
+                select(*columns)
+                .where(ContractEvents.contract_address.in_(addresses))
+                .where(ContractEvents.event_selector == query.event.selector)
                 .where(ContractEvents.block_number >= query.start_block)
                 .where(ContractEvents.block_number <= query.stop_block)
-                .where(ContractEvents.block_number % query.step == 0)
+                .where((ContractEvents.block_number - query.start_block) % query.step == 0)
+                .order_by(ContractEvents.block_number, ContractEvents.log_index)
             )
+            for row in result:
+                data = _get_row_data(row)
+                data["contract_address"] = to_checksum_address(data["contract_address"])
+                yield ContractLog.model_validate(data)
+
+    def _get_cached_block_columns(self, query: BlockQuery) -> Iterator[dict[str, list]]:
+        table_columns = Blocks.__table__.columns  # type: ignore[attr-defined]
+        if any(c not in table_columns for c in query.columns):
+            # NOTE: Properties of the blocks need the decoded blocks.
+            yield from iter_column_batches(
+                self._get_cached_blocks(query), query.columns, self.column_batch_size
+            )
+            return
 
-            if not result:
-                # NOTE: Should be unreachable if estimated correctly
-                raise QueryEngineError(f"Could not perform query:\n{query}")
+        yield from self._get_column_batches(
+            select(*(table_columns[c] for c in query.columns))
+            .where(Blocks.number >= query.start_block)
+            .where(Blocks.number <= query.stop_block)
+            .where((Blocks.number - query.start_block) % query.step == 0)
+            .order_by(Blocks.number),
+            query.columns,
+        )
+
+    def _get_cached_contract_event_columns(
+        self, query: ContractEventQuery
+    ) -> Iterator[dict[str, list]]:
+        table_columns = ContractEvents.__table__.columns  # type: ignore[attr-defined]
+        # NOTE: Removed logs are never stored.
+        selected: dict[str, Any] = {"removed": literal(False).label("removed")}
+        selected.update((c.key, c) for c in table_columns if c.key not in ("id", "event_selector"))
+        if any(c not in selected for c in query.columns):
+            # NOTE: Properties of the logs need the decoded logs.
+            yield from iter_column_batches(
+                self._get_cached_contract_events(query), query.columns, self.column_batch_size
+            )
+            return
+
+        addresses = query.contract if isinstance(query.contract, list) else [query.contract]
+        yield from self._get_column_batches(
+            select(*(selected[c] for c in query.columns))
+            .where(ContractEvents.contract_address.in_(addresses))
+            .where(ContractEvents.event_selector == query.event.selector)
+            .where(ContractEvents.block_number >= query.start_block)
+            .where(ContractEvents.block_number <= query.stop_block)
+            .where((ContractEvents.block_number - query.start_block) % query.step == 0)
+            .order_by(ContractEvents.block_number, ContractEvents.log_index),
+            query.columns,
+        )
 
-            yield from (ContractLog.model_validate(dict(row.items())) for row in result)
+    def _get_column_batches(
+        self, statement: Select, columns: Sequence[str]
+    ) -> Iterator[dict[str, list]]:
+        with self.database_engine.connect() as conn:  # type: ignore[union-attr]
+            result = conn.execute(statement)
+            while rows := result.fetchmany(self.column_batch_size):
+                yield {
+                    col: (
+                        [convert(v) for v in values]
+                        if (convert := _COLUMN_CONVERTERS.get(col))
+                        else list(values)
+                    )
+                    for col, values in zip(columns, zip(*rows))
+                }
 
     @singledispatchmethod
     def _cache_update_clause(self, query: QueryType) -> Insert:
@@ -415,7 +640,15 @@ class CacheQueryProvider(QueryAPI):
     def _get_block_cache_data(
         self, query: BlockQuery, result: Iterator[BaseInterfaceModel]
     ) -> list[dict[str, Any]] | None:
-        return [m.model_dump(mode="json", by_alias=False) for m in result]
+        table_columns = [c.key for c in Blocks.__table__.columns]  # type: ignore
+        return [
+            {
+                k: v
+                for k, v in m.model_dump(mode="json", by_alias=False).items()
+                if k in table_columns
+            }
+            for m in result
+        ]
 
     @_get_cache_data.register
     def _get_block_txns_data(
@@ -452,7 +685,66 @@ class CacheQueryProvider(QueryAPI):
     def _get_cache_events_data(
         self, query: ContractEventQuery, result: Iterator[BaseInterfaceModel]
     ) -> list[dict[str, Any]] | None:
-        return [m.model_dump(mode="json", by_alias=False) for m in result]
+        table_columns = [c.key for c in ContractEvents.__table__.columns]  # type: ignore
+        return [
+            {
+                **{
+                    k: v
+                    for k, v in m.model_dump(mode="json", by_alias=False).items()
+                    if k in table_columns
+                },
+                "event_selector": query.event.selector,
+            }
+            for m in result
+        ]
+
+    @singledispatchmethod
+    def _clear_range(self, query: QueryType, conn: Connection, start_block: int, stop_block: int):
+        """
+        Remove rows that are about to be re-inserted for the given range.
+        """
+        # NOTE: Rows with a unique key are de-duplicated on insert instead.
+
+    @_clear_range.register
+    def _clear_contract_events_range(
+        self, query: ContractEventQuery, conn: Connection, start_block: int, stop_block: int
+    ):
+        addresses = query.contract if isinstance(query.contract, list) else [query.contract]
+        conn.execute(
+            delete(ContractEvents)
+            .where(ContractEvents.contract_address.in_(addresses))
+            .where(ContractEvents.event_selector == query.event.selector)
+            .where(ContractEvents.block_number >= start_block)
+            .where(ContractEvents.block_number <= stop_block)
+        )
+
+    def _get_coverage_stop(self, query: QueryType) -> int | None:
+        """
+        The last block of the query that can be marked as fully stored,
+        or ``None`` if the results do not cover a contiguous range.
+        """
+        if isinstance(query, BlockQuery) and query.step != 1:
+            # NOTE: Blocks skipped by the step were not fetched.
+            return None
+
+        elif self._get_coverage_keys(query) is None:
+            return None
+
+        # NOTE: Only confirmed blocks are marked so that re-orgs are re-fetched.
+        confirmed_block = (
+            self.chain_manager.blocks.height - self.provider.network.required_confirmations
+        )
+        stop_block = min(query.stop_block, confirmed_block)  # type: ignore[attr-defined]
+        return stop_block if stop_block >= query.start_block else None  # type: ignore
+
+    def can_cache(self, query: QueryType) -> bool:
+        try:
+            self._cache_update_clause(query)
+        except QueryEngineError:
+            # Cannot handle query type
+            return False
+
+        return not self.database_bypass and self.database_engine is not None
 
     def update_cache(self, query: QueryType, result: Iterator[BaseInterfaceModel]):
         try:
@@ -461,17 +753,156 @@ class CacheQueryProvider(QueryAPI):
             # Cannot handle query type
             return
 
-        # NOTE: Because of Python shortcircuiting, the first time `database_connection` is missing
+        # NOTE: Because of Python shortcircuiting, the first time `database_engine` is missing
         #       this will lock the class var `database_bypass` in place for the rest of the session
-        if not self.database_bypass and self.database_connection is not None:
-            logger.debug(f"Caching query: {query}")
-            with self.database_connection as conn:
-                try:
-                    conn.execute(
-                        clause.values(  # type: ignore
-                            self._get_cache_data(query, result)
-                        ).prefix_with("OR IGNORE")
-                    )
+        if self.database_bypass or (engine := self.database_engine) is None:
+            return
+
+        logger.debug(f"Caching query: {query}")
+        coverage_stop = self._get_coverage_stop(query)
+        number_key = "number" if isinstance(query, BlockQuery) else "block_number"
+
+        # NOTE: Each chunk is committed in its own transaction so that the database
+        #   is not locked for writing while waiting on the rest of the results.
+        #   When replacing a range, a block's rows are replaced all at once, so the
+        #   rows of the last block in a chunk wait for the next chunk.
+        start_block = query.start_block if coverage_stop is not None else 0  # type: ignore
+        cleared_stop = start_block - 1
+        held: list[dict] = []
+        try:
+            # NOTE: Insert in chunks so the results are never all held in memory.
+            while chunk := list(islice(result, self.cache_write_chunk_size)):
+                data = held + (self._get_cache_data(query, iter(chunk)) or [])
+                if coverage_stop is not None:
+                    # NOTE: Unconfirmed rows are not stored; they are re-fetched next time.
+                    data = [d for d in data if d[number_key] <= coverage_stop]
+                    if not data:
+                        continue
+
+                    last_block = max(d[number_key] for d in data)
+                    held = [d for d in data if d[number_key] == last_block]
+                    data = [d for d in data if d[number_key] != last_block]
+
+                with engine.begin() as conn:
+                    if coverage_stop is not None:
+                        self._clear_range(query, conn, cleared_stop + 1, last_block - 1)
+                        cleared_stop = last_block - 1
+
+                    if data:
+                        conn.execute(clause.prefix_with("OR IGNORE"), data)
+
+            if coverage_stop is not None:
+                # NOTE: Only marked as stored once all the results are written.
+                with engine.begin() as conn:
+                    self._clear_range(query, conn, cleared_stop + 1, coverage_stop)
+                    if held:
+                        conn.execute(clause.prefix_with("OR IGNORE"), held)
+
+                    table_name, keys = self._get_coverage_keys(query)  # type: ignore[misc]
+                    for key in keys:
+                        self._add_coverage(conn, table_name, key, start_block, coverage_stop)
+
+        except QueryEngineError as err:
+            logger.warning(f"Database corruption: {err}")
+
+
+@singledispatch
+def _get_coverage_keys(query: QueryType) -> tuple[str, list[str]] | None:
+    # NOTE: The table and keys tracking which block ranges of the query are fully stored.
+    return None  # can't track this query
+
+
+@_get_coverage_keys.register
+def _get_block_coverage_keys(query: BlockQuery) -> tuple[str, list[str]] | None:
+    return Blocks.__tablename__, [""]
+
+
+@_get_coverage_keys.register
+def _get_contract_events_coverage_keys(
+    query: ContractEventQuery,
+) -> tuple[str, list[str]] | None:
+    if query.search_topics:
+        # NOTE: Filtered logs are only a subset of the range.
+        return None
+
+    addresses = query.contract if isinstance(query.contract, list) else [query.contract]
+    return ContractEvents.__tablename__, [
+        f"{address.lower()}:{query.event.selector}" for address in addresses
+    ]
+
+
+def _get_row_data(row: Row) -> dict[str, Any]:
+    # NOTE: `Numeric` columns are returned as `Decimal`.
+    return {k: int(v) if isinstance(v, Decimal) else v for k, v in row._mapping.items()}
+
+
+def _to_int(value: Any) -> Any:
+    return int(value) if isinstance(value, Decimal) else value
+
+
+def _to_hex_bytes(value: Any) -> Any:
+    return HexBytes(value) if isinstance(value, bytes) else value
+
+
+def _to_checksum_address(value: Any) -> Any:
+    return to_checksum_address(value) if value else value
+
+
+# NOTE: Converts the values of columns read from the database to match the decoded models.
+_COLUMN_CONVERTERS: dict[str, Callable[[Any], Any]] = {
+    "hash": _to_hex_bytes,
+    "parent_hash": _to_hex_bytes,
+    "difficulty": _to_int,
+    "total_difficulty": _to_int,
+    "contract_address": _to_checksum_address,
+}
+
+
+def _merge_ranges(ranges: Iterable[tuple[int, int]]) -> list[tuple[int, int]]:
+    # NOTE: Merges overlapping and adjacent inclusive ranges.
+    merged: list[tuple[int, int]] = []
+    for start, stop in sorted(ranges):
+        if merged and start <= merged[-1][1] + 1:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], stop))
+        else:
+            merged.append((start, stop))
+
+    return merged
+
+
+def _intersect_ranges(
+    ranges: list[tuple[int, int]], other: list[tuple[int, int]]
+) -> list[tuple[int, int]]:
+    # NOTE: Both inputs must be merged (sorted and non-overlapping).
+    intersection = []
+    idx = other_idx = 0
+    while idx < len(ranges) and other_idx < len(other):
+        start = max(ranges[idx][0], other[other_idx][0])
+        stop = min(ranges[idx][1], other[other_idx][1])
+        if start <= stop:
+            intersection.append((start, stop))
+
+        if ranges[idx][1] < other[other_idx][1]:
+            idx += 1
+        else:
+            other_idx += 1
+
+    return intersection
+
+
+def _split_range(
+    start: int, stop: int, covered: list[tuple[int, int]]
+) -> list[tuple[int, int, bool]]:
+    # NOTE: Returns the ordered (start, stop, is_covered) segments of the inclusive range.
+    segments = []
+    for covered_start, covered_stop in covered:
+        if start < covered_start:
+            segments.append((start, covered_start - 1, False))
+
+        segments.append((covered_start, covered_stop, True))
+        start = covered_stop + 1
+
+    if start <= stop:
+        segments.append((start, stop, False))
 
-                except QueryEngineError as err:
-                    logger.warning(f"Database corruption: {err}")
+    return segments
@@ -0,0 +1,153 @@
+"""A minimal, synchronous ``eth_subscribe`` client for websocket RPCs.
+
+Used by :class:`~ape_ethereum.provider.Web3Provider` to get pushed ``newHeads`` and ``logs``
+notifications instead of polling the node. Any connection failure is raised as a
+:class:`~ape.exceptions.ProviderError` so the provider can fall back to HTTP polling.
+"""
+
+import json
+from collections import deque
+from itertools import count
+from typing import Any
+
+from ape.exceptions import ProviderError
+from ape.logging import logger
+
+
+class SubscriptionClient:
+    """
+    A websocket connection that holds ``eth_subscribe`` subscriptions.
+    Notifications for all the subscriptions are received in order using
+    :meth:`~ape_ethereum._subscriptions.SubscriptionClient.receive`.
+    """
+
+    def __init__(self, uri: str, headers: dict | None = None, connect_timeout: float = 10.0):
+        try:
+            from websockets.sync.client import connect
+        except ImportError as err:
+            raise ProviderError("Websocket subscriptions require `websockets>=11`.") from err
+
+        try:
+            self._connection = connect(
+                uri, additional_headers=headers or None, open_timeout=connect_timeout
+            )
+        except Exception as err:
+            raise ProviderError(f"Unable to connect to websocket: {err}") from err
+
+        self._connect_timeout = connect_timeout
+        self._request_ids = count(1)
+        self._notifications: deque[tuple[str, dict]] = deque()
+        self.subscription_ids: list[str] = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def subscribe(self, kind: str, *params: Any) -> str:
+        """
+        Create a subscription, such as ``newHeads`` or ``logs``.
+
+        Args:
+            kind (str): The subscription type.
+            *params (Any): Additional ``eth_subscribe`` parameters, such as a log filter.
+
+        Returns:
+            str: The subscription ID.
+        """
+        request_id = next(self._request_ids)
+        payload = {
+            "jsonrpc": "2.0",
+            "id": request_id,
+            "method": "eth_subscribe",
+            "params": [kind, *params],
+        }
+        self._send(payload)
+
+        # NOTE: Notifications from earlier subscriptions may arrive before the response.
+        while True:
+            try:
+                message = self._recv(timeout=self._connect_timeout)
+            except TimeoutError as err:
+                raise ProviderError(f"Timed out subscribing to '{kind}'.") from err
+
+            if message.get("id") == request_id:
+                break
+
+            self._handle_notification(message)
+
+        if "error" in message:
+            error = message["error"]
+            raise ProviderError(error.get("message", error) if isinstance(error, dict) else error)
+
+        subscription_id = message["result"]
+        self.subscription_ids.append(subscription_id)
+        return subscription_id
+
+    def receive(self, timeout: float | None = None) -> tuple[str, dict] | None:
+        """
+        Get the next notification.
+
+        Args:
+            timeout (float | None): Seconds to wait. Defaults to waiting forever.
+
+        Returns:
+            tuple[str, dict] | None: The subscription ID and the result,
+            or ``None`` when timing out.
+        """
+        while not self._notifications:
+            try:
+                message = self._recv(timeout=timeout)
+            except TimeoutError:
+                return None
+
+            self._handle_notification(message)
+
+        return self._notifications.popleft()
+
+    def close(self):
+        """
+        Unsubscribe and close the connection.
+        """
+        for subscription_id in self.subscription_ids:
+            try:
+                self._send(
+                    {
+                        "jsonrpc": "2.0",
+                        "id": next(self._request_ids),
+                        "method": "eth_unsubscribe",
+                        "params": [subscription_id],
+                    }
+                )
+            except ProviderError:
+                # Already disconnected.
+                break
+
+        self.subscription_ids = []
+        self._connection.close()
+
+    def _handle_notification(self, message: dict):
+        if message.get("method") != "eth_subscription":
+            logger.debug(f"Ignoring websocket message: {message}")
+            return
+
+        params = message.get("params", {})
+        self._notifications.append((params.get("subscription"), params.get("result")))
+
+    def _send(self, payload: dict):
+        try:
+            self._connection.send(json.dumps(payload))
+        except Exception as err:
+            raise ProviderError(f"Websocket disconnected: {err}") from err
+
+    def _recv(self, timeout: float | None) -> dict:
+        try:
+            message = self._connection.recv(timeout=timeout)
+        except TimeoutError:
+            raise
+
+        except Exception as err:
+            raise ProviderError(f"Websocket disconnected: {err}") from err
+
+        return json.loads(message)
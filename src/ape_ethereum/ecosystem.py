@@ -1,17 +1,21 @@
 import re
-from collections.abc import Iterator, Sequence
+from collections.abc import Callable, Iterator, Sequence
 from decimal import Decimal
 from functools import cached_property
 from typing import TYPE_CHECKING, Any, ClassVar, cast
 
 import rlp  # type: ignore
 from cchecksum import to_checksum_address
-from eth_abi import decode, encode
+from eth_abi import decode
+from eth_abi.decoding import ContextFramesBytesIO, TupleDecoder
+from eth_abi.encoding import TupleEncoder
 from eth_abi.exceptions import InsufficientDataBytes, NonEmptyPaddingBytes
+from eth_abi.registry import registry
 from eth_pydantic_types import HexBytes
 from eth_typing import Hash32, HexStr
 from eth_utils import (
     add_0x_prefix,
+    decode_hex,
     encode_hex,
     humanize_hash,
     is_0x_prefixed,
@@ -41,7 +45,7 @@ from ape.logging import logger
 from ape.managers.config import merge_configs
 from ape.types.address import AddressType, RawAddress
 from ape.types.basic import HexInt
-from ape.types.events import ContractLog
+from ape.types.events import LOG_COLUMNS, ContractLog
 from ape.types.gas import AutoGasLimit, GasLimit
 from ape.types.signatures import TransactionSignature
 from ape.types.units import CurrencyValueComparable
@@ -56,6 +60,8 @@ from ape.utils.misc import (
     EMPTY_BYTES32,
     LOCAL_NETWORK_NAME,
     ZERO_ADDRESS,
+    LRUCache,
+    to_int,
 )
 from ape_ethereum.proxies import (
     GET_APP_ABI,
@@ -96,6 +102,10 @@ NETWORKS = {
 BLUEPRINT_HEADER = HexBytes("0xfe71")
 
 
+def _str_to_slot(text: str) -> int:
+    return int(to_hex(keccak(text=text)), 16)
+
+
 class NetworkConfig(PluginConfig):
     """
     The Ethereum network config base class for each
@@ -411,6 +421,11 @@ class Ethereum(EcosystemAPI):
 
     fee_token_symbol: str = "ETH"
 
+    # id(abi) -> codec
+    _codecs: LRUCache[int, "_MethodCodec | _EventCodec"] = PrivateAttr(
+        default_factory=lambda: LRUCache(maxsize=4096)
+    )
+
     @property
     def config(self) -> EthereumConfig:
         return cast(EthereumConfig, super().config)
@@ -564,30 +579,28 @@ class Ethereum(EcosystemAPI):
             except ApeException:
                 pass
 
-        def str_to_slot(text):
-            return int(to_hex(keccak(text=text)), 16)
-
         slots = {
-            ProxyType.Standard: str_to_slot("eip1967.proxy.implementation") - 1,
-            ProxyType.Beacon: str_to_slot("eip1967.proxy.beacon") - 1,
-            ProxyType.OpenZeppelin: str_to_slot("org.zeppelinos.proxy.implementation"),
-            ProxyType.UUPS: str_to_slot("PROXIABLE"),
+            ProxyType.Standard: _str_to_slot("eip1967.proxy.implementation") - 1,
+            ProxyType.Beacon: _str_to_slot("eip1967.proxy.beacon") - 1,
+            ProxyType.OpenZeppelin: _str_to_slot("org.zeppelinos.proxy.implementation"),
+            ProxyType.UUPS: _str_to_slot("PROXIABLE"),
         }
-        get_storage_supported = True
+        aragon_kernel_slot = _str_to_slot("aragonOS.appStorage.kernel")
+        aragon_app_id_slot = _str_to_slot("aragonOS.appStorage.appId")
+        slots_to_read = [*slots.values(), aragon_kernel_slot, aragon_app_id_slot]
+        try:
+            # perf: Read all the candidate slots in one (batch) request.
+            values = self.provider.get_storages([(address, slot) for slot in slots_to_read])
+        except NotImplementedError:
+            # Not able to check any of the storage-based proxy types.
+            return None
+
+        storage = dict(zip(slots_to_read, values))
         for _type, slot in slots.items():
-            try:
-                # TODO perf: use a batch call here when ape adds support
-                storage = self.provider.get_storage(address, slot)
-            except NotImplementedError:
-                # Break early on not-implemented error rather than attempting
-                # to try more proxy types.
-                get_storage_supported = False
-                break
-
-            if sum(storage) == 0:
+            if sum(storage[slot]) == 0:
                 continue
 
-            target = self.conversion_manager.convert(storage[-20:], AddressType)
+            target = self.conversion_manager.convert(storage[slot][-20:], AddressType)
             # read `target.implementation()`
             if _type == ProxyType.Beacon:
                 target = ContractCall(IMPLEMENTATION_ABI, target)(skip_trace=True)
@@ -596,28 +609,22 @@ class Ethereum(EcosystemAPI):
 
         # aragonOS AppProxyUpgradeable: kernel + appId stored at fixed slots; the
         # implementation is resolved through Kernel.getApp(APP_BASES_NAMESPACE, appId).
-        if get_storage_supported:
-            kernel_storage = self.provider.get_storage(
-                address, str_to_slot("aragonOS.appStorage.kernel")
-            )
-            if sum(kernel_storage) != 0:
-                kernel = self.conversion_manager.convert(kernel_storage[-20:], AddressType)
-                app_id = self.provider.get_storage(
-                    address, str_to_slot("aragonOS.appStorage.appId")
+        kernel_storage = storage[aragon_kernel_slot]
+        app_id = storage[aragon_app_id_slot]
+        if sum(kernel_storage) != 0 and sum(app_id) != 0:
+            kernel = self.conversion_manager.convert(kernel_storage[-20:], AddressType)
+            try:
+                target = ContractCall(GET_APP_ABI, kernel)(
+                    keccak(text="base"), bytes(app_id), skip_trace=True
                 )
-                if sum(app_id) != 0:
-                    try:
-                        target = ContractCall(GET_APP_ABI, kernel)(
-                            keccak(text="base"), bytes(app_id), skip_trace=True
-                        )
-                        if target != ZERO_ADDRESS:
-                            return ProxyInfo(
-                                type=ProxyType.AragonAppUpgradeable,
-                                target=target,
-                                abi=GET_APP_ABI,
-                            )
-                    except ApeException:
-                        pass
+                if target != ZERO_ADDRESS:
+                    return ProxyInfo(
+                        type=ProxyType.AragonAppUpgradeable,
+                        target=target,
+                        abi=GET_APP_ABI,
+                    )
+            except ApeException:
+                pass
 
         return None
 
@@ -739,48 +746,63 @@ class Ethereum(EcosystemAPI):
 
         raise ConversionError(f"Unable to convert '{abi_type}'.")
 
+    def _get_method_codec(self, abi: ConstructorABI | MethodABI) -> "_MethodCodec":
+        # NOTE: Keyed by identity, as ABIs with the same selector may still
+        #  differ in their outputs, names, and structs. The codec holds a
+        #  reference to the ABI, so the ID is not re-used while cached.
+        codec = self._codecs.get(id(abi))
+        if isinstance(codec, _MethodCodec) and codec.abi is abi:
+            return codec
+
+        python_types = tuple(self._python_type_for_abi_type(i) for i in abi.inputs)
+        codec = _MethodCodec(abi, python_types)
+        self._codecs[id(abi)] = codec
+        return codec
+
+    def _get_event_codec(self, abi: EventABI) -> "_EventCodec":
+        codec = self._codecs.get(id(abi))
+        if isinstance(codec, _EventCodec) and codec.abi is abi:
+            return codec
+
+        codec = _EventCodec(abi)
+        self._codecs[id(abi)] = codec
+        return codec
+
     def encode_calldata(self, abi: ConstructorABI | MethodABI, *args) -> HexBytes:
         if not abi.inputs:
             return HexBytes("")
 
-        parser = StructParser(abi)
-        arguments = parser.encode_input(args)
-        input_types = [i.canonical_type for i in abi.inputs]
-        python_types = tuple(self._python_type_for_abi_type(i) for i in abi.inputs)
-        converted_args = self.conversion_manager.convert(arguments, python_types)
-        encoded_calldata = encode(input_types, converted_args)
+        codec = self._get_method_codec(abi)
+        arguments = codec.parser.encode_input(args)
+        converted_args = self.conversion_manager.convert(arguments, codec.input_python_types)
+        encoded_calldata = codec.encode_input(converted_args)
         return HexBytes(encoded_calldata)
 
     def decode_calldata(self, abi: ConstructorABI | MethodABI, calldata: bytes) -> dict:
-        raw_input_types = [i.canonical_type for i in abi.inputs]
-        input_types = [parse_type(i.model_dump()) for i in abi.inputs]
+        codec = self._get_method_codec(abi)
 
         try:
-            raw_input_values = decode(raw_input_types, calldata, strict=False)
+            raw_input_values = codec.decode_input(calldata)
         except (InsufficientDataBytes, OverflowError, NonEmptyPaddingBytes) as err:
             raise DecodingError(str(err)) from err
 
         input_values = [
             self.decode_primitive_value(v, t)
-            for v, t in zip(raw_input_values, input_types, strict=True)
+            for v, t in zip(raw_input_values, codec.parsed_input_types, strict=True)
         ]
-        arguments = {}
-        for index, (i, v) in enumerate(zip(abi.inputs, input_values, strict=True)):
-            name = i.name or f"{index}"
-            arguments[name] = v
-        return arguments
+        return dict(zip(codec.input_names, input_values, strict=True))
 
     def decode_returndata(self, abi: MethodABI, raw_data: bytes) -> tuple[Any, ...]:
-        output_types_str_ls = [o.canonical_type for o in abi.outputs]
+        codec = self._get_method_codec(abi)
 
         if raw_data:
             try:
-                vm_return_values = decode(output_types_str_ls, raw_data, strict=False)
+                vm_return_values = codec.decode_output(raw_data)
             except (InsufficientDataBytes, NonEmptyPaddingBytes) as err:
                 raise DecodingError(str(err)) from err
         else:
             # Use all zeroes.
-            vm_return_values = tuple([0 for _ in output_types_str_ls])
+            vm_return_values = tuple([0 for _ in codec.output_types])
 
         if not vm_return_values:
             return vm_return_values
@@ -788,19 +810,17 @@ class Ethereum(EcosystemAPI):
         elif not isinstance(vm_return_values, (tuple, list)):
             vm_return_values = (vm_return_values,)
 
-        output_types = [parse_type(o.model_dump()) for o in abi.outputs]
         output_values = [
             self.decode_primitive_value(v, t)
-            for v, t in zip(vm_return_values, output_types, strict=True)
+            for v, t in zip(vm_return_values, codec.parsed_output_types, strict=True)
         ]
-        parser = StructParser(abi)
-        output_values = parser.decode_output(output_values)
+        output_values = codec.parser.decode_output(output_values)
 
         if issubclass(type(output_values), Struct):
             return (output_values,)
 
         elif (
-            returns_array(abi)
+            codec.returns_array
             and isinstance(output_values, (list, tuple))
             and len(output_values) == 1
         ):
@@ -817,7 +837,7 @@ class Ethereum(EcosystemAPI):
                     # On-chains transaction data errors.
                     return (output_values,)
 
-        elif returns_array(abi):
+        elif codec.returns_array:
             # Tuple with single item as the array.
             return (output_values,)
 
@@ -1044,13 +1064,10 @@ class Ethereum(EcosystemAPI):
         if not logs:
             return
 
-        abi_inputs = {
-            encode_hex(keccak(text=abi.selector)): LogInputABICollection(abi) for abi in events
+        event_codecs = {
+            codec.topic_id: codec for codec in (self._get_event_codec(abi) for abi in events)
         }
 
-        def get_abi(_topic: HexStr) -> LogInputABICollection | None:
-            return abi_inputs.get(_topic, None)
-
         for log in logs:
             if log.get("anonymous"):
                 raise NotImplementedError(
@@ -1064,20 +1081,20 @@ class Ethereum(EcosystemAPI):
             elif not topics:
                 continue
 
-            if not (abi := get_abi(topics[0])):
+            if not (codec := event_codecs.get(topics[0])):
                 continue
 
+            abi = codec.inputs
             event_arguments = abi.decode(topics, log["data"], use_hex_on_fail=True)
 
             # Since LogABICollection does not have access to the Ecosystem,
             # the rest of the decoding must happen here.
             converted_arguments: dict = {}
 
-            for item in abi.abi.inputs:
-                _type, key, value = item.canonical_type, item.name, event_arguments[item.name]
+            for key, _type, struct_types, array_sub_type in codec.arguments:
+                value = event_arguments[key]
 
                 if isinstance(value, Struct):
-                    struct_types = _type.lstrip("(").rstrip(")").split(",")
                     for struct_type, (struct_key, struct_val) in zip(
                         struct_types, value.items(), strict=True
                     ):
@@ -1093,10 +1110,11 @@ class Ethereum(EcosystemAPI):
                 elif _type == "address":
                     converted_arguments[key] = self.decode_address(value)
 
-                elif is_array(_type):
-                    sub_type = "[".join(_type.split("[")[:-1])
+                elif array_sub_type is not None:
                     converted_arguments[key] = (
-                        [self.decode_address(v) for v in value] if sub_type == "address" else value
+                        [self.decode_address(v) for v in value]
+                        if array_sub_type == "address"
+                        else value
                     )
 
                 elif isinstance(value, int):
@@ -1125,6 +1143,79 @@ class Ethereum(EcosystemAPI):
                 removed=log.get("removed", False) or log.get("reverted", False),
             )
 
+    def decode_logs_columnar(self, logs: Sequence[dict], event: EventABI) -> dict[str, list]:
+        codec = self._get_event_codec(event)
+        if (plan := codec.column_plan) is None:
+            # Has types that need the full decoding, such as structs.
+            return super().decode_logs_columnar(logs, event)
+
+        topic_converters, data_converters = plan
+        columns: dict[str, list] = {
+            name: [] for name in (*LOG_COLUMNS, *(i.name or "" for i in event.inputs))
+        }
+        num_topics = 1 + len(topic_converters)
+        addresses: dict[Any, AddressType] = {}
+        for log in logs:
+            topics = log["topics"]
+            if len(topics) != num_topics:
+                # Not this event (or anonymous).
+                continue
+
+            topics = [t if isinstance(t, str) else encode_hex(t) for t in topics]
+            if topics[0].lower() != codec.topic_id:
+                continue
+
+            data = log["data"]
+            try:
+                topic_values = [convert(t) for convert, t in zip(topic_converters, topics[1:])]
+                data_values = [
+                    convert(v) if convert else v
+                    for convert, v in zip(
+                        data_converters,
+                        codec.decode_data(decode_hex(data) if isinstance(data, str) else data),
+                    )
+                ]
+            except Exception:  # noqa: BLE001
+                # Malformed; the full decoding handles the edge-cases.
+                if not (decoded := next(iter(self.decode_logs([log], event)), None)):
+                    continue
+
+                arguments = decoded.event_arguments
+
+            else:
+                arguments = {
+                    **dict(zip(codec.topic_names, topic_values)),
+                    **dict(zip(codec.data_names, data_values)),
+                }
+
+            block_hash = log.get("blockHash") or log.get("block_hash") or ""
+            transaction_hash = log.get("transactionHash") or log.get("transaction_hash") or ""
+            transaction_index = (
+                log.get("transactionIndex")
+                if "transactionIndex" in log
+                else log.get("transaction_index")
+            )
+            raw_address = log["address"]
+            if raw_address not in addresses:
+                addresses[raw_address] = self.decode_address(raw_address)
+
+            columns["block_number"].append(
+                to_int(log.get("blockNumber") or log.get("block_number") or 0)
+            )
+            for name, value in (("block_hash", block_hash), ("transaction_hash", transaction_hash)):
+                columns[name].append(to_hex(value) if isinstance(value, bytes) else value)
+
+            columns["transaction_index"].append(
+                None if transaction_index is None else to_int(transaction_index)
+            )
+            columns["log_index"].append(to_int(log.get("logIndex") or log.get("log_index") or 0))
+            columns["contract_address"].append(addresses[raw_address])
+            for abi_input in event.inputs:
+                name = abi_input.name or ""
+                columns[name].append(arguments.get(name))
+
+        return columns
+
     def enrich_trace(self, trace: "TraceAPI", **kwargs) -> "TraceAPI":
         kwargs["trace"] = trace
         if not isinstance(trace, Trace):
@@ -1589,6 +1680,129 @@ def parse_type(type_: dict[str, Any]) -> str | tuple | list:
     return [result] if is_array(type_["type"]) else result
 
 
+class _MethodCodec:
+    """
+    The types, eth-abi coders, and struct parser of a method (or constructor)
+    ABI, computed once so that encoding and decoding only run the coders.
+    """
+
+    def __init__(self, abi: ConstructorABI | MethodABI, input_python_types: tuple):
+        self.abi = abi
+        self.parser = StructParser(abi)
+        self.input_names = [i.name or f"{index}" for index, i in enumerate(abi.inputs)]
+        self.input_types = [i.canonical_type for i in abi.inputs]
+        self.input_python_types = input_python_types
+        self.parsed_input_types = [parse_type(i.model_dump()) for i in abi.inputs]
+
+        outputs = abi.outputs if isinstance(abi, MethodABI) else []
+        self.output_types = [o.canonical_type for o in outputs]
+        self.parsed_output_types = [parse_type(o.model_dump()) for o in outputs]
+        self.returns_array = isinstance(abi, MethodABI) and returns_array(abi)
+
+        self._input_encoder = TupleEncoder(
+            encoders=[registry.get_encoder(t) for t in self.input_types]
+        )
+        self._input_decoder = TupleDecoder(
+            decoders=[registry.get_decoder(t, strict=False) for t in self.input_types]
+        )
+        self._output_decoder = TupleDecoder(
+            decoders=[registry.get_decoder(t, strict=False) for t in self.output_types]
+        )
+
+    def encode_input(self, values: Sequence) -> bytes:
+        return self._input_encoder(values)
+
+    def decode_input(self, data: bytes) -> tuple:
+        return self._input_decoder(ContextFramesBytesIO(data))
+
+    def decode_output(self, data: bytes) -> tuple:
+        return self._output_decoder(ContextFramesBytesIO(data))
+
+
+class _EventCodec:
+    """
+    The topic ID, log decoder, and per-argument conversion plan of an event ABI.
+    """
+
+    def __init__(self, abi: EventABI):
+        self.abi = abi
+        self.topic_id = encode_hex(keccak(text=abi.selector))
+        self.inputs = LogInputABICollection(abi)
+        self.topic_names = [i.name or "" for i in self.inputs.topic_abi_types]
+        self.data_names = [i.name or "" for i in self.inputs.data_abi_types]
+
+        # (name, type, struct member types, array item type)
+        self.arguments: list[tuple] = []
+        for item in abi.inputs:
+            _type = item.canonical_type
+            struct_types = _type.lstrip("(").rstrip(")").split(",")
+            array_sub_type = "[".join(_type.split("[")[:-1]) if is_array(_type) else None
+            self.arguments.append((item.name, _type, struct_types, array_sub_type))
+
+    @cached_property
+    def column_plan(self) -> tuple[list, list] | None:
+        """
+        The converters of the topic and data values when decoding into columns
+        (``None`` meaning no conversion for data values), or ``None`` when the
+        event has types needing the full decoding, such as structs or arrays.
+        """
+        topic_converters = [
+            _TOPIC_CONVERTERS.get(_get_type_family(t)) for t in self.inputs.topic_types
+        ]
+        data_families = [_get_type_family(t) for t in self.inputs.data_types]
+        if None in topic_converters or any(f not in _DATA_CONVERTERS for f in data_families):
+            return None
+
+        return topic_converters, [_DATA_CONVERTERS[f] for f in data_families]
+
+    def decode_data(self, data: bytes) -> tuple:
+        return self._data_decoder(ContextFramesBytesIO(data))
+
+    @cached_property
+    def _data_decoder(self) -> TupleDecoder:
+        return TupleDecoder(decoders=[registry.get_decoder(t) for t in self.inputs.data_types])
+
+
+def _get_type_family(abi_type: str) -> str:
+    if abi_type in ("address", "bool", "bytes32", "string", "bytes"):
+        return abi_type
+
+    elif re.fullmatch(r"uint\d*", abi_type):
+        return "uint"
+
+    elif re.fullmatch(r"int\d*", abi_type):
+        return "int"
+
+    # Needs the full decoding.
+    return abi_type
+
+
+def _decode_signed_topic(topic: str) -> int:
+    value = int(topic, 16)
+    return value - (1 << 256) if value >> 255 else value
+
+
+# Fast conversions of hex-str topics, by type.
+_TOPIC_CONVERTERS: dict[str, Callable[[str], Any]] = {
+    "address": lambda t: to_checksum_address(f"0x{t[-40:]}"),
+    "bool": lambda t: int(t, 16) != 0,
+    "bytes32": HexBytes,
+    "uint": lambda t: int(t, 16),
+    "int": _decode_signed_topic,
+}
+
+# Conversions of eth-abi decoded data values, by type (``None`` for no conversion).
+_DATA_CONVERTERS: dict[str, Callable[[Any], Any] | None] = {
+    "address": to_checksum_address,
+    "bool": None,
+    "bytes32": HexBytes,
+    "string": None,
+    "bytes": HexBytes,
+    "uint": None,
+    "int": None,
+}
+
+
 def _correct_key(key: str, data: dict, alt_keys: tuple[str, ...]) -> dict:
     if key in data:
         return data
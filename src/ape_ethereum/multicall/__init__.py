@@ -1,7 +1,9 @@
-from .handlers import BaseMulticall, Call, Transaction
+from .handlers import BaseMulticall, Batch, Call, CallFuture, Transaction
 
 __all__ = [
     "BaseMulticall",
+    "Batch",
     "Call",
+    "CallFuture",
     "Transaction",
 ]
@@ -23,3 +23,9 @@ class UnsupportedChainError(MulticallException):
 class NotExecutedError(MulticallException):
     def __init__(self):
         super().__init__("Multicall not executed yet.")
+
+
+class CallFailedError(MulticallException):
+    def __init__(self, signature: str, returndata: bytes | None = None):
+        self.returndata = returndata
+        super().__init__(f"Call to '{signature}' failed.")
@@ -1,8 +1,11 @@
-from collections.abc import Iterator
+import re
+from collections.abc import Iterable, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from functools import cached_property
 from types import ModuleType
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, NamedTuple
 
+from eth_pydantic_types import HexBytes
 from ethpm_types import ContractType
 
 from ape.contracts.base import (
@@ -10,9 +13,15 @@ from ape.contracts.base import (
     ContractInstance,
     ContractMethodHandler,
     ContractTransactionHandler,
-    _select_method_abi,
+    _call_batch,
+)
+from ape.exceptions import (
+    ChainError,
+    DecodingError,
+    ProviderError,
+    TransactionError,
+    VirtualMachineError,
 )
-from ape.exceptions import ChainError, DecodingError
 from ape.logging import logger
 from ape.utils.abi import MethodABI
 from ape.utils.basemodel import ManagerAccessMixin
@@ -23,15 +32,40 @@ from .constants import (
     MULTICALL3_CONTRACT_TYPE,
     SUPPORTED_CHAINS,
 )
-from .exceptions import InvalidOption, UnsupportedChainError, ValueRequired
+from .exceptions import (
+    CallFailedError,
+    InvalidOption,
+    UnsupportedChainError,
+    ValueRequired,
+)
 
 if TYPE_CHECKING:
-    from eth_pydantic_types import HexBytes
+    from pandas import DataFrame
+    from typing_extensions import Self
 
     from ape.api.transactions import ReceiptAPI, TransactionAPI
+    from ape.types import BlockID
     from ape.types.address import AddressType
 
 
+# Errors from requests too large for the node, which may succeed as smaller requests.
+_REQUEST_TOO_LARGE_PATTERN = re.compile(
+    r"gas (cap|limit)|out of gas|too large|response size|size limit",
+    re.IGNORECASE,
+)
+
+
+def _is_bisectable_error(err: Exception) -> bool:
+    # NOTE: A revert (or running out of gas) may come from one of the calls only.
+    return isinstance(err, VirtualMachineError) or bool(_REQUEST_TOO_LARGE_PATTERN.search(str(err)))
+
+
+class _CallResult(NamedTuple):
+    # NOTE: Same as ``Multicall3.Result``, for calls that failed the whole request.
+    success: bool
+    returnData: HexBytes
+
+
 class BaseMulticall(ManagerAccessMixin):
     def __init__(
         self,
@@ -44,6 +78,8 @@ class BaseMulticall(ManagerAccessMixin):
         self.address = address
         self.supported_chains = supported_chains or SUPPORTED_CHAINS
         self.calls: list[dict] = []
+        # NOTE: The overload of each call, for decoding its return data.
+        self.abis: list[MethodABI] = []
 
     @classmethod
     def inject(cls) -> ModuleType:
@@ -127,6 +163,9 @@ class BaseMulticall(ManagerAccessMixin):
               to emulate a builder pattern.
         """
 
+        # NOTE: Selects the overload and encodes the calldata in one pass.
+        abi, calldata = call._encode_input(args)
+
         # Append call dict to the list
         # NOTE: Depending upon `_handler_method_abi` at time when `__call__` is triggered,
         #       some of these properties will be unused
@@ -135,9 +174,10 @@ class BaseMulticall(ManagerAccessMixin):
                 "target": call.contract.address,
                 "allowFailure": allowFailure,
                 "value": value,
-                "callData": call.encode_input(*args),
+                "callData": calldata,
             }
         )
+        self.abis.append(abi)
         return self
 
 
@@ -162,57 +202,107 @@ class Call(BaseMulticall):
             ...  # Add as many calls as desired
             .add(contract.myMethod, *call_args)
         a, b, ..., z = call()  # Performs multicall
+
+    To split many calls across several ``aggregate3`` requests, set any of
+    ``max_calls``, ``max_calldata_size`` (bytes), or ``max_gas``. The chunks are sent
+    concurrently, all at the same block, and the results are returned in order::
+
+        call = multicall.Call(max_calls=500, max_calldata_size=100_000)
+
+    When a request fails, such as from exceeding the node's gas cap, it is retried
+    in halves, so one failing call only fails itself (unless ``allowFailure=False``).
     """
 
     def __init__(
         self,
         address: "AddressType" = MULTICALL3_ADDRESS,
         supported_chains: list[int] | None = None,
+        max_calls: int | None = None,
+        max_calldata_size: int | None = None,
+        max_gas: int | None = None,
+        concurrency: int | None = None,
     ) -> None:
         super().__init__(address=address, supported_chains=supported_chains)
+        self.max_calls = max_calls
+        self.max_calldata_size = max_calldata_size
+        self.max_gas = max_gas
+        self.concurrency = concurrency
+        # NOTE: The estimated gas of each call, when chunking by gas.
+        self.gas: list[int] = []
 
-        self.abis: list[MethodABI] = []
         self._result: list[tuple[bool, HexBytes]] | None = None
 
     @property
     def handler(self) -> ContractCallHandler:  # type: ignore[override]
         return super().handler.call  # NOTE: all Multicall3 methods are mutable calls by default
 
-    def add(self, call: ContractMethodHandler, *args, **kwargs):
+    def add(self, call: ContractMethodHandler, *args, gas: int | None = None, **kwargs):
+        """
+        Adds a call to the Multicall session object.
+
+        Raises:
+            :class:`~ape_ethereum.multicall.exceptions.InvalidOption`: If given
+              ``value``, as calls cannot send ether.
+
+        Args:
+            call (:class:`~ape_ethereum.multicall.handlers.ContractMethodHandler`):
+              The method to call.
+            *args: The arguments to invoke the method with.
+            gas (int | None): The estimated gas of the call, for chunking by ``max_gas``.
+              Defaults to estimating it using the provider, when ``max_gas`` is set.
+            **kwargs: Additional options, such as ``allowFailure``.
+
+        Returns:
+            :class:`~ape_ethereum.multicall.handlers.Call`: returns itself
+              to emulate a builder pattern.
+        """
         if "value" in kwargs:
             raise InvalidOption("value")
 
         super().add(call, *args, **kwargs)
-        # Must match the overload `super().add` encoded the calldata with, or an overloaded
-        # call is decoded against the wrong return types.
-        self.abis.append(_select_method_abi(call.abis, args, encode_check=call._can_encode))
+        if gas is None and self.max_gas is not None:
+            gas = self._estimate_gas(self.calls[-1])
+
+        self.gas.append(gas or 0)
         return self
 
+    def _estimate_gas(self, call: dict) -> int:
+        txn = self.provider.network.ecosystem.create_transaction(
+            receiver=call["target"], data=call["callData"]
+        )
+        try:
+            return self.provider.estimate_gas_cost(txn)
+        except (ProviderError, TransactionError) as err:
+            # NOTE: Likely a call that fails. It still gets its result (the failure).
+            logger.debug(f"Unable to estimate gas of call to '{call['target']}': {err}")
+            return 0
+
     @property
-    def returnData(self) -> list["HexBytes"]:
+    def returnData(self) -> list[HexBytes]:
         # NOTE: this property is kept camelCase to align with the raw EVM struct
         result = self._result  # Declare for typing reasons.
         return [res.returnData if res.success else None for res in result]  # type: ignore
 
-    def _decode_results(self) -> Iterator[Any]:
-        for abi, data in zip(self.abis, self.returnData, strict=True):
-            if data is None:
+    def _decode_results(self, results: list | None = None) -> Iterator[Any]:
+        results = self._result if results is None else results
+        for abi, result in zip(self.abis, results or [], strict=True):
+            if not result.success:
                 # The call failed.
-                yield data
+                yield None
                 continue
 
             try:
-                result = self.provider.network.ecosystem.decode_returndata(abi, data)
+                yield self._decode_returndata(abi, result.returnData)
             except DecodingError as err:
                 logger.error(err)
-                yield data  # Yield the raw data
-                continue
+                yield result.returnData  # Yield the raw data
 
-            if isinstance(result, (list, tuple)) and len(result) == 1:
-                yield result[0]
+    def _decode_returndata(self, abi: MethodABI, data: HexBytes) -> Any:
+        result = self.provider.network.ecosystem.decode_returndata(abi, data)
+        if isinstance(result, (list, tuple)) and len(result) == 1:
+            return result[0]
 
-            else:
-                yield result
+        return result
 
     def __call__(self, **call_kwargs) -> Iterator[Any]:
         """
@@ -231,9 +321,138 @@ class Call(BaseMulticall):
             Iterator[Any]: the sequence of values produced by performing each call stored
               by this instance.
         """
-        self._result = self.handler(self.calls, **call_kwargs)
+        handler = self.handler
+        chunks = self._get_chunks()
+        if len(chunks) > 1 and "block_id" not in call_kwargs:
+            # NOTE: So that all the chunks read the same state.
+            call_kwargs["block_id"] = self.chain_manager.blocks.head.number
+
+        if len(chunks) <= 1:
+            results = [self._call_chunk(handler, chunk, call_kwargs) for chunk in chunks]
+
+        else:
+            concurrency = min(len(chunks), self.concurrency or self.provider.concurrency) or 1
+            with ThreadPoolExecutor(concurrency) as pool:
+                results = list(
+                    pool.map(lambda c: self._call_chunk(handler, c, call_kwargs), chunks)
+                )
+
+        self._result = [result for chunk_results in results for result in chunk_results]
         return self._decode_results()
 
+    def at_blocks(
+        self,
+        block_ids: Iterable["BlockID"],
+        columns: Sequence[str] | None = None,
+        **call_kwargs,
+    ) -> "DataFrame":
+        """
+        Perform the Multicall call at each of the given blocks, such as to get the
+        history of some values. The requests for all the blocks (and chunks) are
+        sent concurrently.
+
+        Usage example::
+
+            call = multicall.Call()
+            for pool in POOLS:
+                call.add(pool.getReserves)
+
+            reserves = call.at_blocks(range(start_block, stop_block, 100))
+
+        Args:
+            block_ids (Iterable[:class:`~ape.types.BlockID`]): The blocks to call at.
+            columns (Sequence[str] | None): Names for the results of each call,
+              in the order they were added. Defaults to their indices.
+            **call_kwargs: the kwargs to pass through to the call handler.
+
+        Returns:
+            pd.DataFrame: A row of results per block, indexed by ``block_id``.
+        """
+        # perf: pandas import is really slow. Avoid importing at module level.
+        import pandas as pd
+
+        if columns is not None and len(columns) != len(self.calls):
+            raise ValueError(f"Expecting {len(self.calls)} columns, got {len(columns)}.")
+
+        handler = self.handler
+        block_ids = list(block_ids)
+        chunks = self._get_chunks()
+        requests = [(block_id, chunk) for block_id in block_ids for chunk in chunks]
+
+        def call_at(request: tuple["BlockID", list[dict]]) -> list:
+            block_id, chunk = request
+            return self._call_chunk(handler, chunk, {**call_kwargs, "block_id": block_id})
+
+        concurrency = min(len(requests), self.concurrency or self.provider.concurrency) or 1
+        with ThreadPoolExecutor(concurrency) as pool:
+            results = iter(pool.map(call_at, requests))
+            rows = [
+                list(self._decode_results([result for _ in chunks for result in next(results)]))
+                for _ in block_ids
+            ]
+
+        return pd.DataFrame(
+            rows,
+            index=pd.Index(block_ids, name="block_id"),
+            columns=list(columns) if columns is not None else list(range(len(self.calls))),
+        )
+
+    def _get_chunks(self) -> list[list[dict]]:
+        chunks: list[list[dict]] = []
+        chunk: list[dict] = []
+        calldata_size = gas = 0
+        for call, call_gas in zip(self.calls, self.gas, strict=True):
+            if chunk and (
+                (self.max_calls is not None and len(chunk) >= self.max_calls)
+                or (
+                    self.max_calldata_size is not None
+                    and calldata_size + len(call["callData"]) > self.max_calldata_size
+                )
+                or (self.max_gas is not None and gas + call_gas > self.max_gas)
+            ):
+                chunks.append(chunk)
+                chunk = []
+                calldata_size = gas = 0
+
+            chunk.append(call)
+            calldata_size += len(call["callData"])
+            gas += call_gas
+
+        if chunk:
+            chunks.append(chunk)
+
+        return chunks
+
+    def _call_chunk(self, handler: ContractCallHandler, calls: list[dict], call_kwargs: dict):
+        # NOTE: Sent now, even when made inside a ``Batch``.
+        token = _call_batch.set(None)
+        try:
+            return handler(calls, **call_kwargs)
+        except (ProviderError, VirtualMachineError) as err:
+            if not _is_bisectable_error(err):
+                # Such as a connection error or a rate limit. Smaller requests won't help.
+                raise
+
+            elif len(calls) == 1:
+                if not calls[0]["allowFailure"]:
+                    raise
+
+                logger.debug(f"Call to '{calls[0]['target']}' failed: {err}")
+                return [_CallResult(False, HexBytes(b""))]
+
+        finally:
+            _call_batch.reset(token)
+
+        # Retry in halves, to isolate the calls that make the request fail.
+        if "block_id" not in call_kwargs:
+            call_kwargs = {**call_kwargs, "block_id": self.chain_manager.blocks.head.number}
+
+        middle = len(calls) // 2
+        return [
+            *self._call_chunk(handler, calls[:middle], call_kwargs),
+            *self._call_chunk(handler, calls[middle:], call_kwargs),
+        ]
+
     def as_transaction(self, **txn_kwargs) -> "TransactionAPI":
         """
         Encode the Multicall transaction as a ``TransactionAPI`` object, but do not execute it.
@@ -308,3 +527,170 @@ class Transaction(BaseMulticall):
         """
         self._validate_calls(**txn_kwargs)
         return self.handler.as_transaction(self.calls, **txn_kwargs)
+
+
+class CallFuture:
+    """
+    The pending result of a view call made in a
+    :class:`~ape_ethereum.multicall.handlers.Batch`.
+    """
+
+    def __init__(self, batch: "Batch", call: ContractCallHandler, args: tuple) -> None:
+        self.batch = batch
+        self.call = call
+        self.args = args
+        self._done = False
+        self._value: Any = None
+        self._error: Exception | None = None
+
+    def __repr__(self) -> str:
+        state = "done" if self._done else "pending"
+        return f"<CallFuture {self.call.abis[0].name} {state}>"
+
+    @property
+    def done(self) -> bool:
+        """
+        ``True`` once the call has been sent.
+        """
+        return self._done
+
+    def result(self) -> Any:
+        """
+        Get the result of the call. If the call is still pending, sends it
+        along with all the other pending calls of its batch.
+
+        Raises:
+            :class:`~ape_ethereum.multicall.exceptions.CallFailedError`: When the call
+              failed, such as from a revert.
+
+        Returns:
+            Any: The decoded return value.
+        """
+        if not self._done:
+            self.batch.flush()
+
+        if self._error is not None:
+            raise self._error
+
+        return self._value
+
+    def _set_result(self, value: Any):
+        self._value = value
+        self._done = True
+
+    def _set_error(self, error: Exception):
+        self._error = error
+        self._done = True
+
+
+class Batch(ManagerAccessMixin):
+    """
+    A context for making view calls on contracts without sending them one by one.
+    While active, calls to view methods (without call kwargs) return a
+    :class:`~ape_ethereum.multicall.handlers.CallFuture`. The pending calls are
+    sent using ``aggregate3``, at most ``chunk_size`` calls at a time, when a
+    result is needed or the context exits. Each call is allowed to fail
+    without failing the others.
+
+    Usage example::
+
+        from ape_ethereum import multicall
+
+        with multicall.Batch():
+            balances = [token.balanceOf(account) for account in accounts]
+            reserves = pool.getReserves()
+
+        print([balance.result() for balance in balances], reserves.result())
+    """
+
+    def __init__(
+        self,
+        address: "AddressType" = MULTICALL3_ADDRESS,
+        supported_chains: list[int] | None = None,
+        chunk_size: int = 500,
+    ) -> None:
+        if chunk_size < 1:
+            raise ValueError("'chunk_size' must be at least 1.")
+
+        self.address = address
+        self.supported_chains = supported_chains
+        self.chunk_size = chunk_size
+        self.pending: list[CallFuture] = []
+        self._tokens: list = []
+
+    def __enter__(self) -> "Self":
+        self._tokens.append(_call_batch.set(self))
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        _call_batch.reset(self._tokens.pop())
+        if exc_type is None:
+            self.flush()
+
+    def add(self, call: ContractCallHandler, *args) -> CallFuture:
+        """
+        Add a view call to the batch.
+
+        Args:
+            call (:class:`~ape.contracts.base.ContractCallHandler`): The method to call.
+            *args: The arguments to invoke the method with.
+
+        Returns:
+            :class:`~ape_ethereum.multicall.handlers.CallFuture`
+        """
+        future = CallFuture(self, call, args)
+        self.pending.append(future)
+        return future
+
+    def flush(self):
+        """
+        Send all the pending calls.
+        """
+        pending, self.pending = self.pending, []
+        if not pending:
+            return
+
+        # NOTE: Calls made here, such as when converting arguments,
+        #   are sent rather than batched.
+        token = _call_batch.set(None)
+        try:
+            self._send(pending)
+        finally:
+            _call_batch.reset(token)
+
+    def _send(self, pending: list[CallFuture]):
+        multicall = Call(
+            address=self.address, supported_chains=self.supported_chains, max_calls=self.chunk_size
+        )
+        added = []
+        for future in pending:
+            try:
+                multicall.add(future.call, *future.args)
+            except Exception as err:  # noqa: BLE001
+                # Such as arguments that do not encode. Only fails this call.
+                future._set_error(err)
+                continue
+
+            added.append(future)
+
+        if not added:
+            return
+
+        try:
+            multicall()
+        except Exception as err:  # noqa: BLE001
+            for future in added:
+                future._set_error(err)
+
+            return
+
+        results = multicall._result or []
+        for future, abi, result in zip(added, multicall.abis, results, strict=True):
+            if not result.success:
+                future._set_error(CallFailedError(abi.signature, result.returnData))
+                continue
+
+            try:
+                future._set_result(multicall._decode_returndata(abi, result.returnData))
+            except DecodingError as err:
+                future._set_error(err)
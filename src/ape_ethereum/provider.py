@@ -2,14 +2,16 @@ import json
 import os
 import re
 import sys
+import threading
 import time
 from abc import ABC
+from collections import deque
 from collections.abc import Callable, Iterable, Iterator
 from concurrent.futures import ThreadPoolExecutor
 from copy import copy
-from functools import cached_property, wraps
+from functools import cached_property, partial, wraps
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, cast
+from typing import TYPE_CHECKING, Any, TypeVar, cast
 
 import ijson  # type: ignore
 import requests
@@ -69,9 +71,15 @@ from ape.types.events import ContractLog, LogFilter
 from ape.types.gas import AutoGasLimit
 from ape.types.trace import SourceTraceback
 from ape.utils.basemodel import ManagerAccessMixin
-from ape.utils.misc import DEFAULT_MAX_RETRIES_TX, gas_estimation_error_message, to_int
+from ape.utils.misc import (
+    DEFAULT_MAX_RETRIES_TX,
+    LRUCache,
+    gas_estimation_error_message,
+    to_int,
+)
 from ape.utils.rpc import request_with_retry
 from ape_ethereum._print import CONSOLE_ADDRESS, console_contract
+from ape_ethereum._subscriptions import SubscriptionClient
 from ape_ethereum.trace import CallTrace, TraceApproach, TransactionTrace
 from ape_ethereum.transactions import AccessList, AccessListTransaction, TransactionStatusEnum
 
@@ -90,6 +98,23 @@ DEFAULT_HOSTNAME = "localhost"
 DEFAULT_HTTP_URI = f"http://{DEFAULT_HOSTNAME}:{DEFAULT_PORT}"
 DEFAULT_SETTINGS = {"uri": DEFAULT_HTTP_URI}
 
+_T = TypeVar("_T")
+
+# Adaptive eth_getLogs paging.
+MAX_LOG_PAGE_SIZE = 100_000
+FAST_LOG_PAGE_SECONDS = 1.0
+SPARSE_LOG_PAGE_SIZE = 1_000
+LOG_PAGE_CAP_RESET_PAGES = 100
+_LOG_RANGE_ERROR_PATTERN = re.compile(
+    r"more than \d+ results|response size|too many (results|logs|blocks)|block range|"
+    r"range is too|limited to|exceeds? (the )?max",
+    re.IGNORECASE,
+)
+_LOG_TIMEOUT_ERROR_PATTERN = re.compile(r"timeout|timed out", re.IGNORECASE)
+_RATE_LIMIT_ERROR_PATTERN = re.compile(
+    r"rate.?limit|too many requests|\b429\b|compute units", re.IGNORECASE
+)
+
 
 def _sanitize_web3_url(msg: str) -> str:
     """Sanitize RPC URI from given log string"""
@@ -144,8 +169,35 @@ class Web3Provider(ProviderAPI, ABC):
 
     _supports_debug_trace_call: bool | None = None
 
+    _supports_batch_requests: bool | None = None
+    """
+    Is ``None`` until known. Set when using :meth:`make_requests`.
+    """
+
     _transaction_trace_cache: dict[str, TransactionTrace] = PrivateAttr(default_factory=dict)
 
+    _log_page_windows: dict[tuple, "_LogPageWindow"] = PrivateAttr(default_factory=dict)
+    """
+    The learned ``eth_getLogs`` page sizes, by network and log filter.
+    """
+
+    _block_cache: LRUCache[bytes, BlockAPI] = PrivateAttr(default_factory=LRUCache)
+    """
+    Blocks by hash. Sized by ``block_cache_size``.
+    """
+
+    _block_hashes: LRUCache[int, bytes] = PrivateAttr(default_factory=LRUCache)
+    """
+    Hashes by block number, only for blocks with enough confirmations.
+    """
+
+    _highest_block_number: int = 0
+
+    _fee_cache: dict[str, tuple[float, int]] = PrivateAttr(default_factory=dict)
+    """
+    Fee data (e.g. ``base_fee``) by name, with the time it was requested.
+    """
+
     def __new__(cls, *args, **kwargs):
         # Post-connection ops
         def post_connect_hook(connect):
@@ -180,6 +232,8 @@ class Web3Provider(ProviderAPI, ABC):
         logger.create_logger("web3.RequestManager", handlers=(_sanitize_web3_url,))
         logger.create_logger("web3.providers.HTTPProvider", handlers=(_sanitize_web3_url,))
         super().__init__(*args, **kwargs)
+        self._block_cache.maxsize = self.block_cache_size
+        self._block_hashes.maxsize = self.block_cache_size
 
     @property
     def web3(self) -> Web3:
@@ -629,17 +683,91 @@ class Web3Provider(ProviderAPI, ABC):
         if isinstance(block_id, str) and block_id.isnumeric():
             block_id = int(block_id)
 
+        if block := self._get_cached_block(block_id):
+            return block
+
         try:
             block_data = dict(self.web3.eth.get_block(block_id))
         except Exception as err:
             raise BlockNotFoundError(block_id, reason=str(err)) from err
 
-        return self.network.ecosystem.decode_block(block_data)
+        block = self.network.ecosystem.decode_block(block_data)
+        self._cache_block(block)
+        return block
+
+    def get_blocks(self, block_ids: Iterable["BlockID"]) -> list[BlockAPI]:
+        block_id_list = list(block_ids)
+        cached = [self._get_cached_block(block_id) for block_id in block_id_list]
+        missing = [block_id for block_id, block in zip(block_id_list, cached) if block is None]
+        fetched = iter(self._request_blocks(missing))
+        return [next(fetched) if block is None else block for block in cached]
+
+    def _request_blocks(self, block_ids: list["BlockID"]) -> list[BlockAPI]:
+        """
+        Request blocks from the node, skipping the cache. Used when checking for
+        re-orgs, as the block at a number may have changed since it was cached.
+        """
+        results = self.make_requests(
+            [_get_block_request(block_id) for block_id in block_ids], raise_on_error=False
+        )
+        blocks: list[BlockAPI] = []
+        for block_id, result in zip(block_ids, results):
+            if isinstance(result, Exception):
+                raise BlockNotFoundError(block_id, reason=str(result)) from result
+
+            elif not result:
+                raise BlockNotFoundError(block_id)
+
+            block = self.network.ecosystem.decode_block(dict(result))
+            self._cache_block(block)
+            blocks.append(block)
+
+        return blocks
+
+    def _get_cached_block(self, block_id: "BlockID") -> BlockAPI | None:
+        if isinstance(block_id, str) and block_id.isnumeric():
+            block_id = int(block_id)
+        elif isinstance(block_id, str) and is_hex(block_id) and len(block_id) != 66:
+            block_id = int(block_id, 16)
+
+        if isinstance(block_id, int):
+            if (block_hash := self._block_hashes.get(block_id)) is None:
+                return None
+
+            return self._block_cache.get(block_hash)
+
+        elif isinstance(block_id, bytes) or (is_hex(block_id) and len(block_id) == 66):
+            return self._block_cache.get(HexBytes(block_id))
+
+        # Tags, such as "latest", are never cached.
+        return None
+
+    def _cache_block(self, block: BlockAPI):
+        if block.hash is None or block.number is None:
+            # Pending blocks.
+            return
+
+        self._block_cache[HexBytes(block.hash)] = block
+        self._highest_block_number = max(self._highest_block_number, block.number)
+
+        # NOTE: Blocks on dev networks may change when reverting to snapshots.
+        confirmed = self._highest_block_number - self.network.required_confirmations
+        if not self.network.is_dev and block.number <= confirmed:
+            self._block_hashes[block.number] = HexBytes(block.hash)
+
+    def _invalidate_block_numbers(self):
+        """
+        Forget which block is at each number, such as after a re-org.
+        Blocks by hash remain cached, as they do not change.
+        """
+        self._block_hashes.clear()
 
     def _get_latest_block(self) -> BlockAPI:
         # perf: By-pass as much as possible since this is a common action.
         data = self._get_latest_block_rpc()
-        return self.network.ecosystem.decode_block(data)
+        block = self.network.ecosystem.decode_block(data)
+        self._cache_block(block)
+        return block
 
     def _get_latest_block_rpc(self) -> dict:
         return self.make_request("eth_getBlockByNumber", ["latest", False])
@@ -653,6 +781,26 @@ class Web3Provider(ProviderAPI, ABC):
     def get_code(self, address: "AddressType", block_id: "BlockID | None" = None) -> "ContractCode":
         return self.web3.eth.get_code(address, block_identifier=block_id)
 
+    def get_codes(
+        self,
+        addresses: Iterable["AddressType"],
+        block_id: "BlockID | None" = None,
+        raise_on_error: bool = True,
+    ) -> list["ContractCode | Exception"]:
+        if type(self).get_code is not Web3Provider.get_code:
+            # NOTE: The subclass changed how code is read, so use its method.
+            return super().get_codes(addresses, block_id=block_id, raise_on_error=raise_on_error)
+
+        block = "latest" if block_id is None else block_id
+        if isinstance(block, int):
+            block = to_hex(block)
+
+        results = self.make_requests(
+            [("eth_getCode", [address, block]) for address in addresses],
+            raise_on_error=raise_on_error,
+        )
+        return [r if isinstance(r, Exception) else HexBytes(r) for r in results]
+
     def get_storage(
         self, address: "AddressType", slot: int, block_id: "BlockID | None" = None
     ) -> HexBytes:
@@ -664,6 +812,22 @@ class Web3Provider(ProviderAPI, ABC):
 
             raise  # Raise original error
 
+    def get_storages(
+        self, slots: Iterable[tuple["AddressType", int]], block_id: "BlockID | None" = None
+    ) -> list[HexBytes]:
+        if type(self).get_storage is not Web3Provider.get_storage:
+            # NOTE: The subclass changed how storage is read, so use its method.
+            return super().get_storages(slots, block_id=block_id)
+
+        block = "latest" if block_id is None else block_id
+        if isinstance(block, int):
+            block = to_hex(block)
+
+        results = self.make_requests(
+            [("eth_getStorageAt", [address, to_hex(slot), block]) for address, slot in slots]
+        )
+        return [HexBytes(result) for result in results]
+
     def get_transaction_trace(self, transaction_hash: str, **kwargs) -> "TraceAPI":
         if transaction_hash in self._transaction_trace_cache:
             return self._transaction_trace_cache[transaction_hash]
@@ -1038,69 +1202,102 @@ class Web3Provider(ProviderAPI, ABC):
             if time_waiting > timeout:
                 raise ProviderError("Timed out waiting for next block.")
 
-        # Begin the daemon.
-        while True:
-            # The next block we want is simply 1 after the last.
-            next_block = last.number + 1
-            head = self._get_latest_block()
-            try:
-                if head.number is None or head.hash is None:
-                    raise ProviderError("Head block has no number or hash.")
-
-                # Use an "adjusted" head, based on the required confirmations.
-                adjusted_head = self.get_block(head.number - required_confirmations)
-                if adjusted_head.number is None or adjusted_head.hash is None:
-                    raise ProviderError("Adjusted head block has no number or hash.")
+        # When connected over websockets, wait for pushed heads instead of sleeping.
+        subscription = self._subscribe(("newHeads",))
+        pushed_head: BlockAPI | None = None
 
-            except Exception:  # noqa: BLE001
-                # TODO: I did encounter this sometimes in a re-org, needs better handling
-                # and maybe bubbling up the block number/hash exceptions above.
-                assert_chain_activity()
-                continue
-
-            if adjusted_head.number == last.number and adjusted_head.hash == last.hash:
-                # The chain has not moved! Verify we have activity.
-                assert_chain_activity()
+        def wait_for_next_head():
+            nonlocal subscription, pushed_head
+            if subscription is None:
                 time.sleep(wait_time)
-                continue
+                return
 
-            elif adjusted_head.number < last.number or (
-                adjusted_head.number == last.number and adjusted_head.hash != last.hash
-            ):
-                # Re-org detected! Error and catch up the chain.
-                logger.error(
-                    "Chain has reorganized since returning the last block. "
-                    "Try adjusting the required network confirmations."
-                )
-                # Catch up the chain by setting the "next" to this tiny head.
-                next_block = adjusted_head.number
-
-                last.time = time.time()
-                # NOTE: Drop down to code outside switch-of-ifs
-
-            elif adjusted_head.number < next_block:
-                # Wait for the next block.
-                # But first, let's make sure the chain is still active.
-                assert_chain_activity()
-                time.sleep(wait_time)
-                continue
-
-            # NOTE: Should only get here if yielding blocks!
-            #  Either because it is finally time or because a re-org allows us.
-            for block_idx in range(next_block, adjusted_head.number + 1):
-                block = self.get_block(block_idx)
-                if block.number is None or block.hash is None:
-                    raise ProviderError("Block has no number or hash.")
-
-                # Set the last action, used for checking timeouts and re-orgs.
-                last = YieldAction(number=block.number, hash=block.hash, time=time.time())
+            remaining = max(timeout - (time.time() - last.time), wait_time)
+            try:
+                notification = subscription.receive(timeout=remaining)
+            except ProviderError as err:
+                logger.warning(f"Block subscription lost, polling instead. Error: {err}")
+                subscription.close()
+                subscription = None
+                return
 
-                yield block
+            if notification is not None:
+                pushed_head = self.network.ecosystem.decode_block(notification[1])
 
-                # This is the point at which the daemon will end,
-                # provided the user passes in a `stop_block` arg.
-                if stop_block is not None and block.number >= stop_block:
-                    return
+        try:
+            # Begin the daemon.
+            while True:
+                # The next block we want is simply 1 after the last.
+                next_block = last.number + 1
+                head = self._get_latest_block() if pushed_head is None else pushed_head
+                pushed_head = None
+                try:
+                    if head.number is None or head.hash is None:
+                        raise ProviderError("Head block has no number or hash.")
+
+                    # Use an "adjusted" head, based on the required confirmations.
+                    adjusted_head = (
+                        head
+                        if required_confirmations == 0
+                        else self._request_blocks([head.number - required_confirmations])[0]
+                    )
+                    if adjusted_head.number is None or adjusted_head.hash is None:
+                        raise ProviderError("Adjusted head block has no number or hash.")
+
+                except Exception:  # noqa: BLE001
+                    # TODO: I did encounter this sometimes in a re-org, needs better handling
+                    # and maybe bubbling up the block number/hash exceptions above.
+                    assert_chain_activity()
+                    continue
+
+                if adjusted_head.number == last.number and adjusted_head.hash == last.hash:
+                    # The chain has not moved! Verify we have activity.
+                    assert_chain_activity()
+                    wait_for_next_head()
+                    continue
+
+                elif adjusted_head.number < last.number or (
+                    adjusted_head.number == last.number and adjusted_head.hash != last.hash
+                ):
+                    # Re-org detected! Error and catch up the chain.
+                    logger.error(
+                        "Chain has reorganized since returning the last block. "
+                        "Try adjusting the required network confirmations."
+                    )
+                    self._invalidate_block_numbers()
+                    # Catch up the chain by setting the "next" to this tiny head.
+                    next_block = adjusted_head.number
+
+                    last.time = time.time()
+                    # NOTE: Drop down to code outside switch-of-ifs
+
+                elif adjusted_head.number < next_block:
+                    # Wait for the next block.
+                    # But first, let's make sure the chain is still active.
+                    assert_chain_activity()
+                    wait_for_next_head()
+                    continue
+
+                # NOTE: Should only get here if yielding blocks!
+                #  Either because it is finally time or because a re-org allows us.
+                for block_idx in range(next_block, adjusted_head.number + 1):
+                    block = self.get_block(block_idx)
+                    if block.number is None or block.hash is None:
+                        raise ProviderError("Block has no number or hash.")
+
+                    # Set the last action, used for checking timeouts and re-orgs.
+                    last = YieldAction(number=block.number, hash=block.hash, time=time.time())
+
+                    yield block
+
+                    # This is the point at which the daemon will end,
+                    # provided the user passes in a `stop_block` arg.
+                    if stop_block is not None and block.number >= stop_block:
+                        return
+
+        finally:
+            if subscription is not None:
+                subscription.close()
 
     def poll_logs(
         self,
@@ -1118,13 +1315,28 @@ class Web3Provider(ProviderAPI, ABC):
         if stop_block is not None and stop_block <= (self._get_latest_block().number or 0):
             raise ValueError("'stop' argument must be in the future.")
 
-        for block in self.poll_blocks(stop_block, required_confirmations, new_block_timeout):
-            if block.number is None:
-                raise ValueError("Block number cannot be None")
+        block_time = self.network.block_time
+        wait_time = block_time / 2
+        timeout = (
+            (10.0 if self.network.is_dev else 50 * block_time)
+            if new_block_timeout is None
+            else new_block_timeout
+        )
+
+        # Start after the currently confirmed block, same as `poll_blocks()`.
+        last_confirmed = self.get_block(self.web3.eth.block_number - required_confirmations)
+        last_num = last_confirmed.number or 0
+        last_hash: bytes | None = last_confirmed.hash or HexBytes(0)
+        last_time = time.time()
+
+        def assert_chain_activity():
+            if time.time() - last_time > timeout:
+                raise ProviderError("Timed out waiting for next block.")
 
+        def get_log_filter(start: int, stop: int) -> LogFilter:
             log_params: dict[str, Any] = {
-                "start_block": block.number,
-                "stop_block": block.number,
+                "start_block": start,
+                "stop_block": stop,
                 "events": events,
             }
             if address is not None:
@@ -1132,8 +1344,158 @@ class Web3Provider(ProviderAPI, ABC):
             if topics is not None:
                 log_params["topic_filter"] = topics
 
-            log_filter = LogFilter(**log_params)
-            yield from self.get_contract_logs(log_filter)
+            return LogFilter(**log_params)
+
+        # When connected over websockets, logs and heads are pushed instead.
+        subscription_filter: dict[str, Any] = {}
+        if address is not None:
+            subscription_filter["address"] = address
+        if topics is not None:
+            subscription_filter["topics"] = topics
+
+        subscription = self._subscribe(("newHeads",), ("logs", subscription_filter))
+        # NOTE: Logs emitted before subscribing are requested; the rest are pushed.
+        pushed_from = self.web3.eth.block_number + 1 if subscription is not None else 0
+        pending_logs: dict[int, list[dict]] = {}
+
+        try:
+            while True:
+                if subscription is not None:
+                    remaining = max(timeout - (time.time() - last_time), wait_time)
+                    try:
+                        notification = subscription.receive(timeout=remaining)
+                    except ProviderError as err:
+                        logger.warning(f"Log subscription lost, polling instead. Error: {err}")
+                        subscription.close()
+                        subscription = None
+                        pending_logs.clear()
+                        continue
+
+                    if notification is None:
+                        assert_chain_activity()
+                        continue
+
+                    subscription_id, result = notification
+                    if subscription_id != subscription.subscription_ids[0]:
+                        # A pushed log. Hold it until its block is confirmed.
+                        log_block = to_int(result["blockNumber"])
+                        if not result.get("removed"):
+                            pending_logs.setdefault(log_block, []).append(result)
+                            continue
+
+                        elif log_block <= last_num:
+                            logger.error(
+                                "Chain has reorganized since returning the last logs. "
+                                "Try adjusting the required network confirmations."
+                            )
+                            self._invalidate_block_numbers()
+
+                        removed = (result["blockHash"], result["logIndex"])
+                        pending_logs[log_block] = [
+                            log
+                            for log in pending_logs.get(log_block, [])
+                            if (log["blockHash"], log["logIndex"]) != removed
+                        ]
+                        continue
+
+                    adjusted_head_num = to_int(result["number"]) - required_confirmations
+                    if stop_block is not None:
+                        adjusted_head_num = min(adjusted_head_num, stop_block)
+
+                    if adjusted_head_num <= last_num:
+                        assert_chain_activity()
+                        continue
+
+                    if last_num + 1 < pushed_from:
+                        yield from self.get_contract_logs(
+                            get_log_filter(last_num + 1, min(adjusted_head_num, pushed_from - 1))
+                        )
+
+                    for block_num in range(max(last_num + 1, pushed_from), adjusted_head_num + 1):
+                        if logs := pending_logs.pop(block_num, None):
+                            yield from self.network.ecosystem.decode_logs(logs, *events)
+
+                    # NOTE: Re-orgs are known from removed logs, so the hash is not needed.
+                    last_num = adjusted_head_num
+                    last_hash = None
+                    last_time = time.time()
+
+                else:
+                    # perf: Only the head number is needed to know if there are new blocks.
+                    adjusted_head_num = self.web3.eth.block_number - required_confirmations
+                    if stop_block is not None:
+                        adjusted_head_num = min(adjusted_head_num, stop_block)
+
+                    if adjusted_head_num <= last_num:
+                        assert_chain_activity()
+                        time.sleep(wait_time)
+                        continue
+
+                    # Headers for re-org detection: the last confirmed block (did it change?)
+                    # and the new adjusted head (the next "last confirmed" block).
+                    try:
+                        prev_block, adjusted_head = self._request_blocks(
+                            [last_num, adjusted_head_num]
+                        )
+                    except BlockNotFoundError:
+                        assert_chain_activity()
+                        continue
+
+                    if adjusted_head.number is None or adjusted_head.hash is None:
+                        raise ProviderError("Adjusted head block has no number or hash.")
+
+                    next_block = last_num + 1
+                    if last_hash is not None and prev_block.hash != last_hash:
+                        # Re-org detected! Error and catch up the chain.
+                        logger.error(
+                            "Chain has reorganized since returning the last logs. "
+                            "Try adjusting the required network confirmations."
+                        )
+                        self._invalidate_block_numbers()
+                        next_block = last_num
+
+                    # One ranged eth_getLogs for the whole newly-confirmed span.
+                    yield from self.get_contract_logs(
+                        get_log_filter(next_block, adjusted_head.number)
+                    )
+
+                    last_num = adjusted_head.number
+                    last_hash = adjusted_head.hash
+                    last_time = time.time()
+
+                # This is the point at which the daemon will end,
+                # provided the user passes in a `stop_block` arg.
+                if stop_block is not None and last_num >= stop_block:
+                    return
+
+        finally:
+            if subscription is not None:
+                subscription.close()
+
+    def _subscribe(self, *subscriptions: tuple) -> SubscriptionClient | None:
+        """
+        Create ``eth_subscribe`` subscriptions when there is a websocket RPC.
+        Returns ``None`` when unable to, meaning the caller should poll instead.
+        """
+        if not (uri := self.ws_uri):
+            return None
+
+        try:
+            client = SubscriptionClient(uri, headers=self.request_header)
+        except ProviderError as err:
+            logger.debug(f"Unable to subscribe, polling instead. Error: {err}")
+            return None
+
+        try:
+            for kind, *params in subscriptions:
+                client.subscribe(kind, *params)
+
+        except ProviderError as err:
+            logger.debug(f"Unable to subscribe, polling instead. Error: {err}")
+            client.close()
+            return None
+
+        return client
 
     def block_ranges(self, start: int = 0, stop: int | None = None, page: int | None = None):
         if stop is None:
@@ -1146,25 +1508,108 @@ class Web3Provider(ProviderAPI, ABC):
             yield start_block, stop_block
 
     def get_contract_logs(self, log_filter: LogFilter) -> Iterator[ContractLog]:
+        def decode(logs: list[dict]) -> list[ContractLog]:
+            return list(self.network.ecosystem.decode_logs(logs, *log_filter.events))
+
+        for page in self._get_log_pages(log_filter, decode):
+            yield from page
+
+    def get_contract_log_columns(self, log_filter: LogFilter) -> dict[str, list]:
+        if len(log_filter.events) != 1:
+            raise ValueError("Expecting exactly one event.")
+
+        event = log_filter.events[0]
+        ecosystem = self.network.ecosystem
+        columns = ecosystem.decode_logs_columnar([], event)
+        for page in self._get_log_pages(
+            log_filter, partial(ecosystem.decode_logs_columnar, event=event)
+        ):
+            for name, values in page.items():
+                columns[name].extend(values)
+
+        return columns
+
+    def _get_log_pages(
+        self, log_filter: LogFilter, decode: Callable[[list[dict]], _T]
+    ) -> Iterator[_T]:
+        """
+        Request the logs in pages, concurrently, decoding each page
+        in the worker thread. Pages are yielded in order.
+        """
         height = self.chain_manager.blocks.height
         start_block = log_filter.start_block
         stop_block_arg = log_filter.stop_block if log_filter.stop_block is not None else height
         stop_block = min(stop_block_arg, height)
-        block_ranges = self.block_ranges(start_block, stop_block, self.block_page_size)
+        window = self._get_log_page_window(log_filter)
 
-        def fetch_log_page(block_range):
-            start, stop = block_range
-            update = {"start_block": start, "stop_block": stop}
-            page_filter = log_filter.model_copy(update=update)
+        def fetch_log_page(start: int, stop: int) -> _T:
+            started = time.time()
+            logs, was_split = self._get_logs_in_range(log_filter, start, stop, window)
+            elapsed = time.time() - started
+            if (
+                not was_split
+                and stop - start + 1 >= window.size
+                and elapsed < FAST_LOG_PAGE_SECONDS
+                and len(logs) < SPARSE_LOG_PAGE_SIZE
+            ):
+                # Fast and sparse; request more blocks per page.
+                window.grow()
 
-            # NOTE: Using JSON mode since used as request data.
-            filter_params = page_filter.model_dump(mode="json")
-            logs = self.make_request("eth_getLogs", [filter_params])
-            return self.network.ecosystem.decode_logs(logs, *log_filter.events)
+            return decode(logs)
 
+        # NOTE: Pages are created as they are submitted (rather than up-front)
+        #   so that later pages use the latest learned window size.
         with ThreadPoolExecutor(self.concurrency) as pool:
-            for page in pool.map(fetch_log_page, block_ranges):
-                yield from page
+            pending: deque = deque()
+            next_start = start_block
+            while next_start <= stop_block or pending:
+                while next_start <= stop_block and len(pending) < self.concurrency:
+                    page_stop = min(stop_block, next_start + window.size - 1)
+                    pending.append(pool.submit(fetch_log_page, next_start, page_stop))
+                    next_start = page_stop + 1
+
+                yield pending.popleft().result()
+
+    def _get_log_page_window(self, log_filter: LogFilter) -> "_LogPageWindow":
+        key = (
+            self.network.choice,
+            tuple(sorted(log_filter.addresses)),
+            json.dumps(log_filter.topic_filter),
+        )
+        if key not in self._log_page_windows:
+            self._log_page_windows[key] = _LogPageWindow(self.block_page_size)
+
+        return self._log_page_windows[key]
+
+    def _get_logs_in_range(
+        self, log_filter: LogFilter, start: int, stop: int, window: "_LogPageWindow"
+    ) -> tuple[list[dict], bool]:
+        page_filter = log_filter.model_copy(update={"start_block": start, "stop_block": stop})
+
+        # NOTE: Using JSON mode since used as request data.
+        filter_params = page_filter.model_dump(mode="json")
+        try:
+            # NOTE: Also retries rate-limits reported as JSON-RPC errors.
+            logs = request_with_retry(
+                lambda: self._make_request("eth_getLogs", [filter_params]),
+                is_rate_limit=_is_rate_limit_error,
+            )
+        except (ProviderError, requests.Timeout) as err:
+            is_timeout = _is_log_timeout_error(err)
+            if start >= stop or not (is_timeout or _is_log_range_error(err)):
+                raise
+
+            # The node refused the range (too many results, response too large,
+            # or it timed out). Bisect the range and remember the smaller size.
+            # NOTE: A timeout may be transient, so it does not cap the size.
+            logger.debug(f"Splitting eth_getLogs range {start}-{stop}. Error: {err}")
+            window.shrink(stop - start + 1, cap=not is_timeout)
+            middle = (start + stop) // 2
+            left, _ = self._get_logs_in_range(log_filter, start, middle, window)
+            right, _ = self._get_logs_in_range(log_filter, middle + 1, stop, window)
+            return left + right, True
+
+        return logs or [], False
 
     def prepare_transaction(self, txn: TransactionAPI) -> TransactionAPI:
         # NOTE: Use "expected value" for Chain ID, so if it doesn't match actual, we raise
@@ -1178,18 +1623,25 @@ class Web3Provider(ProviderAPI, ABC):
             and isinstance(txn, StaticFeeTransaction)
             and txn.gas_price is None
         ):
-            txn.gas_price = self.gas_price
+            txn.gas_price = self._get_fee_data("gas_price")["gas_price"]
         elif txn_type in (
             TransactionType.DYNAMIC,
             TransactionType.SHARED_BLOB,
             TransactionType.SET_CODE,
         ):
+            fee_names = []
+            if txn.max_priority_fee is None:
+                fee_names.append("priority_fee")
+            if txn.max_fee is None:
+                fee_names.append("base_fee")
+
+            fees = self._get_fee_data(*fee_names)
             if txn.max_priority_fee is None:
-                txn.max_priority_fee = self.priority_fee
+                txn.max_priority_fee = fees["priority_fee"]
 
             if txn.max_fee is None:
                 multiplier = self.network.base_fee_multiplier
-                txn.max_fee = int(self.base_fee * multiplier + txn.max_priority_fee)
+                txn.max_fee = int(fees["base_fee"] * multiplier + txn.max_priority_fee)
 
             # else: Assume user specified the correct amount or txn will fail and waste gas
 
@@ -1230,6 +1682,41 @@ class Web3Provider(ProviderAPI, ABC):
 
         return txn
 
+    def _get_fee_data(self, *names: str) -> dict[str, int]:
+        """
+        Get fee properties, such as ``base_fee`` and ``priority_fee``, concurrently.
+        On live networks, the values are re-used for a block time.
+
+        **NOTE**: Only the fees are fetched here. The gas estimate needs the fees
+        first, so it is still requested after them.
+        """
+        fees = {name: fee for name in names if (fee := self._get_cached_fee(name)) is not None}
+        missing = [name for name in names if name not in fees]
+        if len(missing) <= 1:
+            # perf: Don't start threads when there is at most one request to make.
+            return {**fees, **{name: self._request_fee(name) for name in missing}}
+
+        with ThreadPoolExecutor(len(missing)) as pool:
+            futures = {name: pool.submit(self._request_fee, name) for name in missing}
+            return {**fees, **{name: future.result() for name, future in futures.items()}}
+
+    def _get_cached_fee(self, name: str) -> int | None:
+        ttl = self.network.block_time
+        if self.network.is_dev or ttl <= 0:
+            return None
+
+        elif (cached := self._fee_cache.get(name)) and time.time() - cached[0] < ttl:
+            return cached[1]
+
+        return None
+
+    def _request_fee(self, name: str) -> int:
+        value = getattr(self, name)
+        if not self.network.is_dev and self.network.block_time > 0:
+            self._fee_cache[name] = (time.time(), value)
+
+        return value
+
     def send_transaction(self, txn: TransactionAPI) -> ReceiptAPI:
         vm_err = None
         txn_data = None
@@ -1374,6 +1861,66 @@ class Web3Provider(ProviderAPI, ABC):
 
             raise ProviderError(str(err)) from err
 
+        return self._get_request_result(rpc, result)
+
+    def make_requests(
+        self, requests: Iterable[tuple[str, Iterable | None]], raise_on_error: bool = True
+    ) -> list[Any]:
+        request_list = [(rpc, list(parameters or [])) for rpc, parameters in requests]
+        batch_size = max(self.max_batch_size, 1)
+        results: list[Any] = []
+        for start in range(0, len(request_list), batch_size):
+            results.extend(self._make_batch_request(request_list[start : start + batch_size]))
+
+        if raise_on_error:
+            for result in results:
+                if isinstance(result, Exception):
+                    raise result
+
+        return results
+
+    def _make_batch_request(self, requests: list[tuple[str, list]]) -> list[Any]:
+        if len(requests) == 1 or self._supports_batch_requests is False:
+            return self._make_sequential_requests(requests)
+
+        batch = [(RPCEndpoint(rpc), parameters) for rpc, parameters in requests]
+        try:
+            responses = request_with_retry(lambda: self.web3.provider.make_batch_request(batch))
+        except (AttributeError, NotImplementedError, HTTPError) as err:
+            # NOTE: Either web3's provider class or the node itself does not
+            #   support JSON-RPC batches (rate-limits are retried above).
+            logger.debug(f"Batch requests not supported, using sequential requests. Error: {err}")
+            self._supports_batch_requests = False
+            return self._make_sequential_requests(requests)
+
+        if not isinstance(responses, list) or len(responses) != len(requests):
+            # The node responded to the batch with a single error, such as
+            # batches being disabled, or it dropped some of the requests.
+            logger.debug(f"Unexpected batch response, using sequential requests: {responses}")
+            self._supports_batch_requests = False
+            return self._make_sequential_requests(requests)
+
+        self._supports_batch_requests = True
+        results: list[Any] = []
+        for (rpc, _), response in zip(requests, responses):
+            try:
+                results.append(self._get_request_result(rpc, response))
+            except ApeException as err:
+                results.append(err)
+
+        return results
+
+    def _make_sequential_requests(self, requests: list[tuple[str, list]]) -> list[Any]:
+        results: list[Any] = []
+        for rpc, parameters in requests:
+            try:
+                results.append(self.make_request(rpc, parameters))
+            except Exception as err:  # noqa: BLE001
+                results.append(err)
+
+        return results
+
+    def _get_request_result(self, rpc: str, result: Any) -> Any:
         if "error" in result:
             error = result["error"]
             message = (
@@ -1662,6 +2209,7 @@ class EthereumNodeProvider(Web3Provider, ABC):
     def _set_web3(self):
         # Clear cached version when connecting to another URI.
         self._client_version = None
+        self._supports_batch_requests = None
         headers = self.network_manager.get_request_headers(
             self.network.ecosystem.name, self.network.name, self.name
         )
@@ -1814,6 +2362,45 @@ def _get_default_data_dir() -> Path:
         )
 
 
+def _get_block_request(block_id: "BlockID") -> tuple[str, list]:
+    if isinstance(block_id, str) and block_id.isnumeric():
+        block_id = int(block_id)
+
+    if isinstance(block_id, int):
+        return "eth_getBlockByNumber", [to_hex(block_id), False]
+
+    elif isinstance(block_id, bytes):
+        return "eth_getBlockByHash", [to_hex(block_id), False]
+
+    elif is_hex(block_id) and len(block_id) == 66:
+        return "eth_getBlockByHash", [block_id, False]
+
+    # Tags, such as "latest", or hex-str block numbers.
+    return "eth_getBlockByNumber", [block_id, False]
+
+
+def _is_rate_limit_error(err: Exception) -> bool:
+    if isinstance(err, requests.HTTPError) and err.response is not None:
+        return err.response.status_code == 429
+
+    return bool(_RATE_LIMIT_ERROR_PATTERN.search(str(err)))
+
+
+def _is_log_range_error(err: Exception) -> bool:
+    if _is_rate_limit_error(err):
+        # Retried (or given up on) as-is; a smaller range would not help.
+        return False
+
+    return bool(_LOG_RANGE_ERROR_PATTERN.search(str(err)))
+
+
+def _is_log_timeout_error(err: Exception) -> bool:
+    if _is_rate_limit_error(err):
+        return False
+
+    return isinstance(err, requests.Timeout) or bool(_LOG_TIMEOUT_ERROR_PATTERN.search(str(err)))
+
+
 def _is_uri(val: str) -> bool:
     return _is_http_url(val) or _is_ws_url(val) or _is_ipc_path(val)
 
@@ -1853,3 +2440,37 @@ class _LazyCallTrace(ManagerAccessMixin):
             return SourceTraceback.create(contract_src, self.trace, method_id)
 
         return None
+
+
+class _LogPageWindow:
+    """
+    The amount of blocks to request per ``eth_getLogs`` call for a log filter.
+    Shrinks when the node rejects a range and grows on fast, sparse pages.
+    """
+
+    def __init__(self, size: int):
+        self.size = max(size, 1)
+        self.max_size = MAX_LOG_PAGE_SIZE
+        self._pages_at_max_size = 0
+        self._lock = threading.Lock()
+
+    def shrink(self, failed_size: int, cap: bool = True):
+        with self._lock:
+            if cap:
+                # Don't grow back to a size the node has rejected.
+                self.max_size = max(min(self.max_size, failed_size - 1), 1)
+                self._pages_at_max_size = 0
+
+            self.size = max(min(self.size, failed_size // 2), 1)
+
+    def grow(self):
+        with self._lock:
+            if self.max_size < MAX_LOG_PAGE_SIZE and self.size >= self.max_size:
+                # The node's limits may change (e.g. a busy period ended),
+                # so eventually try larger sizes again.
+                self._pages_at_max_size += 1
+                if self._pages_at_max_size >= LOG_PAGE_CAP_RESET_PAGES:
+                    self.max_size = MAX_LOG_PAGE_SIZE
+                    self._pages_at_max_size = 0
+
+            self.size = min(self.size * 2, self.max_size)
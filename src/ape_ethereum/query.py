@@ -1,7 +1,17 @@
+from collections import deque
 from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from functools import singledispatchmethod
 
-from ape.api.query import ContractCreation, ContractCreationQuery, QueryAPI, QueryType
+from ape.api.query import (
+    ContractCreation,
+    ContractCreationQuery,
+    ContractMethodQuery,
+    ContractMethodResult,
+    QueryAPI,
+    QueryType,
+)
+from ape.contracts.base import ContractCall
 from ape.exceptions import APINotImplementedError, ProviderError, QueryEngineError
 from ape.types.address import AddressType
 
@@ -30,6 +40,44 @@ class EthereumQueryProvider(QueryAPI):
             return None
         return 5000
 
+    @estimate_query.register
+    def estimate_contract_method_query(self, query: ContractMethodQuery) -> int:
+        # NOTE: Very loose estimate of 100ms per call, where `concurrency` calls are in-flight.
+        num_calls = len(range(query.start_block, query.stop_block + 1, query.step))
+        return -(-num_calls // max(self.provider.concurrency, 1)) * 100
+
+    @perform_query.register
+    def perform_contract_method_query(
+        self, query: ContractMethodQuery
+    ) -> Iterator[ContractMethodResult]:
+        """
+        Call the method at each block, with ``concurrency`` calls in-flight at a time.
+        """
+        args = [
+            query.method_args[abi_input.name or f"{idx}"]
+            for idx, abi_input in enumerate(query.method.inputs)
+        ]
+        arguments = self.conversion_manager.convert_method_args(query.method, args)
+        call = ContractCall(abi=query.method, address=query.contract)
+
+        def call_at(block_number: int) -> ContractMethodResult:
+            value = call(*arguments, block_id=block_number)
+            return ContractMethodResult(block_number=block_number, value=value)
+
+        block_numbers = range(query.start_block, query.stop_block + 1, query.step)
+        concurrency = max(self.provider.concurrency, 1)
+        with ThreadPoolExecutor(concurrency) as pool:
+            # NOTE: Only keep `concurrency` calls in-flight so results are yielded
+            #       incrementally (and in order).
+            pending: deque[Future] = deque()
+            for block_number in block_numbers:
+                pending.append(pool.submit(call_at, block_number))
+                if len(pending) >= concurrency:
+                    yield pending.popleft().result()
+
+            while pending:
+                yield pending.popleft().result()
+
     @perform_query.register
     def perform_contract_creation_query(
         self, query: ContractCreationQuery
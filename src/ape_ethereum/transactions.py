@@ -388,14 +388,13 @@ class Receipt(ReceiptAPI):
         else:
             # If ABI is not provided, decode all events
             addresses = {x["address"] for x in self.logs}
-            contract_types = self.chain_manager.contracts.get_multiple(addresses)
-            # address → selector → abi
-            selectors = {
-                address.lower(): {
-                    encode_hex(keccak(text=abi.selector)): abi for abi in contract.events
-                }
-                for address, contract in contract_types.items()
+            contract_types = {
+                address.lower(): contract_type
+                for address, contract_type in self.chain_manager.contracts.get_multiple(
+                    addresses
+                ).items()
             }
+            log_decoder = self.chain_manager.contracts.log_decoder
 
             def get_default_log(
                 _log: dict, logs: ContractLogContainer, evt_name: str | None = None
@@ -418,20 +417,22 @@ class Receipt(ReceiptAPI):
             decoded_logs: ContractLogContainer = ContractLogContainer()
             for log in self.logs:
                 if contract_address := log.get("address"):
-                    lower_address = contract_address.lower()
-                    if lower_address in selectors and (topics := log.get("topics")):
-                        selector = encode_hex(topics[0])
-                        if selector in selectors[lower_address]:
-                            event_abi = selectors[lower_address][selector]
-                            decoded_logs.extend(
-                                self.provider.network.ecosystem.decode_logs([log], event_abi)
-                            )
-
-                        elif library_log := self._decode_ds_note(log):
+                    contract_type = contract_types.get(contract_address.lower())
+                    topics = log.get("topics")
+                    # NOTE: Uses the contract's own events first, then
+                    #  the events of all the other known contracts.
+                    if topics and (event_abi := log_decoder.get_event_abi(topics, contract_type)):
+                        decoded_logs.extend(
+                            self.provider.network.ecosystem.decode_logs([log], event_abi)
+                        )
+
+                    elif contract_type is not None and topics:
+                        if library_log := self._decode_ds_note(log):
                             decoded_logs.append(library_log)
 
                         else:
                             # Search for selector in other spots:
+                            selector = encode_hex(topics[0])
                             name = f"UnknownLogWithSelector_{selector}"
                             obj = get_default_log(log, decoded_logs, evt_name=name)
                             decoded_logs.append(obj)
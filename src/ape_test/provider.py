@@ -1,6 +1,6 @@
 import re
 from ast import literal_eval
-from collections.abc import Iterator
+from collections.abc import Iterable, Iterator
 from functools import cached_property
 from pathlib import Path
 from re import Pattern
@@ -493,6 +493,10 @@ class LocalProvider(TestProviderAPI, Web3Provider):
             HexBytes(address), block_number="latest" if block_id is None else block_id
         )
 
+    def get_blocks(self, block_ids: Iterable["BlockID"]) -> list[BlockAPI]:
+        # NOTE: Batching requests has no benefit for the in-process tester.
+        return [self.get_block(block_id) for block_id in block_ids]
+
     def get_contract_logs(self, log_filter: "LogFilter") -> Iterator["ContractLog"]:
         from_block = max(0, log_filter.start_block)
 
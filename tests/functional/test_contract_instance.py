@@ -862,6 +862,30 @@ def test_dir(vyper_contract_instance):
     assert sorted(actual) == sorted(expected)
 
 
+def test_getattr_shares_attribute_table(vyper_contract_instance):
+    other = ContractInstance(vyper_contract_instance.address, vyper_contract_instance.contract_type)
+    assert other._attribute_table_ is vyper_contract_instance._attribute_table_
+
+    # Handlers are only created when accessed.
+    assert "myNumber" not in other._view_methods_._handlers
+    handler = other.myNumber
+    assert other._view_methods_._handlers == {"myNumber": handler}
+    assert other.myNumber is handler
+
+    with pytest.raises(AttributeError, match="has no attribute 'notAMethod'"):
+        _ = other.notAMethod
+
+
+def test_getattr_corrupted_abi(vyper_contract_instance):
+    data = vyper_contract_instance.contract_type.model_dump(mode="json", by_alias=True)
+    event = next(abi for abi in data["abi"] if abi["type"] == "event")
+    event["name"] = "myNumber"
+    contract_type = ContractType.model_validate(data)
+    contract = ContractInstance(vyper_contract_instance.address, contract_type)
+    with pytest.raises(AttributeError, match="corrupted ABI"):
+        _ = contract.myNumber
+
+
 def test_encode_input_call(contract_instance, calldata):
     method = contract_instance.setNumber.call
     actual = method.encode_input(222)
@@ -879,6 +903,9 @@ def test_encode_input_transaction(contract_instance, calldata):
 BYTES_ARRAY_OVERLOAD = [{"name": "updateData", "type": "bytes[]"}]
 UINT_OVERLOAD = [{"name": "updateDataSize", "type": "uint256"}]
 INT_OVERLOAD = [{"name": "updateDataSize", "type": "int256"}]
+STRING_OVERLOAD = [{"name": "updateData", "type": "string"}]
+INT8_OVERLOAD = [{"name": "updateDataSize", "type": "int8"}]
+INT16_OVERLOAD = [{"name": "updateDataSize", "type": "int16"}]
 
 
 @pytest.fixture
@@ -985,6 +1012,50 @@ def test_encode_input_overloaded_struct_field_mismatch(eth_tester_provider, over
     assert calldata[:4] == selector_for(ecosystem, handler, "(uint256)")
 
 
+def test_encode_input_overloaded_remembers_selection(
+    mocker, eth_tester_provider, overloaded_contract
+):
+    # The winning overload is probed first next time, so only one encode is needed,
+    # and its calldata is re-used rather than encoding the args again.
+    ecosystem = eth_tester_provider.network.ecosystem
+    handler = overloaded_contract(
+        [BYTES_ARRAY_OVERLOAD, UINT_OVERLOAD], "0x8888888888888888888888888888888888888888"
+    ).getUpdateFee
+    assert handler.encode_input(1)[:4] == selector_for(ecosystem, handler, "uint256")
+
+    encode_spy = mocker.spy(ecosystem.__class__, "encode_calldata")
+    calldata = handler.encode_input(2)
+    assert calldata[:4] == selector_for(ecosystem, handler, "uint256")
+    assert encode_spy.call_count == 1
+
+    # Args of another shape are probed in declaration order again.
+    assert handler.encode_input([])[:4] == selector_for(ecosystem, handler, "bytes[]")
+
+
+def test_encode_input_overloaded_remembered_selection_keeps_declaration_order(
+    eth_tester_provider, overloaded_contract
+):
+    # A remembered winner must not win for args that fit an earlier overload.
+    ecosystem = eth_tester_provider.network.ecosystem
+    handler = overloaded_contract(
+        [UINT_OVERLOAD, STRING_OVERLOAD], "0x9999999999999999999999999999999999999999"
+    ).getUpdateFee
+    assert handler.encode_input("abcdefg")[:4] == selector_for(ecosystem, handler, "string")
+    assert handler.encode_input("2 ether")[:4] == selector_for(ecosystem, handler, "uint256")
+
+
+def test_encode_input_overloaded_remembered_selection_negative_int_boundary(
+    eth_tester_provider, overloaded_contract
+):
+    # -129 and -128 have the same bit_length(), but only -128 fits int8.
+    ecosystem = eth_tester_provider.network.ecosystem
+    handler = overloaded_contract(
+        [INT8_OVERLOAD, INT16_OVERLOAD], "0x1212121212121212121212121212121212121212"
+    ).getUpdateFee
+    assert handler.encode_input(-129)[:4] == selector_for(ecosystem, handler, "int16")
+    assert handler.encode_input(-128)[:4] == selector_for(ecosystem, handler, "int8")
+
+
 def test_can_encode_propagates_unexpected_errors(mocker, eth_tester_provider, overloaded_contract):
     # The probe only means "these args do not fit this overload". A bug inside conversion is
     # not that, so it must surface instead of being read as a failed match.
@@ -1,11 +1,12 @@
 import pytest
+from eth_utils import encode_hex, keccak
 from ethpm_types import ContractType
 
 from ape import Contract
 from ape.contracts import ContractInstance
-from ape.exceptions import ContractNotFoundError, ConversionError
+from ape.exceptions import ContractNotFoundError, ConversionError, ProviderError
 from ape.logging import LogLevel, logger
-from ape.managers._contractscache import _merge_contract_types
+from ape.managers._contractscache import DATA_CACHE_FILENAME, ApeDataCache, _merge_contract_types
 from ape_ethereum.proxies import ProxyInfo, ProxyType, _make_minimal_proxy
 from tests.conftest import explorer_test, skip_if_plugin_installed
 
@@ -29,6 +30,36 @@ def test_merge_contract_types(contract_instance):
     assert len(new_ct.abi) == len(_merge_contract_types(new_ct, modified_ct).abi)
 
 
+def test_data_cache_evicts_to_disk(tmp_path, contract_0):
+    contract_type = contract_0.contract_type
+    cache = ApeDataCache(
+        tmp_path, "ethereum", "sepolia", "contract_types", ContractType, memory_size=1
+    )
+    cache["0xa"] = contract_type
+    cache["0xb"] = contract_type
+    assert list(cache.memory) == ["0xb"]
+    assert cache.memory.evictions == 1
+    # Read back from disk.
+    assert cache["0xa"] == contract_type
+
+    # Nothing to read back from on local networks, so memory is not bounded.
+    local_cache = ApeDataCache(
+        tmp_path, "ethereum", "local", "contract_types", ContractType, memory_size=1
+    )
+    local_cache["0xa"] = contract_type
+    local_cache["0xb"] = contract_type
+    assert list(local_cache.memory) == ["0xa", "0xb"]
+
+
+def test_data_cache_file_is_not_the_query_cache_file(config, chain):
+    # Else, ape-cache would treat the contract cache as its query database.
+    cache = ApeDataCache(config.DATA_FOLDER, "ethereum", "sepolia", "contract_types", ContractType)
+    query_database_file = chain.query_manager.engines["cache"]._get_database_file(
+        "ethereum", "sepolia"
+    )
+    assert cache._base_path / DATA_CACHE_FILENAME != query_database_file
+
+
 def test_instance_at(chain, contract_instance):
     contract = chain.contracts.instance_at(str(contract_instance.address))
     assert contract.contract_type == contract_instance.contract_type
@@ -408,6 +439,140 @@ def test_get_multiple_include_non_contract_address(vyper_contract_instance, chai
     assert actual[vyper_contract_instance.address] == vyper_contract_instance.contract_type
 
 
+@explorer_test
+def test_get_multiple_fetches_missing_from_explorer(
+    mock_explorer, create_mock_sepolia, chain, owner, project
+):
+    contract = owner.deploy(project.VyperContract, 0, required_confirmations=0)
+    mock_explorer.get_contract_type.side_effect = lambda a: contract.contract_type
+
+    with create_mock_sepolia() as network:
+        del chain.contracts[contract.address]
+        network.__dict__["explorer"] = mock_explorer
+        try:
+            actual = chain.contracts.get_multiple((contract.address, owner.address))
+        finally:
+            network.__dict__["explorer"] = None
+
+        assert actual == {contract.address: contract.contract_type}
+        # The account has no code, so it is not looked up.
+        mock_explorer.get_contract_type.assert_called_once_with(contract.address)
+        # Cached for next time.
+        assert chain.contracts.contract_types[contract.address] == contract.contract_type
+        mock_explorer.get_contract_type.reset_mock()
+
+
+@explorer_test
+def test_get_remembers_missing_contract_type(
+    mock_explorer, create_mock_sepolia, chain, owner, project
+):
+    contract = owner.deploy(project.VyperContract, 0, required_confirmations=0)
+    mock_explorer.get_contract_type.return_value = None
+
+    with create_mock_sepolia() as network:
+        del chain.contracts[contract.address]
+        network.__dict__["explorer"] = mock_explorer
+        try:
+            assert chain.contracts.get(contract.address, detect_proxy=False) is None
+            assert chain.contracts.get(contract.address, detect_proxy=False) is None
+            # The second look-up did not ask the explorer again.
+            assert mock_explorer.get_contract_type.call_count == 1
+
+            # Re-fetches once forgotten.
+            mock_explorer.get_contract_type.return_value = contract.contract_type
+            chain.contracts.forget_missing_contract_type(contract.address)
+            actual = chain.contracts.get(contract.address, detect_proxy=False)
+        finally:
+            network.__dict__["explorer"] = None
+            mock_explorer.get_contract_type.return_value = None
+
+        assert actual == contract.contract_type
+        assert mock_explorer.get_contract_type.call_count == 2
+        assert contract.address not in chain.contracts.missing_contract_types
+        mock_explorer.get_contract_type.reset_mock()
+
+
+def test_cache_contract_type_forgets_missing_contract_type(
+    create_mock_sepolia, chain, owner, project
+):
+    contract = owner.deploy(project.VyperContract, 0, required_confirmations=0)
+
+    with create_mock_sepolia():
+        del chain.contracts[contract.address]
+        chain.contracts._cache_missing_contract_type(contract.address)
+        chain.contracts.cache_contract_type(contract.address, contract.contract_type)
+
+        # Simulate a restart, where only the disk caches remain.
+        chain.contracts.contract_types.memory.clear()
+        chain.contracts.missing_contract_types.memory.clear()
+        try:
+            assert not chain.contracts._is_missing_contract_type(contract.address)
+            actual = chain.contracts.get(contract.address, detect_proxy=False)
+        finally:
+            del chain.contracts[contract.address]
+
+        assert actual == contract.contract_type
+
+
+@explorer_test
+def test_get_multiple_remembers_missing_contract_type(
+    mock_explorer, create_mock_sepolia, chain, owner, project
+):
+    contract = owner.deploy(project.VyperContract, 0, required_confirmations=0)
+    mock_explorer.get_contract_type.return_value = None
+
+    with create_mock_sepolia() as network:
+        del chain.contracts[contract.address]
+        network.__dict__["explorer"] = mock_explorer
+        try:
+            assert chain.contracts.get_multiple((contract.address,)) == {}
+            assert chain.contracts.get_multiple((contract.address,)) == {}
+            # The second look-up did not ask the explorer again.
+            assert mock_explorer.get_contract_type.call_count == 1
+
+            # Also remembered for single look-ups.
+            assert chain.contracts.get(contract.address, detect_proxy=False) is None
+            assert mock_explorer.get_contract_type.call_count == 1
+        finally:
+            network.__dict__["explorer"] = None
+            chain.contracts.forget_missing_contract_type(contract.address)
+            mock_explorer.get_contract_type.reset_mock()
+
+
+@explorer_test
+def test_get_multiple_skips_code_errors(
+    mock_explorer, create_mock_sepolia, chain, owner, project, mocker
+):
+    contract = owner.deploy(project.VyperContract, 0, required_confirmations=0)
+    other_contract = owner.deploy(project.VyperContract, 0, required_confirmations=0)
+    mock_explorer.get_contract_type.side_effect = lambda a: contract.contract_type
+    provider_cls = type(chain.provider)
+    get_codes = provider_cls.get_codes
+
+    def get_codes_failing_for_other_contract(self, addresses, **kwargs):
+        codes = get_codes(self, addresses, **kwargs)
+        return [
+            ProviderError("header not found") if a == other_contract.address else code
+            for a, code in zip(addresses, codes)
+        ]
+
+    mocker.patch.object(provider_cls, "get_codes", get_codes_failing_for_other_contract)
+    with create_mock_sepolia() as network:
+        del chain.contracts[contract.address]
+        del chain.contracts[other_contract.address]
+        network.__dict__["explorer"] = mock_explorer
+        try:
+            actual = chain.contracts.get_multiple((contract.address, other_contract.address))
+        finally:
+            network.__dict__["explorer"] = None
+
+        # Only the failing address is skipped (and not remembered as missing).
+        assert actual == {contract.address: contract.contract_type}
+        mock_explorer.get_contract_type.assert_called_once_with(contract.address)
+        assert other_contract.address not in chain.contracts.missing_contract_types
+        mock_explorer.get_contract_type.reset_mock()
+
+
 @skip_if_plugin_installed("ens")
 def test_get_multiple_attempts_to_convert(chain):
     with pytest.raises(ConversionError):
@@ -708,3 +873,29 @@ def test_clear_local_caches(chain, vyper_contract_instance, project, owner):
     assert chain.contracts.blueprints.memory == {}
     assert chain.contracts.contract_types.memory == {}
     assert chain.contracts.contract_creations.memory == {}
+
+
+def test_log_decoder(chain, vyper_contract_instance, owner, not_owner):
+    receipt = vyper_contract_instance.setNumber(5, sender=owner)
+
+    # Decodes using the index, even when the emitter has no contract type.
+    log = {**receipt.logs[0], "address": owner.address}
+    actual = chain.contracts.log_decoder.decode_logs([log])
+    assert len(actual) == 1
+    assert actual[0].event_name == "NumberChange"
+    assert actual[0].contract_address == owner.address
+
+    # Well-known standards are always indexed.
+    transfer_log = {
+        "address": owner.address,
+        "topics": [
+            encode_hex(keccak(text="Transfer(address,address,uint256)")),
+            f"0x{owner.address[2:].lower():0>64}",
+            f"0x{not_owner.address[2:].lower():0>64}",
+        ],
+        "data": f"0x{7:064x}",
+    }
+    actual = chain.contracts.log_decoder.decode_logs([transfer_log], fetch_contract_types=False)
+    assert len(actual) == 1
+    assert actual[0].event_name == "Transfer"
+    assert actual[0].event_arguments == {"from": owner.address, "to": not_owner.address, "value": 7}
@@ -157,6 +157,22 @@ def test_encode_calldata(ethereum, address):
     assert actual == expected
 
 
+def test_encode_calldata_reuses_codec(ethereum, address):
+    abi = make_method_abi(
+        "callMe",
+        inputs=[ABIType(name="a", type="address"), ABIType(name="b", type="uint256")],
+    )
+    calldata = ethereum.encode_calldata(abi, address, 5)
+    codec = ethereum._get_method_codec(abi)
+    assert ethereum.encode_calldata(abi, address, 5) == calldata
+    assert ethereum.decode_calldata(abi, calldata) == {"a": address, "b": 5}
+    assert ethereum._get_method_codec(abi) is codec
+
+    # Another ABI object gets its own codec, even with the same selector.
+    other_abi = abi.model_copy(deep=True)
+    assert ethereum._get_method_codec(other_abi) is not codec
+
+
 @pytest.mark.parametrize(
     "sequence_type,item_type",
     [
@@ -327,6 +343,19 @@ def test_decode_logs_empty_list(ethereum, event_abi):
     assert actual == []
 
 
+def test_decode_logs_columnar(ethereum, vyper_contract_instance):
+    abi = vyper_contract_instance.NumberChange.abi
+    other_log = {**LOG, "topics": [f"0x{0:064x}", *LOG["topics"][1:]]}
+    expected = next(iter(ethereum.decode_logs([LOG], abi)))
+
+    actual = ethereum.decode_logs_columnar([LOG, other_log, LOG], abi)
+    assert actual["block_number"] == [expected.block_number] * 2
+    assert actual["log_index"] == [expected.log_index] * 2
+    assert actual["contract_address"] == [expected.contract_address] * 2
+    for name, value in expected.event_arguments.items():
+        assert actual[name] == [value] * 2
+
+
 def test_decode_logs_with_struct_from_interface(ethereum):
     abi = EventABI.model_validate(
         {
@@ -4,10 +4,11 @@ import pytest
 from eth_pydantic_types import HexBytes
 from ethpm_types import ContractType
 
-from ape.exceptions import APINotImplementedError
-from ape_ethereum.multicall import Call
+from ape.contracts.base import _call_batch
+from ape.exceptions import APINotImplementedError, ContractLogicError, ProviderError
+from ape_ethereum.multicall import Batch, Call
 from ape_ethereum.multicall.constants import MULTICALL3_ADDRESS, MULTICALL3_CONTRACT_TYPE
-from ape_ethereum.multicall.exceptions import UnsupportedChainError
+from ape_ethereum.multicall.exceptions import CallFailedError, UnsupportedChainError
 
 RETURNDATA = HexBytes("0x4a821464")
 
@@ -111,3 +112,155 @@ def test_add_overloaded_records_the_encoded_overload(chain, eth_tester_provider)
     ecosystem = eth_tester_provider.network.ecosystem
     assert call.abis[0].inputs[0].canonical_type == "bytes[]"
     assert call.calls[0]["callData"][:4] == ecosystem.get_method_selector(call.abis[0])
+
+
+def mock_aggregate3(mocker, aggregate3):
+    # NOTE: Avoids needing Multicall3 on the local test chain.
+    return mocker.patch.object(
+        Call, "handler", new_callable=mocker.PropertyMock, return_value=aggregate3
+    )
+
+
+def test_call_chunks(vyper_contract_instance, mocker):
+    sent = []
+
+    def aggregate3(calls, **kwargs):
+        sent.append((len(calls), kwargs.get("block_id")))
+        return [ReturnData(True, HexBytes(idx.to_bytes(32, "big"))) for idx in range(len(calls))]
+
+    mock_aggregate3(mocker, aggregate3)
+    call = Call(max_calls=2)
+    for _ in range(5):
+        call.add(vyper_contract_instance.myNumber)
+
+    assert list(call()) == [0, 1, 0, 1, 0]
+    assert sorted(size for size, _ in sent) == [1, 2, 2]
+    # All the chunks are at the same block.
+    assert len({block_id for _, block_id in sent}) == 1
+
+
+def test_call_chunks_by_calldata_size(vyper_contract_instance):
+    call = Call(max_calldata_size=72)
+    for num in range(3):
+        call.add(vyper_contract_instance.setNumber, num)
+
+    # Each calldata is 36 bytes.
+    assert [len(chunk) for chunk in call._get_chunks()] == [2, 1]
+
+
+def test_call_bisects_failed_request(vyper_contract_instance, mocker):
+    selector = vyper_contract_instance.setNumber.encode_input(1)[:4]
+
+    def aggregate3(calls, **kwargs):
+        if any(c["callData"][:4] == selector for c in calls):
+            raise ContractLogicError("Bad call")
+
+        return [ReturnData(True, HexBytes((5).to_bytes(32, "big"))) for _ in calls]
+
+    mock_aggregate3(mocker, aggregate3)
+    call = Call()
+    call.add(vyper_contract_instance.myNumber)
+    call.add(vyper_contract_instance.setNumber, 1)
+    call.add(vyper_contract_instance.myNumber)
+    call.add(vyper_contract_instance.myNumber)
+
+    # Only the bad call fails.
+    assert list(call()) == [5, None, 5, 5]
+
+    call = Call()
+    call.add(vyper_contract_instance.myNumber)
+    call.add(vyper_contract_instance.setNumber, 1, allowFailure=False)
+    with pytest.raises(ContractLogicError):
+        call()
+
+
+def test_call_raises_connection_errors(vyper_contract_instance, mocker):
+    def aggregate3(calls, **kwargs):
+        raise ProviderError("429 Client Error: Too Many Requests")
+
+    handler = mocker.MagicMock(side_effect=aggregate3)
+    mock_aggregate3(mocker, handler)
+    call = Call()
+    call.add(vyper_contract_instance.myNumber)
+    call.add(vyper_contract_instance.myNumber)
+
+    # Not retried in halves, as smaller requests would fail the same way.
+    with pytest.raises(ProviderError, match="Too Many Requests"):
+        call()
+
+    assert handler.call_count == 1
+
+
+def test_batch(vyper_contract_instance, mocker):
+    sent = []
+
+    def aggregate3(calls, **kwargs):
+        sent.append(len(calls))
+        # Fail the 2nd call of the full chunk.
+        return [
+            ReturnData(len(calls) < 2 or idx != 1, HexBytes((5).to_bytes(32, "big")))
+            for idx in range(len(calls))
+        ]
+
+    mock_aggregate3(mocker, aggregate3)
+
+    with Batch(chunk_size=2):
+        futures = [vyper_contract_instance.myNumber() for _ in range(3)]
+        assert not any(f.done for f in futures)
+
+    # Sent in chunks, on exit.
+    assert sorted(sent) == [1, 2]
+    assert all(f.done for f in futures)
+    assert futures[0].result() == 5
+    assert futures[2].result() == 5
+    with pytest.raises(CallFailedError):
+        futures[1].result()
+
+    # Calls are sent on their own again after the batch.
+    assert isinstance(vyper_contract_instance.myNumber(), int)
+
+
+def test_call_in_batch(vyper_contract_instance, mocker):
+    def aggregate3(calls, **kwargs):
+        # Otherwise, the `aggregate3` call itself would be added to the batch.
+        assert _call_batch.get() is None
+        return [ReturnData(True, HexBytes((3).to_bytes(32, "big"))) for _ in calls]
+
+    mock_aggregate3(mocker, aggregate3)
+
+    with Batch() as batch:
+        # A Call is sent right away, rather than added to the batch.
+        call = Call().add(vyper_contract_instance.myNumber)
+        assert list(call()) == [3]
+        assert not batch.pending
+
+
+def test_batch_result_sends_pending_calls(vyper_contract_instance, mocker):
+    def aggregate3(calls, **kwargs):
+        return [ReturnData(True, HexBytes((7).to_bytes(32, "big"))) for _ in calls]
+
+    mock_aggregate3(mocker, aggregate3)
+
+    with Batch() as batch:
+        future = vyper_contract_instance.myNumber()
+        assert future.result() == 7
+        assert not batch.pending
+
+
+def test_call_at_blocks(vyper_contract_instance, mocker):
+    def aggregate3(calls, block_id=None, **kwargs):
+        return [
+            ReturnData(True, HexBytes((block_id + idx).to_bytes(32, "big")))
+            for idx in range(len(calls))
+        ]
+
+    mock_aggregate3(mocker, aggregate3)
+    call = Call(max_calls=1)
+    call.add(vyper_contract_instance.myNumber)
+    call.add(vyper_contract_instance.myNumber)
+
+    df = call.at_blocks([10, 20, 30], columns=["a", "b"])
+    assert list(df.index) == [10, 20, 30]
+    # Each call is its own chunk, so both are first in their request.
+    assert list(df["a"]) == [10, 20, 30]
+    assert list(df["b"]) == [10, 20, 30]
@@ -22,11 +22,15 @@ from ape.exceptions import (
     UnknownSnapshotError,
 )
 from ape.types.events import LogFilter
+from ape.utils.misc import ZERO_ADDRESS, to_int
 from ape.utils.testing import DEFAULT_TEST_CHAIN_ID
 from ape_ethereum.provider import (
+    LOG_PAGE_CAP_RESET_PAGES,
+    MAX_LOG_PAGE_SIZE,
     EthereumNodeProvider,
     Web3Provider,
     _get_trace_from_revert_kwargs,
+    _LogPageWindow,
     _sanitize_web3_url,
 )
 from ape_ethereum.trace import TransactionTrace
@@ -56,6 +60,132 @@ def test_get_block_not_found(eth_tester_provider):
         eth_tester_provider.get_block(block_id)
 
 
+def test_get_blocks(mock_web3, ethereum):
+    provider = EthereumNodeProvider(network=ethereum.local)
+    provider._web3 = mock_web3
+    block_hash = f"0x{'ab' * 32}"
+
+    def make_batch_request(requests):
+        return [
+            {
+                "result": {
+                    "number": params[0] if rpc == "eth_getBlockByNumber" else "0x5",
+                    "hash": params[0] if rpc == "eth_getBlockByHash" else block_hash,
+                    "timestamp": "0x1",
+                    "gasLimit": "0x1",
+                    "gasUsed": "0x0",
+                }
+            }
+            for rpc, params in requests
+        ]
+
+    mock_web3.provider.make_batch_request.side_effect = make_batch_request
+    actual = provider.get_blocks([0, "1", block_hash, "0x2"])
+    assert [b.number for b in actual] == [0, 1, 5, 2]
+    assert mock_web3.provider.make_batch_request.call_count == 1
+    rpcs = [rpc for rpc, _ in mock_web3.provider.make_batch_request.call_args[0][0]]
+    assert rpcs == ["eth_getBlockByNumber"] * 2 + ["eth_getBlockByHash", "eth_getBlockByNumber"]
+
+
+def test_get_blocks_not_found(mock_web3, ethereum):
+    provider = EthereumNodeProvider(network=ethereum.local)
+    provider._web3 = mock_web3
+    mock_web3.provider.make_batch_request.return_value = [
+        {
+            "result": {
+                "number": "0x0",
+                "hash": f"0x{'ab' * 32}",
+                "timestamp": "0x1",
+                "gasLimit": "0x1",
+                "gasUsed": "0x0",
+            }
+        },
+        {"result": None},
+    ]
+    with pytest.raises(BlockNotFoundError, match="Block with ID '1000' not found."):
+        provider.get_blocks([0, 1000])
+
+
+def test_get_block_cached(mock_web3, ethereum):
+    provider = EthereumNodeProvider(network=ethereum.sepolia)
+    provider._web3 = mock_web3
+
+    def get_block(block_id):
+        number = 100 if block_id == "latest" else block_id
+        return {
+            "number": number,
+            "hash": HexBytes(number.to_bytes(32, "big")),
+            "timestamp": 1,
+            "gasLimit": 1,
+            "gasUsed": 0,
+        }
+
+    mock_web3.eth.get_block.side_effect = get_block
+    provider.get_block("latest")
+    block = provider.get_block(50)
+    assert mock_web3.eth.get_block.call_count == 2
+
+    # Confirmed blocks are cached by number and all blocks by hash.
+    assert provider.get_block(50) is block
+    assert provider.get_block("50") is block
+    assert provider.get_block(block.hash) is block
+    assert mock_web3.eth.get_block.call_count == 2
+
+    # "latest" is never cached.
+    provider.get_block("latest")
+    assert mock_web3.eth.get_block.call_count == 3
+
+    # After a re-org, blocks by number are requested again.
+    provider._invalidate_block_numbers()
+    provider.get_block(50)
+    assert mock_web3.eth.get_block.call_count == 4
+
+
+def test_get_storages(mock_web3, ethereum):
+    provider = EthereumNodeProvider(network=ethereum.local)
+    provider._web3 = mock_web3
+    mock_web3.provider.make_batch_request.side_effect = lambda reqs: [
+        {"result": to_hex(int(params[1], 16).to_bytes(32, "big"))} for _, params in reqs
+    ]
+    actual = provider.get_storages([(ZERO_ADDRESS, 1), (ZERO_ADDRESS, 2)], block_id=5)
+    assert actual == [HexBytes(i.to_bytes(32, "big")) for i in (1, 2)]
+    assert mock_web3.provider.make_batch_request.call_count == 1
+    requests = mock_web3.provider.make_batch_request.call_args[0][0]
+    assert requests[0] == ("eth_getStorageAt", [ZERO_ADDRESS, "0x1", "0x5"])
+
+
+def test_get_codes_errors_in_results(mock_web3, ethereum):
+    provider = EthereumNodeProvider(network=ethereum.local)
+    provider._web3 = mock_web3
+    addresses = [f"0x{'1' * 40}", f"0x{'2' * 40}"]
+    mock_web3.provider.make_batch_request.return_value = [
+        {"result": "0x6001"},
+        {"error": {"message": "header not found"}},
+    ]
+    actual = provider.get_codes(addresses, raise_on_error=False)
+    assert actual[0] == HexBytes("0x6001")
+    assert isinstance(actual[1], ProviderError)
+
+    with pytest.raises(ProviderError, match="header not found"):
+        provider.get_codes(addresses)
+
+
+def test_get_codes_uses_overridden_get_code(mock_web3, ethereum):
+    class MyProvider(EthereumNodeProvider):
+        def get_code(self, address, block_id=None):
+            if address == ZERO_ADDRESS:
+                raise ProviderError("header not found")
+
+            return HexBytes("0x6001")
+
+    provider = MyProvider(network=ethereum.local)
+    provider._web3 = mock_web3
+    actual = provider.get_codes([f"0x{'1' * 40}", ZERO_ADDRESS], raise_on_error=False)
+    assert actual[0] == HexBytes("0x6001")
+    assert isinstance(actual[1], ProviderError)
+    assert mock_web3.provider.make_batch_request.call_count == 0
+
+
 def test_get_block_transaction(vyper_contract_instance, owner, eth_tester_provider):
     # Ensure a transaction in latest block
     receipt = vyper_contract_instance.setNumber(900, sender=owner)
@@ -314,6 +444,195 @@ def test_get_contract_logs_single_log_unmatched(
     assert len(logs) == 0
 
 
+def test_get_contract_logs_splits_rejected_ranges(mock_web3, ethereum):
+    provider = EthereumNodeProvider(network=ethereum.local)
+    provider._web3 = mock_web3
+    provider.block_page_size = 100
+
+    def make_request(rpc, params):
+        start_block = int(params[0]["fromBlock"], 16)
+        stop_block = int(params[0]["toBlock"], 16)
+        if stop_block - start_block >= 25:
+            return {"error": {"message": "query returned more than 10000 results"}}
+
+        return {"result": [{"blockNumber": hex(start_block)}]}
+
+    mock_web3.provider.make_request.side_effect = make_request
+    log_filter = LogFilter(addresses=[ZERO_ADDRESS], start_block=0, stop_block=99)
+    window = provider._get_log_page_window(log_filter)
+    logs, was_split = provider._get_logs_in_range(log_filter, 0, 99, window)
+    assert was_split
+    assert [int(log["blockNumber"], 16) for log in logs] == [0, 25, 50, 75]
+
+    # The learned size is remembered for the same filter.
+    assert provider._get_log_page_window(log_filter) is window
+    assert window.size == 25
+
+    # Growing never goes back to a rejected size.
+    window.grow()
+    window.grow()
+    assert window.size == 49
+
+
+def test_get_contract_logs_retries_rate_limits(mocker, mock_web3, ethereum):
+    provider = EthereumNodeProvider(network=ethereum.local)
+    provider._web3 = mock_web3
+    sleep = mocker.patch("ape.utils.rpc.time.sleep")
+    mock_web3.provider.make_request.side_effect = [
+        {"error": {"message": "Too Many Requests"}},
+        {"error": {"message": "rate limit exceeded"}},
+        {"result": [{"blockNumber": "0x0"}]},
+    ]
+    log_filter = LogFilter(addresses=[ZERO_ADDRESS], start_block=0, stop_block=99)
+    window = provider._get_log_page_window(log_filter)
+    logs, was_split = provider._get_logs_in_range(log_filter, 0, 99, window)
+
+    # Rate-limits are retried rather than bisected.
+    assert not was_split
+    assert logs == [{"blockNumber": "0x0"}]
+    assert sleep.call_count == 2
+    assert window.max_size == MAX_LOG_PAGE_SIZE
+
+
+def test_log_page_window_timeouts_do_not_cap_size():
+    window = _LogPageWindow(100)
+    window.shrink(100, cap=False)
+    assert window.size == 50
+    assert window.max_size == MAX_LOG_PAGE_SIZE
+
+
+def test_log_page_window_cap_resets():
+    window = _LogPageWindow(100)
+    window.shrink(100)
+    assert window.max_size == 99
+
+    for _ in range(LOG_PAGE_CAP_RESET_PAGES):
+        window.grow()
+
+    # After enough pages at the cap, larger sizes are tried again.
+    assert window.max_size == MAX_LOG_PAGE_SIZE
+    window.grow()
+    assert window.size == 198
+
+
+def test_poll_logs_uses_ranged_requests(mocker, mock_web3, ethereum):
+    provider = EthereumNodeProvider(network=ethereum.local)
+    provider._web3 = mock_web3
+    head_numbers = mocker.PropertyMock(side_effect=[5, 5, 9])
+    type(mock_web3.eth).block_number = head_numbers
+
+    def make_block(number: int):
+        return mocker.MagicMock(number=number, hash=HexBytes(number.to_bytes(32, "big")))
+
+    mocker.patch.object(EthereumNodeProvider, "_get_latest_block", return_value=make_block(5))
+    mocker.patch.object(EthereumNodeProvider, "get_block", side_effect=make_block)
+    get_blocks = mocker.patch.object(
+        EthereumNodeProvider,
+        "_request_blocks",
+        side_effect=lambda ids: [make_block(i) for i in ids],
+    )
+    get_logs = mocker.patch.object(
+        EthereumNodeProvider, "get_contract_logs", return_value=iter(["log"])
+    )
+
+    logs = list(provider.poll_logs(stop_block=9, address=ZERO_ADDRESS))
+    assert logs == ["log"]
+    assert get_blocks.call_count == 1
+    get_logs.assert_called_once()
+    log_filter = get_logs.call_args[0][0]
+    assert (log_filter.start_block, log_filter.stop_block) == (6, 9)
+    assert log_filter.addresses == [ZERO_ADDRESS]
+
+
+def test_poll_logs_reorg(mocker, mock_web3, ethereum):
+    provider = EthereumNodeProvider(network=ethereum.sepolia)
+    provider._web3 = mock_web3
+    chain = {number: HexBytes(number.to_bytes(32, "big")) for number in range(102)}
+
+    def get_block(block_id):
+        return {
+            "number": block_id,
+            "hash": chain[block_id],
+            "timestamp": 1,
+            "gasLimit": 1,
+            "gasUsed": 0,
+        }
+
+    def make_batch_request(requests):
+        return [
+            {
+                "result": {
+                    "number": params[0],
+                    "hash": to_hex(chain[int(params[0], 16)]),
+                    "timestamp": "0x1",
+                    "gasLimit": "0x1",
+                    "gasUsed": "0x0",
+                }
+            }
+            for _, params in requests
+        ]
+
+    mock_web3.eth.get_block.side_effect = get_block
+    mock_web3.provider.make_batch_request.side_effect = make_batch_request
+    type(mock_web3.eth).block_number = mocker.PropertyMock(side_effect=[100, 103])
+    mocker.patch.object(
+        EthereumNodeProvider, "_get_latest_block", return_value=mocker.MagicMock(number=100)
+    )
+    get_logs = mocker.patch.object(
+        EthereumNodeProvider, "get_contract_logs", return_value=iter(["log"])
+    )
+
+    # Block 98 is confirmed, so it is cached by number.
+    provider.get_block(100)
+    provider.get_block(98)
+    assert 98 in provider._block_hashes
+
+    # Block 98 changes before the poll checks it again.
+    chain[98] = HexBytes(b"\xff" * 32)
+    logs = list(provider.poll_logs(stop_block=101))
+
+    # The re-org is noticed, so the re-orged block's logs are requested again.
+    assert logs == ["log"]
+    log_filter = get_logs.call_args[0][0]
+    assert (log_filter.start_block, log_filter.stop_block) == (98, 101)
+    assert 98 not in provider._block_hashes
+
+
+def test_poll_logs_uses_subscription(mocker, mock_web3, ethereum):
+    provider = EthereumNodeProvider(network=ethereum.local)
+    provider._web3 = mock_web3
+    type(mock_web3.eth).block_number = mocker.PropertyMock(side_effect=[5, 6])
+    block_hash = f"0x{'ab' * 32}"
+    pushed_logs = [
+        {"blockNumber": "0x7", "blockHash": block_hash, "logIndex": "0x0"},
+        {"blockNumber": "0x7", "blockHash": block_hash, "logIndex": "0x1"},
+    ]
+    subscription = mocker.MagicMock()
+    subscription.subscription_ids = ["heads", "logs"]
+    subscription.receive.side_effect = [
+        ("logs", pushed_logs[0]),
+        ("logs", pushed_logs[1]),
+        ("logs", {**pushed_logs[1], "removed": True}),
+        ("heads", {"number": "0x8"}),
+    ]
+    latest = mocker.MagicMock(number=5, hash=HexBytes(5))
+    mocker.patch.object(EthereumNodeProvider, "_subscribe", return_value=subscription)
+    mocker.patch.object(EthereumNodeProvider, "_get_latest_block", return_value=latest)
+    mocker.patch.object(EthereumNodeProvider, "get_block", return_value=latest)
+    get_logs = mocker.patch.object(
+        EthereumNodeProvider, "get_contract_logs", return_value=iter(["requested"])
+    )
+    mocker.patch.object(type(ethereum), "decode_logs", side_effect=lambda logs, *_: iter(logs))
+
+    logs = list(provider.poll_logs(stop_block=8))
+    # Logs from before subscribing are requested, the rest are pushed
+    # (minus the ones removed by re-orgs).
+    assert logs == ["requested", pushed_logs[0]]
+    log_filter = get_logs.call_args[0][0]
+    assert (log_filter.start_block, log_filter.stop_block) == (6, 6)
+    subscription.close.assert_called_once()
+
+
 def test_supports_tracing(eth_tester_provider):
     assert not eth_tester_provider.supports_tracing
 
@@ -412,6 +731,27 @@ def test_prepare_transaction_with_max_gas(tx_type, eth_tester_provider, ethereum
     assert actual.max_fee is not None
 
 
+def test_prepare_transaction_fee_data_is_cached(mocker, mock_web3, ethereum):
+    provider = EthereumNodeProvider(network=ethereum.sepolia)
+    provider._web3 = mock_web3
+    base_fee = mocker.patch.object(
+        EthereumNodeProvider, "base_fee", new_callable=mocker.PropertyMock, return_value=100
+    )
+    priority_fee = mocker.patch.object(
+        EthereumNodeProvider, "priority_fee", new_callable=mocker.PropertyMock, return_value=2
+    )
+
+    expected = {"priority_fee": 2, "base_fee": 100}
+    assert provider._get_fee_data("priority_fee", "base_fee") == expected
+    # Re-used for transactions prepared in the same block time.
+    pool = mocker.patch("ape_ethereum.provider.ThreadPoolExecutor")
+    assert provider._get_fee_data("priority_fee", "base_fee") == expected
+    assert base_fee.call_count == 1
+    assert priority_fee.call_count == 1
+    # No threads are needed when the values are cached.
+    assert pool.call_count == 0
+
+
 def test_no_comma_in_rpc_url():
     test_url = "URI: http://127.0.0.1:8545,"
     sanitised_url = _sanitize_web3_url(test_url)
@@ -575,6 +915,75 @@ def test_make_request_rate_limiting(mocker, ethereum, mock_web3):
     assert result == {"success": True}
 
 
+def test_make_requests(eth_tester_provider):
+    # NOTE: eth-tester does not support batching so this uses the sequential fallback.
+    chain_id, block_number = eth_tester_provider.make_requests(
+        [("eth_chainId", []), ("eth_blockNumber", None)]
+    )
+    assert to_int(chain_id) == eth_tester_provider.chain_id
+    assert to_int(block_number) == eth_tester_provider.web3.eth.block_number
+
+
+def test_make_requests_batch(mock_web3, ethereum):
+    provider = EthereumNodeProvider(network=ethereum.local)
+    provider._web3 = mock_web3
+    provider.max_batch_size = 2
+    mock_web3.provider.make_batch_request.side_effect = lambda reqs: [
+        {"error": {"message": "Method not found"}}
+        if rpc == "ape_thisDoesNotExist"
+        else {"jsonrpc": "2.0", "result": f"{rpc}_result"}
+        for rpc, _ in reqs
+    ]
+    mock_web3.provider.make_request.side_effect = lambda rpc, params: {"result": f"{rpc}_result"}
+    requests = [
+        ("eth_chainId", []),
+        ("ape_thisDoesNotExist", []),
+        ("eth_blockNumber", []),
+    ]
+
+    results = provider.make_requests(requests, raise_on_error=False)
+    assert results[0] == "eth_chainId_result"
+    assert isinstance(results[1], APINotImplementedError)
+    assert results[2] == "eth_blockNumber_result"
+    # Split by max batch size; the last batch only has 1 request.
+    assert mock_web3.provider.make_batch_request.call_count == 1
+    assert mock_web3.provider.make_request.call_count == 1
+
+    with pytest.raises(APINotImplementedError):
+        provider.make_requests(requests)
+
+
+def test_make_requests_batch_not_supported(mock_web3, ethereum):
+    provider = EthereumNodeProvider(network=ethereum.local)
+    provider._web3 = mock_web3
+    mock_web3.provider.make_batch_request.return_value = {
+        "jsonrpc": "2.0",
+        "error": {"code": -32600, "message": "batch requests are not supported"},
+    }
+    mock_web3.provider.make_request.side_effect = lambda rpc, params: {"result": rpc}
+
+    results = provider.make_requests([("eth_chainId", []), ("eth_blockNumber", [])])
+    assert results == ["eth_chainId", "eth_blockNumber"]
+    assert provider._supports_batch_requests is False
+
+    # Does not try batching again.
+    provider.make_requests([("eth_chainId", []), ("eth_blockNumber", [])])
+    assert mock_web3.provider.make_batch_request.call_count == 1
+
+
+def test_batch_requests(eth_tester_provider, owner):
+    with eth_tester_provider.batch_requests() as batch:
+        balance = batch.make_request("eth_getBalance", [owner.address, "latest"])
+        missing = batch.make_request("ape_thisDoesNotExist")
+        assert len(batch) == 2
+        assert not balance.done
+
+    assert balance.done
+    assert to_int(balance.result()) == owner.balance
+    with pytest.raises(APINotImplementedError):
+        missing.result()
+
+
 def test_base_fee(eth_tester_provider):
     actual = eth_tester_provider.base_fee
     assert actual >= eth_tester_provider.get_block("pending").base_fee
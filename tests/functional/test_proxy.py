@@ -115,3 +115,35 @@ def test_provider_not_supports_get_storage(
 
     assert actual is None  # Because of provider.
     assert my_provider.times_get_storage_was_called == 1
+
+
+def test_provider_batches_get_storage(
+    project, owner, vyper_contract_instance, ethereum, chain, mocker
+):
+    """
+    Providers that do not change how storage is read get all the
+    proxy slots in a single batch of requests.
+    """
+    beacon_instance = owner.deploy(project.beacon, vyper_contract_instance.address)
+    contract_instance = owner.deploy(project.BeaconProxy, beacon_instance.address, HexBytes(""))
+
+    # Ensure not already cached.
+    if contract_instance.address in chain.contracts.proxy_infos:
+        del chain.contracts.proxy_infos[contract_instance.address]
+
+    make_requests_spy = mocker.spy(LocalProvider, "make_requests")
+    ethereum.get_proxy_info(contract_instance.address)
+
+    storage_requests = [
+        call.args[1]
+        for call in make_requests_spy.call_args_list
+        if any(rpc == "eth_getStorageAt" for rpc, _ in call.args[1])
+    ]
+    assert len(storage_requests) == 1
+    assert len(storage_requests[0]) > 1
+
+
+def test_get_proxy_infos(ethereum, minimal_proxy, vyper_contract_instance):
+    actual = ethereum.get_proxy_infos([minimal_proxy.address, vyper_contract_instance.address])
+    assert actual[minimal_proxy.address].type == ProxyType.Minimal
+    assert actual[vyper_contract_instance.address] is None
@@ -3,8 +3,10 @@ import time
 import pandas as pd
 import pytest
 
-from ape.api.query import validate_and_expand_columns
+from ape.api.query import BlockQuery, QueryAPI, concat_columns, validate_and_expand_columns
+from ape.managers.query import CacheWriter
 from ape.utils import DEFAULT_TEST_CHAIN_ID, BaseInterfaceModel
+from ape_test import LocalProvider
 
 
 def test_basic_query(chain, eth_tester_provider):
@@ -70,6 +72,21 @@ def test_transaction_contract_event_query_starts_query_at_deploy_tx(
     assert df_events.event_name[0] == "FooHappened"
 
 
+def test_transaction_contract_event_query_as_columns(contract_instance, owner, eth_tester_provider):
+    receipt = contract_instance.fooAndBar(sender=owner)
+    df_events = contract_instance.FooHappened.query("*", start_block=-1, as_columns=True)
+    assert isinstance(df_events, pd.DataFrame)
+    assert df_events.foo[0] == 0
+    assert df_events.block_number[0] == receipt.block_number
+    assert df_events.contract_address[0] == contract_instance.address
+
+    df_events = contract_instance.FooHappened.query("block_number,foo", as_columns=True)
+    assert list(df_events.columns) == ["block_number", "foo"]
+
+    with pytest.raises(ValueError, match="No columns"):
+        contract_instance.FooHappened.query(as_columns=True)
+
+
 class Model(BaseInterfaceModel):
     number: int
     timestamp: int
@@ -101,3 +118,265 @@ def test_specify_engine(chain, eth_tester_provider):
     actual = chain.blocks.query("*", engine_to_use="__default__")
     expected = offset + 3
     assert len(actual) == expected
+
+
+def test_block_query_pages(mocker, chain, eth_tester_provider):
+    chain.mine(5)
+    get_blocks_spy = mocker.spy(LocalProvider, "get_blocks")
+    eth_tester_provider.max_batch_size = 2
+    try:
+        df = chain.blocks.query("number", start_block=0, stop_block=4)
+    finally:
+        eth_tester_provider.max_batch_size = 100
+
+    assert list(df["number"].values) == [0, 1, 2, 3, 4]
+    # 5 blocks in pages of 2 blocks.
+    assert get_blocks_spy.call_count == 3
+
+
+@pytest.fixture
+def cache(mocker, tmp_path, chain, eth_tester_provider):
+    from ape_cache import models
+    from ape_cache.query import CacheQueryProvider
+
+    cache = chain.query_manager.engines["cache"]
+    engine = cache._create_engine(tmp_path / "cache.db")
+    models.Base.metadata.create_all(bind=engine)
+    # NOTE: The local network is never cached, so use a temporary database.
+    mocker.patch.object(
+        CacheQueryProvider, "database_engine", new_callable=mocker.PropertyMock
+    ).return_value = engine
+    yield cache
+    engine.dispose()
+
+
+def test_cache_partial_block_query(chain, cache, eth_tester_provider, mocker):
+    chain.mine(20)
+    start_block = chain.blocks.height - 19
+    stop_block = start_block + 19
+    expected = list(range(start_block, stop_block + 1))
+    eth_tester_provider.max_batch_size = 2
+    try:
+        # Nothing is cached yet, so the provider fetches (and caches) the blocks.
+        query = BlockQuery(columns=["number"], start_block=start_block, stop_block=stop_block - 4)
+        assert cache.estimate_query(query) is None
+        df = chain.blocks.query("number", start_block=start_block, stop_block=stop_block - 4)
+        assert list(df["number"].values) == expected[:-4]
+        chain.query_manager.cache_writer.flush()
+
+        # Only the missing blocks are fetched from the provider.
+        get_blocks_spy = mocker.spy(LocalProvider, "get_blocks")
+        df = chain.blocks.query("number", "hash", start_block=start_block, stop_block=stop_block)
+
+    finally:
+        eth_tester_provider.max_batch_size = 100
+
+    assert list(df["number"].values) == expected
+    assert list(df["hash"].values) == [chain.blocks[n].hash for n in expected]
+    fetched = [n for call in get_blocks_spy.call_args_list for n in call.args[1]]
+    assert fetched == expected[-4:]
+    chain.query_manager.cache_writer.flush()
+    with cache.database_engine.connect() as conn:
+        covered = cache._get_covered_ranges(conn, "blocks", [""], start_block, stop_block)
+
+    assert covered == [(start_block, stop_block)]
+
+
+def test_cache_update_commits_each_chunk(chain, cache, eth_tester_provider, mocker):
+    from sqlalchemy import select
+
+    from ape_cache.models import Blocks
+
+    chain.mine(5)
+    start_block = chain.blocks.height - 4
+    blocks = [chain.blocks[n] for n in range(start_block, start_block + 5)]
+    query = BlockQuery(columns=["number"], start_block=start_block, stop_block=start_block + 4)
+    mocker.patch.object(type(cache), "cache_write_chunk_size", 2)
+
+    def get_cached_numbers() -> list[int]:
+        with cache.database_engine.connect() as conn:
+            return list(conn.execute(select(Blocks.number)).scalars())
+
+    def results():
+        yield from blocks[:2]
+        # The first chunk is committed before the rest of the results arrive
+        # (minus its last block, as a block's rows are written together).
+        assert get_cached_numbers() == [start_block]
+        yield from blocks[2:]
+
+    cache.update_cache(query, results())
+    assert sorted(get_cached_numbers()) == list(range(start_block, start_block + 5))
+
+
+def test_cache_block_query_columns(chain, cache, eth_tester_provider, mocker):
+    from ape_cache.query import CacheQueryProvider
+
+    chain.mine(5)
+    start_block = chain.blocks.height - 4
+    df = chain.blocks.query("number", "hash", start_block=start_block)
+    chain.query_manager.cache_writer.flush()
+
+    # The cached columns are read directly, without decoding the blocks.
+    get_cached_blocks_spy = mocker.spy(CacheQueryProvider, "_get_cached_blocks")
+    cached_df = chain.blocks.query("number", "hash", start_block=start_block, engine_to_use="cache")
+    assert get_cached_blocks_spy.call_count == 0
+    assert list(cached_df["number"].values) == list(df["number"].values)
+    assert list(cached_df["hash"].values) == list(df["hash"].values)
+
+
+def test_cache_migrates_contract_events_without_selector(cache, tmp_path):
+    from sqlalchemy import inspect, text
+
+    from ape_cache import models
+
+    engine = cache._create_engine(tmp_path / "old.db")
+    try:
+        with engine.begin() as conn:
+            # The table, as made by older versions (without an event selector).
+            conn.execute(
+                text(
+                    "CREATE TABLE contract_events (id INTEGER PRIMARY KEY, "
+                    "event_name VARCHAR NOT NULL, contract_address BLOB NOT NULL, "
+                    "event_arguments JSON, transaction_hash BLOB NOT NULL, "
+                    "block_number INTEGER NOT NULL, block_hash BLOB NOT NULL, "
+                    "log_index INTEGER NOT NULL, transaction_index INTEGER NOT NULL)"
+                )
+            )
+            conn.execute(
+                text(
+                    "INSERT INTO contract_events VALUES "
+                    "(1, 'FooHappened', x'00', '{}', x'00', 1, x'00', 0, 0)"
+                )
+            )
+
+        models.Base.metadata.create_all(bind=engine)
+        cache._migrate_database(engine)
+        columns = {c["name"] for c in inspect(engine).get_columns("contract_events")}
+        with engine.connect() as conn:
+            count = conn.execute(text("SELECT COUNT(*) FROM contract_events")).scalar()
+
+        # Running it again is a no-op.
+        cache._migrate_database(engine)
+
+    finally:
+        engine.dispose()
+
+    assert "event_selector" in columns
+    # Events stored without their selector are dropped, to be re-fetched.
+    assert count == 0
+
+
+def test_cache_parquet_export_import(chain, cache, eth_tester_provider, mocker, tmp_path):
+    pytest.importorskip("pyarrow")
+    from ape_cache import models
+    from ape_cache.parquet import ParquetQueryProvider, export_parquet, import_parquet
+
+    chain.mine(5)
+    df = chain.blocks.query("number", "hash")
+    chain.query_manager.cache_writer.flush()
+    directory = tmp_path / "export"
+    with cache.database_engine.connect() as conn:
+        counts = export_parquet(conn, directory, partition_size=2)
+
+    assert counts["blocks"] == len(df)
+    assert len(list((directory / "blocks").glob("*.parquet"))) == -(-len(df) // 2)
+
+    # Query the files, only reading the needed columns and partitions.
+    mocker.patch.object(
+        ParquetQueryProvider, "directory", new_callable=mocker.PropertyMock
+    ).return_value = directory
+    parquet_df = chain.blocks.query("number", "hash", engine_to_use="cache-parquet")
+    assert list(parquet_df["number"].values) == list(df["number"].values)
+    assert list(parquet_df["hash"].values) == list(df["hash"].values)
+
+    # Import into another database.
+    engine = cache._create_engine(tmp_path / "other.db")
+    models.Base.metadata.create_all(bind=engine)
+    try:
+        with engine.begin() as conn:
+            import_parquet(cache, conn, directory)
+
+        with engine.connect() as conn:
+            covered = cache._get_covered_ranges(conn, "blocks", [""], 0, len(df) - 1)
+
+    finally:
+        engine.dispose()
+
+    assert covered == [(0, len(df) - 1)]
+
+
+def test_query_columns(chain, eth_tester_provider):
+    chain.mine(3)
+    query = BlockQuery(columns=["number", "hash"], start_block=0, stop_block=3)
+    batches = list(chain.query_manager.query_columns(query))
+    assert all(set(batch) == {"number", "hash"} for batch in batches)
+    columns = concat_columns(batches, query.columns)
+    assert columns["number"] == [0, 1, 2, 3]
+    assert columns["hash"] == [chain.blocks[n].hash for n in range(4)]
+
+
+class CachingEngine(QueryAPI):
+    def __init__(self):
+        self.cached: list = []
+
+    def estimate_query(self, query):
+        return None
+
+    def perform_query(self, query):
+        raise NotImplementedError()
+
+    def update_cache(self, query, result):
+        cached = []
+        for item in result:
+            time.sleep(0.01)
+            cached.append(item)
+
+        self.cached = cached
+
+
+def test_cache_writer():
+    writer = CacheWriter(max_queue_size=2)
+    engine = CachingEngine()
+    query = BlockQuery(columns=["number"], start_block=0, stop_block=9)
+
+    # The results pass through unchanged and are written in the background.
+    assert list(writer.write([engine], query, iter(range(10)))) == list(range(10))
+    writer.flush()
+    assert engine.cached == list(range(10))
+    assert writer.results_written == writer.results_queued == 10
+    assert writer.lag == 0
+    # The consumer had to wait for the (slow) writer.
+    assert writer.blocked_time > 0
+    assert writer.max_lag >= 2
+
+
+def test_cache_writers_flushed_at_exit(mocker):
+    from ape.managers.query import _flush_cache_writers
+
+    writer = CacheWriter()
+    flush = mocker.patch.object(writer, "flush")
+    _flush_cache_writers()
+    flush.assert_called_once_with()
+
+
+def test_cache_writer_partially_consumed():
+    writer = CacheWriter()
+    engine = CachingEngine()
+    query = BlockQuery(columns=["number"], start_block=0, stop_block=9)
+
+    results = writer.write([engine], query, iter(range(10)))
+    assert next(results) == 0
+    results.close()
+    writer.flush()
+
+    # The results are incomplete, so they are not cached.
+    assert engine.cached == []
+
+
+def test_contract_method_query(contract_instance, owner, eth_tester_provider):
+    start_block = contract_instance.setNumber(7, sender=owner).block_number
+    stop_block = contract_instance.setNumber(8, sender=owner).block_number
+    df = contract_instance.myNumber.query(start_block=start_block, stop_block=stop_block)
+    assert list(df.index) == list(range(start_block, stop_block + 1))
+    assert df["value"].iloc[0] == 7
+    assert df["value"].iloc[-1] == 8
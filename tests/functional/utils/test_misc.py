@@ -8,6 +8,7 @@ from web3.types import Wei
 from ape.exceptions import APINotImplementedError
 from ape.utils.misc import (
     ZERO_ADDRESS,
+    LRUCache,
     _dict_overlay,
     add_padding_to_strings,
     extract_nested_value,
@@ -175,3 +176,20 @@ def test_log_instead_of_fail(ape_caplog):
 
     my_method()
     assert "Oh no!" in ape_caplog.head
+
+
+def test_lru_cache():
+    cache: LRUCache[str, int] = LRUCache(maxsize=2)
+    cache["a"] = 1
+    cache["b"] = 2
+    assert cache["a"] == 1  # Uses "a", so "b" is now the least-recently used.
+    cache["c"] = 3
+    assert "b" not in cache
+    assert list(cache) == ["a", "c"]
+    assert cache.get("b", 0) == 0
+    assert cache.stats == {"size": 2, "hits": 1, "misses": 1, "evictions": 1}
+
+    unbounded: LRUCache[str, int] = LRUCache(maxsize=None)
+    unbounded.update({str(i): i for i in range(5)})
+    assert len(unbounded) == 5
+    assert unbounded.evictions == 0
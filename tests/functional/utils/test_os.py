@@ -4,6 +4,8 @@ import pytest
 
 from ape.utils.misc import SOURCE_EXCLUDE_PATTERNS
 from ape.utils.os import (
+    CacheDatabase,
+    CacheDirectory,
     clean_path,
     create_tempdir,
     get_all_files_in_directory,
@@ -210,3 +212,23 @@ def test_clean_path_not_relative_to_home():
     path = Path(name)
     actual = clean_path(path)
     assert actual == name
+
+
+def test_cache_database(tmp_path):
+    legacy = CacheDirectory(tmp_path / "contract_types")
+    legacy["0x123"] = {"name": "Legacy"}
+    database = CacheDatabase(tmp_path / "cache.db", "contract_types")
+
+    database.import_directory(legacy)
+    assert not (tmp_path / "contract_types").exists()
+    assert database["0x123"] == {"name": "Legacy"}
+
+    database.put_many({"0x456": {"name": "A"}, "0x789": {"name": "B"}})
+    actual = database.get_many(["0x456", "0x789", "0xabc"])
+    assert actual == {"0x456": {"name": "A"}, "0x789": {"name": "B"}}
+
+    # Kinds share the file but not the keys.
+    assert CacheDatabase(tmp_path / "cache.db", "proxy_info")["0x456"] == {}
+
+    del database["0x456"]
+    assert database["0x456"] == {}